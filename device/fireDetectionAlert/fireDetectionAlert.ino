@@ -6,6 +6,14 @@ const char* ssid = "Galaxy A516A59";
 const char* password = "20111996";
 const char* mqtt_server = "broker.hivemq.com";
 
+// Alerts for this device's zone + broadcast topic (e.g. buzzer OFF)
+const char* alertTopic = "fire/alert";
+const char* zoneTopic  = "fire/alert/zone1";
+
+// Compact binary payload: event, version, count, confidence, timestamp
+const unsigned int binaryAlertLength = 12;
+const byte binaryAlertVersion = 1;
+
 WiFiClient espClient;
 PubSubClient client(espClient);
 
@@ -56,7 +64,8 @@ void setup() {
     delay(500);
   }
 
-  client.subscribe("fire/alert");
+  client.subscribe(alertTopic);
+  client.subscribe(zoneTopic);
 
   greenLed.turnON();
   redLed.turnOFF();
@@ -84,24 +93,39 @@ void loop() {
 }
 
 // -------------------- MQTT CALLBACK --------------------
+void fireOn() {
+  fireActive = true;
+  redLed.turnON();
+  greenLed.turnOFF();
+  Serial.println("Fire detected!");
+}
+
+void fireOff() {
+  fireActive = false;
+  ledcWrite(buzzerChannel, 0); // ensure buzzer OFF
+  buzzerOn = false;
+  redLed.turnOFF();
+  greenLed.turnON();
+  Serial.println("Alarm off");
+}
+
 void callback(char* topic, byte* payload, unsigned int length) {
+  // Binary payload: no string building needed
+  if (length == binaryAlertLength && payload[1] == binaryAlertVersion) {
+    if (payload[0] == 'F') fireOn();
+    else if (payload[0] == 'O') fireOff();
+    return;
+  }
+
   String msg;
   for (int i = 0; i < length; i++) msg += (char)payload[i];
 
   Serial.println(msg);
 
   if (msg.indexOf("FIRE") >= 0) {
-    fireActive = true;
-    redLed.turnON();
-    greenLed.turnOFF();
-    Serial.println("Fire detected!");
+    fireOn();
   } 
   else if (msg.indexOf("OFF") >= 0) {
-    fireActive = false;
-    ledcWrite(buzzerChannel, 0); // ensure buzzer OFF
-    buzzerOn = false;
-    redLed.turnOFF();
-    greenLed.turnON();
-    Serial.println("Alarm off");
+    fireOff();
   }
 }
@@ -0,0 +1,245 @@
+"""
+Offline archive scanner.
+
+Scans recorded footage with the same FireDetector logic as the live
+pipeline, without real-time playback:
+- Each file is split into time segments
+- Each segment starts warmup seconds early so the MOG2 background model
+  and temporal buffers converge before its own range begins
+- Segments run across a process pool (one FireDetector per segment)
+- Detections are merged into one timeline report per file
+
+Timestamps are source timestamps (see VideoInput timestamp_mode), so a
+segment's decisions match a replay of the whole file once warm-up has
+converged.
+
+Run from src/:
+    python -m archive.archive_scanner footage/*.mp4 --output report.json
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from video_input.video_stream import VideoInput
+from detection.fire_detector import FireDetector
+from common.params import parse_param
+
+
+# -------------------------------------------------
+# WORKER (ONE SEGMENT)
+# -------------------------------------------------
+def scan_segment(path, start_s, end_s, warmup_s, detector_kwargs):
+    """
+    Runs inside a pool process.
+    Returns fire events (source seconds) that fall inside [start_s, end_s).
+    """
+    video_input = VideoInput("Local Video", path, timestamp_mode="source")
+    video_input.start()
+
+    detector = FireDetector(**detector_kwargs)
+    fps = video_input.source_fps
+    frame_interval = 1.0 / fps
+
+    warm_start = max(0.0, start_s - warmup_s)
+    first_frame = int(round(warm_start * fps))
+    if first_frame:
+        video_input.seek(first_frame)
+
+    events = []
+    current = None
+    frames = 0
+    started = time.perf_counter()
+
+    try:
+        while True:
+            frame, timestamp = video_input.read()
+            if frame is None or timestamp >= end_s:
+                break
+
+            fire, confidence, boxes = detector.process_frame(frame, timestamp)
+
+            # Warm-up frames only feed the models
+            if timestamp < start_s:
+                continue
+
+            frames += 1
+
+            if fire:
+                if current is None:
+                    current = {
+                        "start_s": timestamp,
+                        "end_s": timestamp,
+                        "max_confidence": 0.0,
+                        "max_boxes": 0
+                    }
+                    events.append(current)
+
+                current["end_s"] = timestamp + frame_interval
+                current["max_confidence"] = max(current["max_confidence"], float(confidence))
+                current["max_boxes"] = max(current["max_boxes"], len(boxes))
+            else:
+                current = None
+    finally:
+        video_input.stop()
+
+    return {
+        "start_s": start_s,
+        "frames": frames,
+        "fps": fps,
+        "elapsed_s": time.perf_counter() - started,
+        "events": events
+    }
+
+
+# -------------------------------------------------
+# PLANNING / MERGING
+# -------------------------------------------------
+def plan_segments(path, segment_s):
+    """
+    Returns (duration_s, [(start_s, end_s), ...]) for one file.
+    The last segment is open-ended so nothing past the reported frame
+    count is lost.
+    """
+    video_input = VideoInput("Local Video", path, timestamp_mode="source")
+    video_input.start()
+    try:
+        duration = video_input.frame_count() / video_input.source_fps
+    finally:
+        video_input.stop()
+
+    count = max(1, math.ceil(duration / segment_s)) if duration else 1
+    segments = [(i * segment_s, (i + 1) * segment_s) for i in range(count)]
+    segments[-1] = (segments[-1][0], math.inf)
+    return duration, segments
+
+
+def merge_events(segment_results):
+    """
+    Joins events that continue across a segment boundary.
+    """
+    merged = []
+
+    for result in sorted(segment_results, key=lambda r: r["start_s"]):
+        gap = 1.5 / result["fps"]
+
+        for event in result["events"]:
+            if merged and event["start_s"] - merged[-1]["end_s"] <= gap:
+                last = merged[-1]
+                last["end_s"] = max(last["end_s"], event["end_s"])
+                last["max_confidence"] = max(last["max_confidence"], event["max_confidence"])
+                last["max_boxes"] = max(last["max_boxes"], event["max_boxes"])
+            else:
+                merged.append(dict(event))
+
+    for event in merged:
+        event["duration_s"] = round(event["end_s"] - event["start_s"], 3)
+        event["start_s"] = round(event["start_s"], 3)
+        event["end_s"] = round(event["end_s"], 3)
+        event["max_confidence"] = round(event["max_confidence"], 4)
+
+    return merged
+
+
+# -------------------------------------------------
+# SCAN
+# -------------------------------------------------
+def scan_files(paths, segment_s=600, warmup_s=20, workers=None, detector_kwargs=None):
+    detector_kwargs = detector_kwargs or {}
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    plans = {}
+    for path in paths:
+        plans[path] = plan_segments(path, segment_s)
+
+    results = {path: [] for path in paths}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for path, (_, segments) in plans.items():
+            for start_s, end_s in segments:
+                future = pool.submit(scan_segment, path, start_s, end_s, warmup_s, detector_kwargs)
+                futures[future] = path
+
+        done = 0
+        for future in as_completed(futures):
+            path = futures[future]
+            results[path].append(future.result())
+            done += 1
+            print(f"[{done}/{len(futures)}] {os.path.basename(path)}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - started
+
+    files = []
+    for path in paths:
+        duration, segments = plans[path]
+        segment_results = results[path]
+        frames = sum(r["frames"] for r in segment_results)
+        busy = sum(r["elapsed_s"] for r in segment_results)
+
+        files.append({
+            "file": path,
+            "duration_s": round(duration, 3),
+            "segments": len(segments),
+            "frames": frames,
+            "single_core_fps": round(frames / busy, 2) if busy else None,
+            "events": merge_events(segment_results)
+        })
+
+    total_frames = sum(f["frames"] for f in files)
+    return {
+        "config": {
+            "segment_s": segment_s,
+            "warmup_s": warmup_s,
+            "workers": workers,
+            "detector": detector_kwargs
+        },
+        "elapsed_s": round(elapsed, 3),
+        "fps": round(total_frames / elapsed, 2) if elapsed else None,
+        "files": files
+    }
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline fire scan of recorded footage")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--segment", type=float, default=600,
+                        help="segment length in seconds")
+    parser.add_argument("--warmup", type=float, default=20,
+                        help="seconds decoded before each segment to converge the models")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="pool processes (default: CPU count)")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=VALUE",
+                        help="FireDetector kwarg, JSON value")
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    report = scan_files(
+        args.files,
+        segment_s=args.segment,
+        warmup_s=args.warmup,
+        workers=args.workers,
+        detector_kwargs=dict(parse_param(p) for p in args.param)
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
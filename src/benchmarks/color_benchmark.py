@@ -0,0 +1,117 @@
+"""
+Color segmentation benchmark: HSV (cvtColor + inRange) vs ColorLUT.
+
+For each LUT quantization level, reports table build time and size,
+per-frame p50/p95 for both paths, and how far the LUT mask is from the
+HSV mask (fraction of differing pixels; quant_bits=8 must be exact).
+
+Run from src/:
+    python -m benchmarks.color_benchmark
+    python -m benchmarks.color_benchmark --bits 5 6 8 --clip footage.mp4
+"""
+import argparse
+import json
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.synthetic import SCENARIOS, generate_clip
+from detection.color_lut import ColorLUT
+
+
+def _hsv_mask(frame, lower, upper):
+    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    return cv2.inRange(hsv, lower, upper)
+
+
+def _load_frames(args):
+    frames = []
+    for scenario in SCENARIOS:
+        frames.extend(f for f, _ in generate_clip(scenario, seed=0, frames=args.frames))
+
+    for path in args.clip:
+        cap = cv2.VideoCapture(path)
+        count = 0
+        while count < args.frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(cv2.resize(frame, (640, 480)))
+            count += 1
+        cap.release()
+
+    return frames
+
+
+def _ms(samples):
+    ms = np.asarray(samples) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(ms, 50)), 4),
+        "p95_ms": round(float(np.percentile(ms, 95)), 4)
+    }
+
+
+def run(frames, lower, upper, bits_list):
+    lower = np.array(lower)
+    upper = np.array(upper)
+
+    hsv_times = []
+    references = []
+    for frame in frames:
+        started = time.perf_counter()
+        references.append(_hsv_mask(frame, lower, upper))
+        hsv_times.append(time.perf_counter() - started)
+
+    report = {"frames": len(frames), "hsv": _ms(hsv_times), "lut": {}}
+
+    for bits in bits_list:
+        started = time.perf_counter()
+        lut = ColorLUT(lower, upper, quant_bits=bits)
+        build = time.perf_counter() - started
+
+        lut_times = []
+        mismatched = 0
+        worst = 0.0
+        for frame, reference in zip(frames, references):
+            started = time.perf_counter()
+            mask = lut.classify(frame)
+            lut_times.append(time.perf_counter() - started)
+
+            diff = np.count_nonzero(mask != reference)
+            mismatched += diff
+            worst = max(worst, diff / reference.size)
+
+        report["lut"][bits] = {
+            "build_ms": round(build * 1000, 2),
+            "table_kb": round(lut.table.nbytes / 1024, 1),
+            **_ms(lut_times),
+            "mismatch_fraction": mismatched / (len(frames) * references[0].size),
+            "worst_frame_mismatch": worst
+        }
+
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HSV vs LUT color segmentation")
+    parser.add_argument("--bits", type=int, nargs="+", default=[5, 6, 8])
+    parser.add_argument("--frames", type=int, default=100,
+                        help="frames per synthetic scenario / recorded clip")
+    parser.add_argument("--clip", action="append", default=[])
+    parser.add_argument("--hsv-lower", type=int, nargs=3, default=[0, 120, 70])
+    parser.add_argument("--hsv-upper", type=int, nargs=3, default=[35, 255, 255])
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = run(_load_frames(args), args.hsv_lower, args.hsv_upper, args.bits)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Reproducible FireDetector benchmark.
+
+Runs synthetic clips (procedural, seeded) and/or recorded clips through
+FireDetector with deterministic timestamps (frame_index / fps) and
+reports throughput, per-stage latency percentiles, frame-level
+precision/recall and time-to-alert as JSON.
+
+Run from src/:
+    python -m benchmarks.fire_benchmark --output run.json
+    python -m benchmarks.fire_benchmark --param min_fire_area=800 --compare run.json
+    python -m benchmarks.fire_benchmark --clip footage.mp4 --no-synthetic
+
+Recorded clips may have a <clip>.labels.json sidecar with
+{"fire": [[start_s, end_s], ...]}; without it only speed is reported.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.synthetic import SCENARIOS, generate_clip
+from common.params import parse_param
+from detection.fire_detector import FireDetector
+
+
+class SampleRecorder:
+    """
+    Keeps every stage timing (same observe() signature as PipelineMetrics)
+    so exact percentiles can be reported.
+    """
+
+    def __init__(self):
+        self.samples = {}
+
+    def observe(self, camera, stage, started):
+        now = time.perf_counter()
+        self.samples.setdefault(stage, []).append(now - started)
+        return now
+
+    def percentiles(self):
+        report = {}
+        for stage, values in sorted(self.samples.items()):
+            ms = np.asarray(values) * 1000
+            report[stage] = {
+                "p50_ms": round(float(np.percentile(ms, 50)), 4),
+                "p95_ms": round(float(np.percentile(ms, 95)), 4),
+                "p99_ms": round(float(np.percentile(ms, 99)), 4)
+            }
+        return report
+
+
+# -------------------------------------------------
+# CLIP SOURCES
+# -------------------------------------------------
+def _recorded_clip(path, fps_override=None):
+    """
+    Yields (frame, label) for a recorded clip; label is None when the
+    clip has no labels sidecar. Returns fps via the first element.
+    """
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Failed to open clip: {path}")
+
+    fps = fps_override or cap.get(cv2.CAP_PROP_FPS) or 25.0
+
+    intervals = None
+    labels_path = path + ".labels.json"
+    if os.path.exists(labels_path):
+        with open(labels_path, "r", encoding="utf-8") as f:
+            intervals = json.load(f).get("fire", [])
+
+    def frames():
+        index = 0
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame = cv2.resize(frame, (640, 480))
+
+            label = None
+            if intervals is not None:
+                t = index / fps
+                label = any(start <= t <= end for start, end in intervals)
+
+            yield frame, label
+            index += 1
+        cap.release()
+
+    return fps, frames()
+
+
+# -------------------------------------------------
+# RUN ONE CLIP
+# -------------------------------------------------
+def run_clip(name, frames, fps, detector_kwargs):
+    detector = FireDetector(**detector_kwargs)
+    recorder = SampleRecorder()
+    detector.metrics = recorder
+
+    tp = fp = fn = tn = 0
+    labelled = False
+    first_fire_label = None
+    first_alert = None
+    n = 0
+    busy = 0.0
+
+    for index, (frame, label) in enumerate(frames):
+        timestamp = index / fps  # deterministic, independent of speed
+
+        started = time.perf_counter()
+        fire, _, _ = detector.process_frame(frame, timestamp)
+        busy += time.perf_counter() - started
+        n += 1
+
+        if fire and first_alert is None:
+            first_alert = timestamp
+
+        if label is None:
+            continue
+
+        labelled = True
+        if label and first_fire_label is None:
+            first_fire_label = timestamp
+
+        if fire and label:
+            tp += 1
+        elif fire:
+            fp += 1
+        elif label:
+            fn += 1
+        else:
+            tn += 1
+
+    result = {
+        "clip": name,
+        "frames": n,
+        "fps": round(n / busy, 2) if busy else None,
+        "latency": recorder.percentiles(),
+        "alerted": first_alert is not None
+    }
+
+    if labelled:
+        result.update({
+            "precision": round(tp / (tp + fp), 4) if tp + fp else None,
+            "recall": round(tp / (tp + fn), 4) if tp + fn else None,
+            "false_positive_frames": fp,
+            "time_to_alert_s": (
+                round(first_alert - first_fire_label, 3)
+                if first_alert is not None and first_fire_label is not None
+                and first_alert >= first_fire_label else None
+            )
+        })
+
+    return result
+
+
+# -------------------------------------------------
+# AGGREGATE / COMPARE
+# -------------------------------------------------
+def summarize(results):
+    fire_clips = [r for r in results if "recall" in r and r["recall"] is not None]
+    clean_clips = [r for r in results if "recall" in r and r["recall"] is None]
+    speeds = [r["fps"] for r in results if r["fps"]]
+    alerts = [r["time_to_alert_s"] for r in fire_clips if r.get("time_to_alert_s") is not None]
+
+    return {
+        "mean_fps": round(float(np.mean(speeds)), 2) if speeds else None,
+        "mean_recall": round(float(np.mean([r["recall"] for r in fire_clips])), 4) if fire_clips else None,
+        "fire_clips_alerted": sum(r["alerted"] for r in fire_clips),
+        "fire_clips": len(fire_clips),
+        "false_alarm_clips": sum(r["alerted"] for r in clean_clips),
+        "clean_clips": len(clean_clips),
+        "mean_time_to_alert_s": round(float(np.mean(alerts)), 3) if alerts else None
+    }
+
+
+def compare(current, baseline):
+    """
+    Prints summary deltas against a previous run's JSON.
+    """
+    print(f"{'metric':<24}{'baseline':>12}{'current':>12}{'delta':>12}")
+    for key, value in current["summary"].items():
+        old = baseline.get("summary", {}).get(key)
+        delta = ""
+        if isinstance(value, (int, float)) and isinstance(old, (int, float)):
+            delta = f"{value - old:+.4g}"
+        print(f"{key:<24}{str(old):>12}{str(value):>12}{delta:>12}")
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="FireDetector benchmark")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="synthetic scenarios to run (default: all)")
+    parser.add_argument("--seeds", type=int, default=3, help="seeds per scenario")
+    parser.add_argument("--frames", type=int, default=250)
+    parser.add_argument("--fps", type=float, default=25)
+    parser.add_argument("--no-synthetic", action="store_true")
+    parser.add_argument("--clip", action="append", default=[], help="recorded clip (repeatable)")
+    parser.add_argument("--clip-fps", type=float, default=None,
+                        help="override the container FPS for recorded clips")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=VALUE",
+                        help="FireDetector kwarg, JSON value (e.g. hsv_lower=[0,100,70])")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON to diff against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    detector_kwargs = dict(parse_param(p) for p in args.param)
+
+    results = []
+
+    if not args.no_synthetic:
+        for scenario in args.scenario or SCENARIOS:
+            for seed in range(args.seeds):
+                frames = generate_clip(scenario, seed=seed, frames=args.frames, fps=args.fps)
+                results.append(run_clip(f"{scenario}#{seed}", frames, args.fps, detector_kwargs))
+                print(json.dumps(results[-1]), file=sys.stderr)
+
+    for path in args.clip:
+        fps, frames = _recorded_clip(path, args.clip_fps)
+        results.append(run_clip(os.path.basename(path), frames, fps, detector_kwargs))
+        print(json.dumps(results[-1]), file=sys.stderr)
+
+    report = {
+        "config": {
+            "detector": detector_kwargs,
+            "frames": args.frames,
+            "fps": args.fps,
+            "seeds": args.seeds
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "opencv": cv2.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine()
+        },
+        "clips": results,
+        "summary": summarize(results)
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    print(json.dumps(report["summary"], indent=2))
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
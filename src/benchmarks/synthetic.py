@@ -0,0 +1,107 @@
+import cv2
+import numpy as np
+
+
+SCENARIOS = ("fire", "orange_static", "orange_moving", "orange_flag", "gray_motion", "empty")
+
+
+def _background(rng, width, height):
+    """
+    Static textured scene: vertical gradient + blurred noise (BGR, dark-ish).
+    """
+    gradient = np.linspace(40, 90, height, dtype=np.float32)[:, None, None]
+    noise = rng.normal(0, 12, (height // 8, width // 8, 3)).astype(np.float32)
+    noise = cv2.resize(noise, (width, height), interpolation=cv2.INTER_CUBIC)
+    tint = np.array([1.0, 0.95, 0.9], dtype=np.float32)
+    return np.clip(gradient * tint + noise, 0, 255).astype(np.uint8)
+
+
+def _flame(frame, rng, center, radius):
+    """
+    Irregular, flickering flame: a star-shaped polygon whose vertex
+    radii change every frame (low solidity), orange outside, yellow core.
+    """
+    cx, cy = center
+    n = 18
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    radii = radius * rng.uniform(0.1, 1.0, n)
+    radii[angles > np.pi] *= 0.6  # flatter base, tongues point up (screen y down)
+    pts = np.stack([cx + radii * np.cos(angles), cy - radii * np.sin(angles)], axis=1)
+
+    cv2.fillPoly(frame, [pts.astype(np.int32)], (0, int(rng.integers(90, 150)), 255))
+
+    core = np.stack([cx + 0.45 * radii * np.cos(angles), cy - 0.45 * radii * np.sin(angles)], axis=1)
+    cv2.fillPoly(frame, [core.astype(np.int32)], (40, int(rng.integers(190, 230)), 255))
+
+
+def generate_clip(scenario="fire", seed=0, frames=200, fps=25,
+                  size=(640, 480), event_start=0.25):
+    """
+    Yields (frame, label) for a procedural clip.
+    label is True while a real fire is visible (only in "fire").
+    event_start: fraction of the clip before the object appears.
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(f"Unknown scenario: {scenario}")
+
+    rng = np.random.default_rng(seed)
+    width, height = size
+    background = _background(rng, width, height)
+    start = int(frames * event_start)
+
+    fire_center = (int(width * rng.uniform(0.3, 0.7)), int(height * rng.uniform(0.5, 0.7)))
+    fire_radius = int(min(width, height) * 0.2)
+
+    for i in range(frames):
+        frame = background.copy()
+
+        # Sensor noise
+        cv2.add(frame, rng.integers(0, 6, frame.shape, dtype=np.uint8), dst=frame)
+
+        active = i >= start
+        t = (i - start) / fps
+
+        if active and scenario == "fire":
+            grow = min(1.0, 0.5 + t / 4)
+            sway = int(20 * np.sin(2 * np.pi * 2.0 * t))
+            center = (fire_center[0] + sway, fire_center[1])
+            _flame(frame, rng, center, int(fire_radius * grow))
+
+        elif active and scenario == "orange_static":
+            # Sign / painted wall: never moves
+            cv2.rectangle(frame, (80, 80), (220, 160), (0, 120, 255), -1)
+
+        elif active and scenario == "orange_moving":
+            # Solid orange object (vest, box) crossing the scene
+            x = int((t * 120) % (width - 120))
+            cv2.rectangle(frame, (x, height // 2), (x + 90, height // 2 + 140), (0, 110, 250), -1)
+
+        elif active and scenario == "orange_flag":
+            # Flag on a pole: a slow traveling wave, constant color
+            xs = np.linspace(0, 220, 23)
+            gust = 0.5 + 0.5 * np.sin(2 * np.pi * 0.15 * t)
+            wave = (20 + 50 * gust) * np.sin(2 * np.pi * (0.7 * t - xs / 90)) * xs / 220
+            top = np.stack([120 + xs, 140 + wave], axis=1)
+            bottom = np.stack([120 + xs[::-1], 260 + wave[::-1] * 1.3], axis=1)
+            cv2.fillPoly(frame, [np.vstack([top, bottom]).astype(np.int32)], (0, 120, 255))
+
+        elif active and scenario == "gray_motion":
+            # Non-fire colored motion (person-sized blob)
+            x = int((t * 150) % (width - 100))
+            cv2.ellipse(frame, (x + 50, height // 2), (40, 110), 0, 0, 360, (120, 110, 100), -1)
+
+        yield frame, bool(active and scenario == "fire")
+
+
+def write_clip(path, scenario="fire", seed=0, frames=200, fps=25, size=(640, 480)):
+    """
+    Renders a synthetic clip to disk (MJPG AVI) for reuse as a recorded clip.
+    Returns the list of per-frame labels.
+    """
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    labels = []
+    for frame, label in generate_clip(scenario, seed, frames, fps, size):
+        writer.write(frame)
+        labels.append(label)
+    writer.release()
+    return labels
@@ -0,0 +1,13 @@
+import json
+
+
+def parse_param(text):
+    """
+    "KEY=VALUE" -> (key, value), with VALUE parsed as JSON when it is.
+    Shared by the benchmark and archive scanner CLIs.
+    """
+    key, _, value = text.partition("=")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
@@ -0,0 +1,25 @@
+import json
+import time
+
+
+class ConsoleAlertClient:
+    """
+    Alert sink with the ESP32Client interface that prints to stdout.
+    Used by the headless service when no MQTT broker is wanted.
+    """
+
+    def send_fire_alert(self, confidence, camera=None):
+        payload = {
+            "event": "FIRE",
+            "confidence": confidence,
+            "timestamp": time.time()
+        }
+        if camera is not None:
+            payload["camera"] = camera
+        print(json.dumps(payload), flush=True)
+
+    def deactivate_buzzer(self):
+        print(json.dumps({"event": "OFF"}), flush=True)
+
+    def shutdown(self):
+        pass
@@ -1,39 +1,334 @@
+import base64
 import json
+import os
+import struct
+import threading
 import time
+from collections import deque
+
 import paho.mqtt.client as mqtt
 
 
+# Compact alert payload (12 bytes):
+# event ('F' fire / 'O' off), version, coalesced count, confidence, epoch seconds
+BINARY_ALERT = struct.Struct("<cBHfI")
+BINARY_VERSION = 1
+
+
 class ESP32Client:
     """
-    Handles communication with ESP32 via MQTT
+    Handles communication with ESP32 via MQTT:
+    - Non-blocking connect with automatic reconnect (exponential backoff)
+    - QoS 1 publishes backed by a disk outbox; messages raised while
+      the broker is unreachable are delivered on reconnect, except those
+      older than max_message_age and FIRE alerts a later OFF cancelled
+    - Publish latency metrics (publish -> PUBACK)
+    - Zone routing: camera -> zone -> "<topic_alert>/<zone>"
+    - Burst coalescing and an optional compact binary payload
     """
 
     def __init__(self,
                  broker="broker.hivemq.com",
                  port=1883,
-                 topic_alert="fire/alert"):
+                 topic_alert="fire/alert",
+                 qos=1,
+                 outbox_dir="mqtt_outbox",
+                 max_outbox=1000,
+                 max_message_age=300,
+                 min_reconnect_delay=1,
+                 max_reconnect_delay=60,
+                 keepalive=60,
+                 zones=None,
+                 coalesce_window=0.0,
+                 payload_format="json"):
         self.broker = broker
         self.port = port
         self.topic_alert = topic_alert
+        self.qos = qos
+
+        # Routing / payload
+        self.zones = dict(zones or {})
+        self.coalesce_window = coalesce_window
+        self.payload_format = payload_format
+        self._bursts = {}  # topic -> open coalescing window
+
+        # Disk outbox: one file per undelivered message
+        self.outbox_dir = outbox_dir
+        self.max_outbox = max_outbox
+        self.max_message_age = max_message_age  # seconds; None = no expiry
+        os.makedirs(self.outbox_dir, exist_ok=True)
+        self._seq = self._last_outbox_seq()
+
+        # Delivery tracking
+        self.lock = threading.Lock()
+        self.connected = False
+        self._inflight = {}       # mid -> (outbox path, publish time)
+        self._early_acks = set()  # mids acked before publish() returned
+
+        # Metrics
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.expired = 0
+        self._latencies = deque(maxlen=1000)
 
         self.client = mqtt.Client()
-        self.client.connect(self.broker, self.port, 60)
+        self.client.on_connect = self._on_connect
+        self.client.on_disconnect = self._on_disconnect
+        self.client.on_publish = self._on_publish
+        self.client.reconnect_delay_set(min_reconnect_delay, max_reconnect_delay)
+
+        # Never blocks: the network thread connects and reconnects
+        self.client.connect_async(self.broker, self.port, keepalive)
         self.client.loop_start()
 
-    def send_fire_alert(self, confidence):
+    # -------------------------------------------------
+    # ALERTS
+    # -------------------------------------------------
+    def send_fire_alert(self, confidence, camera=None):
+        topic = self.topic_for(camera)
+
+        if self.coalesce_window > 0:
+            with self.lock:
+                burst = self._bursts.get(topic)
+                if burst is not None:
+                    # Inside an open window: fold into the trailing message
+                    burst["count"] += 1
+                    burst["confidence"] = max(burst["confidence"], confidence)
+                    return
+
+                timer = threading.Timer(self.coalesce_window, self._close_burst, args=(topic,))
+                timer.daemon = True
+                self._bursts[topic] = {"count": 0, "confidence": 0.0, "timer": timer}
+                timer.start()
+
+        # Leading edge: the first alert of a burst goes out immediately
+        self.publish(topic, self._encode("FIRE", confidence), event="FIRE")
+        print("FIRE alert sent")
+
+    def deactivate_buzzer(self):
+        # Drop open windows so no trailing FIRE follows the OFF
+        with self.lock:
+            for burst in self._bursts.values():
+                burst["timer"].cancel()
+            self._bursts.clear()
+
+        # Every device also listens on the base topic
+        self.publish(self.topic_alert, self._encode("OFF"), event="OFF")
+        print("Alarm deactivated")
+
+    def topic_for(self, camera):
+        zone = self.zones.get(camera) if camera is not None else None
+        return f"{self.topic_alert}/{zone}" if zone else self.topic_alert
+
+    def _close_burst(self, topic):
+        with self.lock:
+            burst = self._bursts.pop(topic, None)
+
+        if burst and burst["count"]:
+            self.publish(topic, self._encode("FIRE", burst["confidence"], burst["count"]), event="FIRE")
+
+    def _encode(self, event, confidence=None, count=1):
+        if self.payload_format == "binary":
+            return BINARY_ALERT.pack(
+                event[0].encode("ascii"),
+                BINARY_VERSION,
+                min(count, 0xFFFF),
+                float(confidence or 0.0),
+                int(time.time())
+            )
+
+        if event == "OFF":
+            return json.dumps({"event": "OFF"})
+
         payload = {
-            "event": "FIRE",
+            "event": event,
             "confidence": confidence,
             "timestamp": time.time()
         }
-        self.client.publish(self.topic_alert, json.dumps(payload))
-        print("FIRE alert sent")
+        if count > 1:
+            payload["count"] = count
+        return json.dumps(payload)
 
-    def deactivate_buzzer(self):
-        payload = {"event": "OFF"}
-        self.client.publish(self.topic_alert, json.dumps(payload))
-        print("Alarm deactivated")
+    # -------------------------------------------------
+    # PUBLISH (OUTBOX FIRST, THEN NETWORK)
+    # -------------------------------------------------
+    def publish(self, topic, payload, event=None):
+        """
+        event ("FIRE" / "OFF") lets the outbox drop FIRE alerts that a
+        later OFF cancelled before they could be delivered.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+
+        path = self._outbox_write(topic, payload, event)
+        self.published += 1
+
+        if self.connected:
+            self._send(path, topic, payload)
+
+    def _send(self, path, topic, payload):
+        info = self.client.publish(topic, payload, qos=self.qos)
+        if info.rc != mqtt.MQTT_ERR_SUCCESS:
+            return  # stays in the outbox until the next connect
+
+        with self.lock:
+            if info.mid in self._early_acks:
+                self._early_acks.discard(info.mid)
+                acked = True
+            else:
+                self._inflight[info.mid] = (path, time.perf_counter())
+                acked = False
+
+        if acked:
+            self._delivered(path, None)
+
+    def _delivered(self, path, started):
+        if started is not None:
+            self._latencies.append(time.perf_counter() - started)
+        self.delivered += 1
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    # -------------------------------------------------
+    # MQTT CALLBACKS (NETWORK THREAD)
+    # -------------------------------------------------
+    def _on_connect(self, client, userdata, flags, rc):
+        if rc != 0:
+            return
+
+        self.connected = True
+
+        # Deliver what was raised while offline and still applies (oldest first)
+        with self.lock:
+            pending = {path for path, _ in self._inflight.values()}
+
+        for path, topic, payload in self._outbox_pending():
+            if path not in pending:
+                self._send(path, topic, payload)
+
+    def _on_disconnect(self, client, userdata, rc):
+        self.connected = False
+
+    def _on_publish(self, client, userdata, mid):
+        with self.lock:
+            entry = self._inflight.pop(mid, None)
+            if entry is None:
+                self._early_acks.add(mid)
+                return
+
+        self._delivered(*entry)
+
+    # -------------------------------------------------
+    # OUTBOX
+    # -------------------------------------------------
+    def _last_outbox_seq(self):
+        seqs = [int(name.split(".")[0]) for name in os.listdir(self.outbox_dir)
+                if name.endswith(".json")]
+        return max(seqs, default=0)
+
+    def _outbox_write(self, topic, payload, event=None):
+        with self.lock:
+            self._seq += 1
+            seq = self._seq
+
+        path = os.path.join(self.outbox_dir, f"{seq:012d}.json")
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "topic": topic,
+                "event": event,
+                "created": time.time(),
+                "payload": base64.b64encode(payload).decode("ascii")
+            }, f)
+        os.replace(tmp, path)
+
+        self._outbox_trim()
+        return path
+
+    def _outbox_files(self):
+        return sorted(
+            os.path.join(self.outbox_dir, name)
+            for name in os.listdir(self.outbox_dir)
+            if name.endswith(".json")
+        )
+
+    def _outbox_read(self):
+        for path in self._outbox_files():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                # Entries written before "created" existed: file time
+                created = entry.get("created") or os.path.getmtime(path)
+            except (OSError, ValueError):
+                continue
+            yield path, entry["topic"], base64.b64decode(entry["payload"]), entry.get("event"), created
+
+    def _outbox_pending(self):
+        """
+        Outbox entries to replay, oldest first. Removes entries older
+        than max_message_age, and FIRE alerts followed by an OFF on the
+        same topic or on the base topic every device listens on: a
+        buzzer must not sound for a fire that is long over.
+        """
+        now = time.time()
+        cleared = set()  # topics of OFFs newer than the entry being looked at
+        pending = []
+
+        for path, topic, payload, event, created in reversed(list(self._outbox_read())):
+            superseded = event == "FIRE" and (topic in cleared or self.topic_alert in cleared)
+            if event == "OFF":
+                cleared.add(topic)
+
+            expired = self.max_message_age is not None and now - created > self.max_message_age
+            if superseded or expired:
+                try:
+                    os.remove(path)
+                    self.expired += 1
+                except FileNotFoundError:
+                    pass
+                continue
+
+            pending.append((path, topic, payload))
+
+        pending.reverse()
+        return pending
+
+    def _outbox_trim(self):
+        files = self._outbox_files()
+        for path in files[:max(0, len(files) - self.max_outbox)]:
+            try:
+                os.remove(path)
+                self.dropped += 1
+            except FileNotFoundError:
+                pass
+
+    # -------------------------------------------------
+    # METRICS
+    # -------------------------------------------------
+    def stats(self):
+        latencies = sorted(self._latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            "connected": self.connected,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "expired": self.expired,
+            "outbox": len(self._outbox_files()),
+            "latency_p50_ms": percentile(0.50),
+            "latency_p95_ms": percentile(0.95),
+            "latency_max_ms": latencies[-1] * 1000 if latencies else None
+        }
 
     def shutdown(self):
+        self.client.disconnect()
         self.client.loop_stop()
-        self.client.disconnect()
\ No newline at end of file
@@ -0,0 +1,120 @@
+import importlib
+from abc import ABC, abstractmethod
+
+
+# Built-in backends; any "package.module:ClassName" also works
+BACKENDS = {
+    "color": "detection.fire_detector:FireDetector"
+}
+
+
+class DetectorBackend(ABC):
+    """
+    Interface for fire detector backends used by the controller,
+    the multi-stream engine, the archive scanner and the benchmarks:
+    - process_frame(frame, timestamp) -> (fire, confidence, boxes)
+    - process_batch(frames, timestamps) -> list of the same, in order
+    - reset() clears temporal state (after an alarm is acknowledged)
+
+    Optional capabilities, advertised by class attributes:
+    - TUNABLE: parameter names update_params() accepts on a live detector
+    - PARAM_RANGES: name -> (type, min, max) or (type, min, max, length)
+      for sequences; check_params() coerces and range-checks with it
+    - supports_snapshots: save_snapshot(path) / load_snapshot(path)
+      are implemented, for warm restarts
+
+    fire_start_time is not None while a fire candidate is being
+    confirmed (the scheduler then detects at full rate).
+    """
+
+    camera_id = "main"
+    metrics = None
+    fire_start_time = None
+
+    TUNABLE = ()
+    PARAM_RANGES = {}
+    supports_snapshots = False
+
+    @abstractmethod
+    def process_frame(self, frame, timestamp):
+        ...
+
+    def process_batch(self, frames, timestamps):
+        return [self.process_frame(frames[i], timestamps[i]) for i in range(len(frames))]
+
+    @abstractmethod
+    def reset(self):
+        ...
+
+    def check_params(self, params):
+        """
+        Returns params coerced to their declared types. Raises
+        ValueError for unknown names and bad or out-of-range values,
+        before anything reaches the processing thread.
+        """
+        unknown = set(params) - set(self.TUNABLE)
+        if unknown:
+            raise ValueError(f"Not tunable at runtime: {', '.join(sorted(unknown))}")
+
+        checked = {}
+        for name, value in params.items():
+            spec = self.PARAM_RANGES.get(name)
+            if spec is None:
+                checked[name] = value
+            elif len(spec) == 4:
+                if isinstance(value, (str, bytes)) or not hasattr(value, "__len__") or len(value) != spec[3]:
+                    raise ValueError(f"{name}: expected {spec[3]} values, got {value!r}")
+                checked[name] = tuple(_coerce(name, v, *spec[:3]) for v in value)
+            else:
+                checked[name] = _coerce(name, value, *spec)
+        return checked
+
+    def update_params(self, **params):
+        """
+        Validates (see check_params) and returns the coerced values;
+        backends queue them for their processing thread.
+        """
+        return self.check_params(params)
+
+    def save_snapshot(self, path):
+        return False
+
+    def load_snapshot(self, path):
+        return None
+
+
+def _coerce(name, value, kind, low, high):
+    if isinstance(value, bool):
+        raise ValueError(f"{name}: expected {kind.__name__}, got {value!r}")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}: expected {kind.__name__}, got {value!r}") from None
+
+    if kind is int:
+        if not number.is_integer():
+            raise ValueError(f"{name}: expected int, got {value!r}")
+        number = int(number)
+
+    if (low is not None and number < low) or (high is not None and number > high):
+        bounds = f"[{low if low is not None else '-inf'}, {high if high is not None else 'inf'}]"
+        raise ValueError(f"{name}: {value!r} is outside {bounds}")
+    return number
+
+
+def create_backend(name="color", **kwargs):
+    """
+    Builds a backend from a registered name or "module:Class" path.
+    Names (not instances) cross process boundaries, so worker
+    processes can build their own backend.
+    """
+    target = BACKENDS.get(name, name)
+    module_name, _, class_name = target.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown detector backend: {name}")
+
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    if not issubclass(backend_class, DetectorBackend):
+        raise TypeError(f"{target} is not a DetectorBackend")
+
+    return backend_class(**kwargs)
@@ -0,0 +1,119 @@
+import cv2
+import numpy as np
+
+
+class ColorLUT:
+    """
+    Fire color segmentation from a precompiled BGR lookup table:
+    - HSV bounds are compiled once into a quantized 3D LUT
+      (2**quant_bits levels per channel) and rebuilt only when they change
+    - Pixels are classified directly from BGR with integer ops only;
+      no intermediate HSV frame is produced
+    - quant_bits=8 is exact (16 MB table); lower values trade a small
+      mismatch on bin edges for a much smaller table and faster rebuilds
+
+    Per frame: BGR -> BGRA (zero alpha) into a reused buffer, viewed as one
+    uint32 per pixel, masked to the top quant_bits of each channel,
+    shifted, then gathered from the table.
+    """
+
+    MAX_BUFFERS = 4
+
+    def __init__(self, hsv_lower, hsv_upper, quant_bits=6):
+        if not 1 <= quant_bits <= 8:
+            raise ValueError("quant_bits must be between 1 and 8")
+
+        self.quant_bits = quant_bits
+        self.shift = 8 - quant_bits
+
+        # Keeps the top quant_bits of B, G and R; drops alpha
+        level_mask = (0xFF << self.shift) & 0xFF
+        self.pixel_mask = np.uint32(level_mask | (level_mask << 8) | (level_mask << 16))
+
+        self.hsv_lower = None
+        self.hsv_upper = None
+        self.table = None
+        self.builds = 0
+
+        # Scratch BGRA buffers, keyed by frame shape
+        self._buffers = {}
+
+        self.set_bounds(hsv_lower, hsv_upper)
+
+    # -------------------------------------------------
+    # BUILD
+    # -------------------------------------------------
+    def set_bounds(self, hsv_lower, hsv_upper):
+        """
+        Rebuilds the table only if the bounds actually changed.
+        """
+        lower = tuple(int(v) for v in hsv_lower)
+        upper = tuple(int(v) for v in hsv_upper)
+        if lower == self.hsv_lower and upper == self.hsv_upper:
+            return False
+
+        self.hsv_lower = lower
+        self.hsv_upper = upper
+        self.table = self._build()
+        self.builds += 1
+        return True
+
+    def _build(self):
+        n = 1 << self.quant_bits
+
+        # Classify each bin by its center color with the reference HSV path
+        levels = (np.arange(n, dtype=np.uint32) << self.shift) + ((1 << self.shift) >> 1)
+        g, r = np.meshgrid(levels, levels, indexing="ij")
+        lower = np.array(self.hsv_lower)
+        upper = np.array(self.hsv_upper)
+
+        table = np.zeros(int(self.pixel_mask >> self.shift) + 1, dtype=np.uint8)
+        centers = np.empty((n * n, 1, 3), dtype=np.uint8)
+        centers[:, 0, 1] = g.ravel()
+        centers[:, 0, 2] = r.ravel()
+
+        # One blue level at a time keeps the exact (8-bit) build small
+        for b in levels:
+            centers[:, 0, 0] = b
+            hsv = cv2.cvtColor(centers, cv2.COLOR_BGR2HSV)
+            inside = cv2.inRange(hsv, lower, upper).ravel()
+
+            # Same packing as classify(): (b | g << 8 | r << 16) & mask >> shift
+            packed = (b | (g << 8) | (r << 16)).ravel()
+            table[(packed & self.pixel_mask) >> self.shift] = inside
+
+        return table
+
+    # -------------------------------------------------
+    # CLASSIFY
+    # -------------------------------------------------
+    def classify(self, frame):
+        """
+        Returns a uint8 mask (255 = fire color), like cv2.inRange on HSV.
+        """
+        h, w = frame.shape[:2]
+        bgra = self._buffer(h, w)
+
+        cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=bgra)
+        packed = bgra.view(np.uint32)[..., 0]
+
+        # Alpha (255 from the conversion) is cleared by the mask
+        np.bitwise_and(packed, self.pixel_mask, out=packed)
+        if self.shift:
+            np.right_shift(packed, self.shift, out=packed)
+
+        mask = np.empty((h, w), dtype=np.uint8)
+        np.take(self.table, packed, out=mask)
+        return mask
+
+    def _buffer(self, h, w):
+        buffer = self._buffers.get((h, w))
+        if buffer is None:
+            # Crop sizes vary in the cascades; keep only a few shapes
+            if len(self._buffers) >= self.MAX_BUFFERS:
+                self._buffers.clear()
+            buffer = self._buffers[(h, w)] = np.empty((h, w, 4), dtype=np.uint8)
+        return buffer
+
+    def nbytes(self):
+        return self.table.nbytes + sum(b.nbytes for b in self._buffers.values())
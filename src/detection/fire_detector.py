@@ -1,10 +1,18 @@
 import cv2
+import json
 import numpy as np
+import os
 import time
 from collections import deque
 
+from detection.backends import DetectorBackend
+from detection.color_lut import ColorLUT
+from detection.region_tracker import RegionTracker
+from detection.flicker_analyzer import FlickerAnalyzer
+from detection.onnx_verifier import OnnxVerifier
 
-class FireDetector:
+
+class FireDetector(DetectorBackend):
     """
     Robust fire detector with:
     - Color segmentation
@@ -12,8 +20,46 @@ class FireDetector:
     - Shape analysis
     - Temporal smoothing
     - False-positive suppression
+    - Optional ROI mask, motion-gated cascade and coarse-to-fine pyramid
+    - Color segmentation via HSV (color_mode="hsv") or a precompiled
+      BGR lookup table (color_mode="lut", see ColorLUT)
+    - Optional per-region tracking (tracking=True, see RegionTracker):
+      confidence and temporal consistency are judged per fire region
+    - Optional flicker stage (flicker=True, see FlickerAnalyzer): tracked
+      regions must flicker at flame frequencies to be confirmed
+    - Optional ONNX verifier (verifier_model, see OnnxVerifier): tracked
+      regions that pass every other gate are confirmed by a classifier
+    - Live parameter updates (update_params) applied between frames,
+      keeping the learned MOG2 background model
+    - Background / temporal state snapshots for warm restarts
+      (save_snapshot / load_snapshot)
     """
 
+    # Parameters update_params() can change on a running detector
+    TUNABLE = (
+        "min_fire_duration", "min_fire_area", "confidence_threshold",
+        "smoothing_window", "persistence_ratio", "hsv_lower", "hsv_upper",
+        "mog2_history", "mog2_var_threshold",
+        "flicker_threshold", "verifier_threshold"
+    )
+
+    # (type, min, max[, length]); see DetectorBackend.check_params
+    PARAM_RANGES = {
+        "min_fire_duration": (float, 0, None),
+        "min_fire_area": (int, 0, None),
+        "confidence_threshold": (float, 0, 1),
+        "smoothing_window": (int, 1, None),
+        "persistence_ratio": (float, 0, 1),
+        "hsv_lower": (int, 0, 255, 3),
+        "hsv_upper": (int, 0, 255, 3),
+        "mog2_history": (int, 1, None),
+        "mog2_var_threshold": (float, 0, None),
+        "flicker_threshold": (float, 0, 1),
+        "verifier_threshold": (float, 0, 1)
+    }
+
+    supports_snapshots = True
+
     def __init__(self,
                  min_fire_duration=2.5,
                  min_fire_area=500,
@@ -21,7 +67,26 @@ class FireDetector:
                  smoothing_window=10,
                  persistence_ratio=0.7,
                  hsv_lower=(0, 120, 70),
-                 hsv_upper=(35, 255, 255)):
+                 hsv_upper=(35, 255, 255),
+                 roi_mask=None,
+                 motion_gate=False,
+                 motion_scale=0.25,
+                 gate_padding=2,
+                 pyramid=False,
+                 coarse_size=(160, 120),
+                 pyramid_audit=False,
+                 color_mode="hsv",
+                 lut_bits=6,
+                 tracking=False,
+                 flicker=False,
+                 flicker_threshold=0.5,
+                 flicker_budget=512 * 1024,
+                 flicker_method="fft",
+                 verifier_model=None,
+                 verifier_threshold=0.5,
+                 verifier_kwargs=None,
+                 mog2_history=500,
+                 mog2_var_threshold=16):
 
         # Parameters
         self.min_fire_duration = min_fire_duration
@@ -32,6 +97,35 @@ class FireDetector:
         self.hsv_lower = np.array(hsv_lower)
         self.hsv_upper = np.array(hsv_upper)
 
+        # Color segmentation engine
+        if color_mode not in ("hsv", "lut"):
+            raise ValueError(f"Unsupported color mode: {color_mode}")
+        self.color_mode = color_mode
+        self._color_lut = None
+        if color_mode == "lut":
+            self._color_lut = ColorLUT(self.hsv_lower, self.hsv_upper, quant_bits=lut_bits)
+
+        # Region of interest (non-zero = analysed)
+        self.roi_mask = None
+        self._roi_cache = {}
+        self.set_roi(roi_mask)
+
+        # Cascade: motion on a downscaled frame gates everything else
+        self.motion_gate = motion_gate
+        self.motion_scale = motion_scale
+        self.gate_padding = gate_padding
+
+        # Coarse-to-fine pyramid (coarse_size is (width, height))
+        self.pyramid = pyramid
+        self.coarse_size = tuple(coarse_size)
+        self.pyramid_audit = pyramid_audit
+        self.pyramid_stats = {
+            "frames": 0,
+            "single_positive": 0,
+            "pyramid_positive": 0,
+            "both_positive": 0
+        }
+
         # Temporal buffers
         self.confidence_buffer = deque(maxlen=smoothing_window)
         self.fire_presence_buffer = deque(maxlen=smoothing_window)
@@ -40,24 +134,163 @@ class FireDetector:
         self.fire_start_time = None
         self.alert_sent = False
 
+        # Per-region tracking (None = frame-level logic);
+        # the flicker stage works on tracks, so it turns tracking on
+        self.tracker = RegionTracker() if tracking or flicker or verifier_model else None
+
+        # Flicker stage: luminance rings for tracked regions only
+        self.flicker = None
+        self.flicker_threshold = flicker_threshold
+        self._flicker_scores = {}
+        if flicker:
+            self.flicker = FlickerAnalyzer(
+                capacity=self.tracker.capacity,
+                memory_budget=flicker_budget,
+                method=flicker_method
+            )
+
+        # Second-stage classifier on candidate crops (one session per process)
+        self.verifier = None
+        self.verifier_threshold = verifier_threshold
+        if verifier_model:
+            self.verifier = OnnxVerifier.shared(verifier_model, **(verifier_kwargs or {}))
+
         # Motion detector
         self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
-            history=500,
-            varThreshold=16,
+            history=mog2_history,
+            varThreshold=mog2_var_threshold,
             detectShadows=True
         )
 
+        # Live parameter updates: (version, params) swapped in as one
+        # reference by the writer, applied at the start of the next frame
+        self._param_snapshot = (0, {})
+        self._applied_version = 0
+
+        # Warm start: candidate age carried over from a snapshot
+        self._last_timestamp = None
+        self._resume_candidate = None
+        self._warm_started = False
+
+        # Instrumentation (PipelineMetrics / StageRecorder); None = disabled
+        self.metrics = None
+        self.camera_id = "main"
+
+        # Shadow full-resolution model used only by the pyramid audit
+        self._audit_subtractor = None
+        if pyramid and pyramid_audit:
+            self._audit_subtractor = cv2.createBackgroundSubtractorMOG2(
+                history=mog2_history,
+                varThreshold=mog2_var_threshold,
+                detectShadows=True
+            )
+
     # -------------------------------------------------
     # MAIN PIPELINE
     # -------------------------------------------------
     def process_frame(self, frame, timestamp):
+        if self._param_snapshot[0] != self._applied_version:
+            self._apply_params()
+
+        m = self.metrics
+        t = time.perf_counter() if m is not None else 0.0
+
+        if self.pyramid:
+            boxes, areas = self._process_pyramid(frame)
+            if m is not None:
+                t = m.observe(self.camera_id, "pyramid", t)
+            if self._audit_subtractor is not None:
+                self._audit_pyramid(frame, sum(areas))
+                if m is not None:
+                    t = m.observe(self.camera_id, "pyramid_audit", t)
+            return self._timed_decide(boxes, areas, timestamp, t, frame)
+
+        if self.motion_gate:
+            boxes, areas = self._process_gated(frame)
+            if m is not None:
+                t = m.observe(self.camera_id, "gated", t)
+            return self._timed_decide(boxes, areas, timestamp, t, frame)
 
         fire_mask = self._detect_fire_color(frame)
+        if m is not None:
+            t = m.observe(self.camera_id, "color", t)
+
         motion_mask = self._detect_motion(frame)
+        if m is not None:
+            t = m.observe(self.camera_id, "motion", t)
 
         combined = cv2.bitwise_and(fire_mask, motion_mask)
-        boxes, total_area = self._extract_regions(combined)
+        roi = self._roi_for(combined.shape)
+        if roi is not None:
+            combined = cv2.bitwise_and(combined, roi)
+
+        boxes, areas = self._extract_regions(combined)
+        if m is not None:
+            t = m.observe(self.camera_id, "regions", t)
+
+        return self._timed_decide(boxes, areas, timestamp, t, frame)
+
+    def _timed_decide(self, boxes, areas, timestamp, started, frame=None):
+        result = self._decide(boxes, areas, timestamp, frame)
+        if self.metrics is not None:
+            self.metrics.observe(self.camera_id, "decide", started)
+        return result
+
+    def process_batch(self, frames, timestamps):
+        """
+        Processes N frames in order and returns a list of
+        (fire, confidence, boxes), identical to calling
+        process_frame on each frame.
+
+        Color segmentation and mask combination run once over the
+        stacked (N, H, W, 3) array; MOG2 and the temporal logic
+        stay sequential because they are stateful.
+        """
+        if self._param_snapshot[0] != self._applied_version:
+            self._apply_params()
+
+        frames = np.ascontiguousarray(np.asarray(frames, dtype=np.uint8))
+        if frames.ndim == 3:
+            frames = frames[np.newaxis]
+
+        n, h, w = frames.shape[:3]
+        if n == 0:
+            return []
+
+        # The cascades are per-frame by nature
+        if self.motion_gate or self.pyramid:
+            return [self.process_frame(frames[i], timestamps[i]) for i in range(n)]
+
+        # One color segmentation pass over all frames (stacked vertically)
+        fire_masks = self._detect_fire_color(frames.reshape(n * h, w, 3)).reshape(n, h, w)
+
+        motion_masks = np.empty_like(fire_masks)
+        for i in range(n):
+            motion_masks[i] = self._detect_motion(frames[i])
+
+        np.bitwise_and(fire_masks, motion_masks, out=fire_masks)
+
+        roi = self._roi_for((h, w))
+        if roi is not None:
+            np.bitwise_and(fire_masks, roi, out=fire_masks)
+
+        results = []
+        for i in range(n):
+            boxes, areas = self._extract_regions(fire_masks[i])
+            results.append(self._decide(boxes, areas, timestamps[i], frames[i]))
+
+        return results
+
+    # -------------------------------------------------
+    # DECISION (TEMPORAL LOGIC)
+    # -------------------------------------------------
+    def _decide(self, boxes, areas, timestamp, frame=None):
+        self._last_timestamp = timestamp
+
+        if self.tracker is not None:
+            return self._decide_tracked(boxes, areas, timestamp, frame)
 
+        total_area = sum(areas)
         raw_confidence = min(1.0, total_area / (self.min_fire_area * 3))
         fire_present = total_area >= self.min_fire_area
 
@@ -71,6 +304,7 @@ class FireDetector:
         # Reset if fire disappears
         if not fire_present:
             self.fire_start_time = None
+            self._resume_candidate = None
             self.alert_sent = False
             return False, smoothed_confidence, []
 
@@ -86,23 +320,143 @@ class FireDetector:
 
         return False, smoothed_confidence, boxes
 
+    def _decide_tracked(self, boxes, areas, timestamp, frame=None):
+        """
+        Same gates as _decide, applied to each tracked region on its
+        own: two small lights in different corners no longer add up.
+        With the flicker stage, a region must also flicker at flame rates.
+        """
+        tracker = self.tracker
+        tracker.update(boxes, areas, timestamp)
+
+        slots = tracker.live_slots()
+        if not len(slots):
+            self.fire_start_time = None
+            self.alert_sent = False
+            return False, 0.0, []
+
+        confidence, persistence = tracker.confidence(
+            slots, self.min_fire_area, self.confidence_buffer.maxlen
+        )
+        duration = timestamp - tracker.first_seen[slots]
+
+        # Oldest live region: keeps the scheduler at full rate while confirming
+        self.fire_start_time = float(tracker.first_seen[slots].min())
+
+        confirmed = ((persistence >= self.persistence_ratio) &
+                     (confidence >= self.confidence_threshold) &
+                     (duration >= self.min_fire_duration))
+
+        if self.flicker is not None and frame is not None:
+            self.flicker.sample(frame, tracker, slots, timestamp)
+            if confirmed.any():
+                self._flicker_scores = dict(zip(
+                    tracker.ids[slots].tolist(), self.flicker.scores(slots).tolist()
+                ))
+                flickering = np.array([
+                    self._flicker_scores[i] >= self.flicker_threshold
+                    for i in tracker.ids[slots].tolist()
+                ])
+                confirmed &= flickering
+
+        if self.verifier is not None and frame is not None and confirmed.any():
+            confirmed &= self._verify(frame, slots, confirmed, timestamp)
+
+        if not confirmed.any():
+            return False, float(confidence.max()), boxes
+
+        fire_boxes = []
+        for slot in slots[confirmed]:
+            x1, y1, x2, y2 = tracker.boxes[slot]
+            fire_boxes.append((int(x1), int(y1), int(x2 - x1), int(y2 - y1)))
+
+        return True, float(confidence[confirmed].max()), fire_boxes
+
+    def _verify(self, frame, slots, confirmed, timestamp):
+        """
+        Cached verdict per track; unverified tracks and tracks due for
+        a re-check are queued and classified in one batch (right away
+        unless the caller flushes for several detectors, see
+        MultiStreamEngine).
+        """
+        verifier = self.verifier
+        tracker = self.tracker
+        verified = np.zeros(len(slots), dtype=bool)
+        queued = []
+
+        for i in np.flatnonzero(confirmed):
+            slot = slots[i]
+            key = (self.camera_id, int(tracker.ids[slot]))
+            probability, due = verifier.lookup(key, timestamp)
+
+            if due:
+                x1, y1, x2, y2 = tracker.boxes[slot]
+                verifier.submit(key, frame, (int(x1), int(y1), int(x2 - x1), int(y2 - y1)), timestamp)
+                queued.append((i, key))
+
+            # A pending re-check keeps the previous verdict
+            if probability is not None:
+                verified[i] = probability >= self.verifier_threshold
+
+        if queued and verifier.autoflush:
+            m = self.metrics
+            t = time.perf_counter() if m is not None else 0.0
+            verifier.flush()
+            if m is not None:
+                m.observe(self.camera_id, "verify", t)
+
+            for i, key in queued:
+                probability, _ = verifier.lookup(key, timestamp)
+                verified[i] = probability is not None and probability >= self.verifier_threshold
+
+        return verified
+
+    def tracks(self):
+        """
+        Live fire regions (id, box, age, growth rate, flicker frequency).
+        Empty unless tracking is enabled.
+        """
+        if self.tracker is None:
+            return []
+
+        tracks = self.tracker.tracks()
+        if self.flicker is not None:
+            for track in tracks:
+                track["flicker_score"] = self._flicker_scores.get(track["id"])
+        return tracks
+
     # -------------------------------------------------
     # INTERNAL STAGES
     # -------------------------------------------------
     def _detect_fire_color(self, frame):
+        if self._color_lut is not None:
+            # No-op unless hsv_lower / hsv_upper changed
+            self._color_lut.set_bounds(self.hsv_lower, self.hsv_upper)
+            return self._color_lut.classify(frame)
+
         hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
         return cv2.inRange(hsv, self.hsv_lower, self.hsv_upper)
 
-    def _detect_motion(self, frame):
-        fg = self.bg_subtractor.apply(frame)
+    def _detect_motion(self, frame, subtractor=None):
+        subtractor = subtractor or self.bg_subtractor
+
+        # A seeded model is already converged: learn at the steady-state
+        # rate instead of MOG2's fast start-up rate
+        rate = -1
+        if self._warm_started and subtractor is self.bg_subtractor:
+            rate = 1.0 / subtractor.getHistory()
+
+        fg = subtractor.apply(frame, learningRate=rate)
         _, fg = cv2.threshold(fg, 200, 255, cv2.THRESH_BINARY)
         return fg
 
-    def _extract_regions(self, mask):
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    def _extract_regions(self, mask, offset=(0, 0)):
+        contours, _ = cv2.findContours(
+            mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=offset
+        )
 
         boxes = []
-        total_area = 0
+        areas = []
 
         for cnt in contours:
             area = cv2.contourArea(cnt)
@@ -118,22 +472,366 @@ class FireDetector:
 
             x, y, w, h = cv2.boundingRect(cnt)
             boxes.append((x, y, w, h))
-            total_area += area
+            areas.append(area)
+
+        return boxes, areas
+
+    # -------------------------------------------------
+    # CASCADE (MOTION GATE / COARSE-TO-FINE PYRAMID)
+    # -------------------------------------------------
+    def _process_gated(self, frame):
+        """
+        Motion runs first on a downscaled frame. Color segmentation and
+        region extraction only run on the (full-resolution) bounding
+        areas of the motion blobs; static scenes exit early.
+        """
+        h, w = frame.shape[:2]
+        coarse_size = (max(1, int(w * self.motion_scale)), max(1, int(h * self.motion_scale)))
+        return self._process_cascade(frame, coarse_size, coarse_color=False)
+
+    def _process_pyramid(self, frame):
+        """
+        Coarse pass (color + motion at coarse_size) flags candidate
+        regions; only those go through full-resolution color and
+        solidity checks. The MOG2 model runs at the coarse scale and
+        its mask is upsampled inside each candidate region.
+        """
+        return self._process_cascade(frame, self.coarse_size, coarse_color=True)
 
-        return boxes, total_area
+    def _process_cascade(self, frame, coarse_size, coarse_color):
+        h, w = frame.shape[:2]
+        cw, ch = coarse_size
+        fx, fy = w / cw, h / ch
+
+        small = cv2.resize(frame, (cw, ch), interpolation=cv2.INTER_AREA)
+        motion_small = self._detect_motion(small)
+
+        roi_small = self._roi_for(motion_small.shape)
+        if roi_small is not None:
+            motion_small = cv2.bitwise_and(motion_small, roi_small)
+
+        candidates = motion_small
+        if coarse_color:
+            candidates = cv2.bitwise_and(candidates, self._detect_fire_color(small))
+
+        if not cv2.countNonZero(candidates):
+            return [], []
+
+        min_blob = 0.5 * self.min_fire_area * (cw * ch) / (w * h)
+
+        boxes = []
+        areas = []
+
+        for (sx, sy, sw, sh) in self._candidate_rects(candidates, min_blob):
+            x, y = int(sx * fx), int(sy * fy)
+            x2, y2 = min(w, int((sx + sw) * fx)), min(h, int((sy + sh) * fy))
+
+            fire_mask = self._detect_fire_color(frame[y:y2, x:x2])
+            motion_mask = cv2.resize(
+                motion_small[sy:sy + sh, sx:sx + sw],
+                (x2 - x, y2 - y),
+                interpolation=cv2.INTER_NEAREST
+            )
+
+            combined = cv2.bitwise_and(fire_mask, motion_mask)
+            region_boxes, region_areas = self._extract_regions(combined, offset=(x, y))
+
+            boxes.extend(region_boxes)
+            areas.extend(region_areas)
+
+        return boxes, areas
+
+    def _candidate_rects(self, mask, min_blob):
+        """
+        Padded, merged bounding rects of blobs in a coarse mask.
+        Blobs too small to ever contain min_fire_area are dropped.
+        """
+        contours, _ = cv2.findContours(
+            mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        )
+
+        pad = self.gate_padding
+        h, w = mask.shape[:2]
+
+        rects = []
+        for cnt in contours:
+            x, y, rw, rh = cv2.boundingRect(cnt)
+            if rw * rh < min_blob:
+                continue
+
+            x0, y0 = max(0, x - pad), max(0, y - pad)
+            x1, y1 = min(w, x + rw + pad), min(h, y + rh + pad)
+            rects.append([x0, y0, x1, y1])
+
+        # Merge overlapping rects so no pixel is counted twice
+        merged = True
+        while merged and len(rects) > 1:
+            merged = False
+            for i in range(len(rects)):
+                for j in range(i + 1, len(rects)):
+                    a, b = rects[i], rects[j]
+                    if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                        rects[i] = [min(a[0], b[0]), min(a[1], b[1]),
+                                    max(a[2], b[2]), max(a[3], b[3])]
+                        del rects[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+
+        return [(x0, y0, x1 - x0, y1 - y0) for x0, y0, x1, y1 in rects]
+
+    # -------------------------------------------------
+    # PYRAMID AUDIT (RECALL VS SINGLE-SCALE)
+    # -------------------------------------------------
+    def _audit_pyramid(self, frame, pyramid_area):
+        """
+        Runs the single-scale path on a shadow MOG2 model and tallies
+        how many of its positive frames the pyramid path also caught.
+        """
+        fire_mask = self._detect_fire_color(frame)
+        motion_mask = self._detect_motion(frame, self._audit_subtractor)
+
+        combined = cv2.bitwise_and(fire_mask, motion_mask)
+        roi = self._roi_for(combined.shape)
+        if roi is not None:
+            combined = cv2.bitwise_and(combined, roi)
+
+        _, single_areas = self._extract_regions(combined)
+        single_area = sum(single_areas)
+
+        single = single_area >= self.min_fire_area
+        pyramid = pyramid_area >= self.min_fire_area
+
+        stats = self.pyramid_stats
+        stats["frames"] += 1
+        stats["single_positive"] += int(single)
+        stats["pyramid_positive"] += int(pyramid)
+        stats["both_positive"] += int(single and pyramid)
+
+    def pyramid_recall(self):
+        """
+        Fraction of single-scale positive frames the pyramid also flagged.
+        None until the audit has seen a positive frame.
+        """
+        positives = self.pyramid_stats["single_positive"]
+        if not positives:
+            return None
+        return self.pyramid_stats["both_positive"] / positives
+
+    # -------------------------------------------------
+    # REGION OF INTEREST
+    # -------------------------------------------------
+    def set_roi(self, roi_mask):
+        """
+        roi_mask: 2D array, non-zero where detection is allowed
+        (e.g. zero over sky, windows, signage). None disables it.
+        """
+        self._roi_cache = {}
+
+        if roi_mask is None:
+            self.roi_mask = None
+            return
+
+        mask = np.asarray(roi_mask)
+        self.roi_mask = np.where(mask > 0, 255, 0).astype(np.uint8)
+
+    @staticmethod
+    def build_roi_mask(size, exclude=(), include=None):
+        """
+        Builds an ROI mask of size (width, height) from polygons.
+        include: polygons to analyse (default: whole frame)
+        exclude: polygons to ignore
+        """
+        width, height = size
+
+        if include:
+            mask = np.zeros((height, width), dtype=np.uint8)
+            for poly in include:
+                cv2.fillPoly(mask, [np.asarray(poly, dtype=np.int32)], 255)
+        else:
+            mask = np.full((height, width), 255, dtype=np.uint8)
+
+        for poly in exclude:
+            cv2.fillPoly(mask, [np.asarray(poly, dtype=np.int32)], 0)
+
+        return mask
+
+    def _roi_for(self, shape):
+        if self.roi_mask is None:
+            return None
+
+        key = tuple(shape[:2])
+        roi = self._roi_cache.get(key)
+        if roi is None:
+            roi = self.roi_mask
+            if roi.shape != key:
+                roi = cv2.resize(roi, (key[1], key[0]), interpolation=cv2.INTER_NEAREST)
+            self._roi_cache[key] = roi
+
+        return roi
 
     def _check_temporal_consistency(self, timestamp):
+        if self.fire_start_time is None and self._resume_candidate is not None:
+            # Candidate was already this old when the snapshot was taken
+            self.fire_start_time = timestamp - self._resume_candidate
+            self._resume_candidate = None
+
         if self.fire_start_time is None:
             self.fire_start_time = timestamp
             return False
 
         return (timestamp - self.fire_start_time) >= self.min_fire_duration
 
+    # -------------------------------------------------
+    # LIVE PARAMETERS
+    # -------------------------------------------------
+    def update_params(self, **params):
+        """
+        Queues new parameter values from any thread. No lock: a new
+        snapshot (values not applied yet + these) replaces the old one
+        in a single assignment, and the processing thread applies the
+        latest snapshot before its next frame. Assumes one writer.
+        Values are validated and coerced here, on the writer's side.
+        """
+        params = super().update_params(**params)
+
+        version, pending = self._param_snapshot
+        if self._applied_version == version:
+            pending = {}  # already applied: only the new delta is queued
+        self._param_snapshot = (version + 1, {**pending, **params})
+
+    def params(self):
+        return {
+            "min_fire_duration": self.min_fire_duration,
+            "min_fire_area": self.min_fire_area,
+            "confidence_threshold": self.confidence_threshold,
+            "smoothing_window": self.confidence_buffer.maxlen,
+            "persistence_ratio": self.persistence_ratio,
+            "hsv_lower": self.hsv_lower.tolist(),
+            "hsv_upper": self.hsv_upper.tolist(),
+            "mog2_history": self.bg_subtractor.getHistory(),
+            "mog2_var_threshold": self.bg_subtractor.getVarThreshold(),
+            "flicker_threshold": self.flicker_threshold,
+            "verifier_threshold": self.verifier_threshold
+        }
+
+    def _apply_params(self):
+        """
+        Processing thread only. Derived state is adjusted in place:
+        MOG2 keeps its model (setHistory / setVarThreshold), the
+        temporal buffers keep their most recent samples and the color
+        LUT is rebuilt only if the HSV bounds changed.
+        """
+        version, params = self._param_snapshot
+
+        for name in ("min_fire_duration", "min_fire_area", "confidence_threshold",
+                     "persistence_ratio", "flicker_threshold", "verifier_threshold"):
+            if name in params:
+                setattr(self, name, params[name])
+
+        if "hsv_lower" in params:
+            self.hsv_lower = np.array(params["hsv_lower"])
+        if "hsv_upper" in params:
+            self.hsv_upper = np.array(params["hsv_upper"])
+        if self._color_lut is not None:
+            self._color_lut.set_bounds(self.hsv_lower, self.hsv_upper)
+
+        window = params.get("smoothing_window")
+        if window and window != self.confidence_buffer.maxlen:
+            self.confidence_buffer = deque(self.confidence_buffer, maxlen=window)
+            self.fire_presence_buffer = deque(self.fire_presence_buffer, maxlen=window)
+
+        for subtractor in (self.bg_subtractor, self._audit_subtractor):
+            if subtractor is None:
+                continue
+            if "mog2_history" in params:
+                subtractor.setHistory(int(params["mog2_history"]))
+            if "mog2_var_threshold" in params:
+                subtractor.setVarThreshold(float(params["mog2_var_threshold"]))
+
+        self._applied_version = version
+
+    # -------------------------------------------------
+    # SNAPSHOT / WARM START
+    # -------------------------------------------------
+    def save_snapshot(self, path):
+        """
+        Writes the MOG2 background image, its parameters and the
+        temporal buffers to path (.npz), atomically (tmp + rename).
+        Call from the processing thread, between frames.
+        """
+        background = self.bg_subtractor.getBackgroundImage()
+        if background is None:
+            return False
+
+        candidate = None
+        if self.fire_start_time is not None and self._last_timestamp is not None:
+            candidate = self._last_timestamp - self.fire_start_time
+
+        meta = {
+            "saved_at": time.time(),
+            "params": self.params(),
+            "frames_seen": len(self.confidence_buffer),
+            "confidence_buffer": [float(v) for v in self.confidence_buffer],
+            "fire_presence_buffer": [int(v) for v in self.fire_presence_buffer],
+            "candidate_age": candidate
+        }
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, background=background, meta=np.array(json.dumps(meta)))
+        os.replace(tmp, path)
+        return True
+
+    def load_snapshot(self, path, max_state_age=30.0):
+        """
+        Warm-starts from a snapshot written by save_snapshot():
+        - The MOG2 model is seeded with the saved background
+          (learningRate=1) and from then on learns at 1/history, as a
+          converged model would (MOG2's start-up rate would otherwise
+          absorb the first foreground objects)
+        - The configured parameters are kept; those in the snapshot
+          are informational only
+        - Temporal buffers and a pending fire candidate are restored
+          only if the snapshot is younger than max_state_age seconds
+        Returns the snapshot age in seconds, or None if nothing was loaded.
+        """
+        try:
+            with np.load(path) as data:
+                background = data["background"]
+                meta = json.loads(str(data["meta"]))
+        except (OSError, ValueError, KeyError):
+            return None
+
+        self.bg_subtractor.apply(background, learningRate=1)
+        self._warm_started = True
+
+        age = max(0.0, time.time() - meta.get("saved_at", 0.0))
+        if age <= max_state_age:
+            self.confidence_buffer.extend(meta.get("confidence_buffer", []))
+            self.fire_presence_buffer.extend(meta.get("fire_presence_buffer", []))
+            candidate = meta.get("candidate_age")
+            if candidate is not None:
+                self._resume_candidate = candidate + age
+
+        return age
+
     # -------------------------------------------------
     # RESET
     # -------------------------------------------------
     def reset(self):
         self.fire_start_time = None
+        self._resume_candidate = None
         self.alert_sent = False
         self.confidence_buffer.clear()
         self.fire_presence_buffer.clear()
+        if self.tracker is not None:
+            self.tracker.reset()
+        self._flicker_scores = {}
+        if self.verifier is not None:
+            self.verifier.forget(self.camera_id)
@@ -0,0 +1,143 @@
+import cv2
+import numpy as np
+
+
+class FlickerAnalyzer:
+    """
+    Flicker-frequency stage for tracked fire regions:
+    - Keeps a preallocated uint8 ring of recent luminance patches, only
+      for live tracks (one row per RegionTracker slot), never full frames
+    - Scores each track by the share of its temporal luminance energy
+      that falls in the flame band (default 1-12 Hz), via a vectorized
+      FFT over the patch pixels or a cheaper zero-crossing count
+    - memory_budget (bytes) sets how many frames of history fit
+
+    A waving flag or a moving vest changes position, not brightness at
+    flame rates, so its band share stays low.
+    """
+
+    def __init__(self,
+                 capacity=32,
+                 patch_size=(16, 16),
+                 memory_budget=512 * 1024,
+                 band=(1.0, 12.0),
+                 method="fft",
+                 min_samples=16,
+                 min_std=2.0):
+
+        if method not in ("fft", "zero_crossing"):
+            raise ValueError(f"Unsupported flicker method: {method}")
+
+        self.capacity = capacity
+        self.patch_size = tuple(patch_size)  # (width, height)
+        self.band = band
+        self.method = method
+        self.min_std = min_std
+
+        pixels = self.patch_size[0] * self.patch_size[1]
+        self.history = int(max(8, min(256, memory_budget // (capacity * pixels))))
+        self.min_samples = min(min_samples, self.history)
+
+        # Ring buffers, written at count % history
+        self.patches = np.zeros((capacity, self.history, pixels), dtype=np.uint8)
+        self.times = np.zeros((capacity, self.history), dtype=np.float64)
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.track_ids = np.zeros(capacity, dtype=np.int64)
+
+    # -------------------------------------------------
+    # SAMPLING
+    # -------------------------------------------------
+    def sample(self, frame, tracker, slots, timestamp):
+        """
+        Stores the current luminance patch of every live track
+        (at its last known box, so a flame going dark still counts).
+        """
+        h, w = frame.shape[:2]
+
+        for slot in slots:
+            # Slot reused by a new track: start its history over
+            if self.track_ids[slot] != tracker.ids[slot]:
+                self.track_ids[slot] = tracker.ids[slot]
+                self.count[slot] = 0
+
+            x1, y1, x2, y2 = tracker.boxes[slot]
+            x1, y1 = max(0, int(x1)), max(0, int(y1))
+            x2, y2 = min(w, int(x2)), min(h, int(y2))
+            if x2 <= x1 or y2 <= y1:
+                continue
+
+            luma = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY)
+            patch = cv2.resize(luma, self.patch_size, interpolation=cv2.INTER_AREA)
+
+            cursor = self.count[slot] % self.history
+            self.patches[slot, cursor] = patch.ravel()
+            self.times[slot, cursor] = timestamp
+            self.count[slot] += 1
+
+    # -------------------------------------------------
+    # SCORING
+    # -------------------------------------------------
+    def scores(self, slots):
+        """
+        Flicker score in [0, 1] per slot; 0 until min_samples frames
+        have been collected.
+        """
+        result = np.zeros(len(slots))
+
+        for i, slot in enumerate(slots):
+            n = int(min(self.count[slot], self.history))
+            if n < self.min_samples:
+                continue
+
+            # Oldest first
+            order = (np.arange(self.count[slot] - n, self.count[slot])) % self.history
+            signal = self.patches[slot, order].astype(np.float32)  # (n, pixels)
+            times = self.times[slot, order]
+
+            span = times[-1] - times[0]
+            if span <= 0:
+                continue
+            rate = (n - 1) / span
+
+            signal -= signal.mean(axis=0)
+            std = signal.std(axis=0)
+            active = std >= self.min_std
+            if not active.any():
+                continue
+
+            if self.method == "fft":
+                result[i] = self._band_share(signal[:, active], rate)
+            else:
+                result[i] = self._crossing_share(signal[:, active], rate)
+
+        return result
+
+    def _band_share(self, signal, rate):
+        """
+        Fraction of (non-DC) spectral energy inside the band, pooled
+        over the patch pixels.
+        """
+        power = np.abs(np.fft.rfft(signal, axis=0)) ** 2
+        freqs = np.fft.rfftfreq(signal.shape[0], d=1.0 / rate)
+
+        total = power[1:].sum()
+        if total <= 0:
+            return 0.0
+
+        low, high = self.band
+        in_band = (freqs >= low) & (freqs <= high)
+        return float(power[in_band].sum() / total)
+
+    def _crossing_share(self, signal, rate):
+        """
+        Share of pixels whose zero-crossing frequency lies in the band.
+        """
+        above = signal > 0
+        crossings = (above[1:] != above[:-1]).sum(axis=0)
+        freq = crossings * rate / (2 * (signal.shape[0] - 1))
+
+        low, high = self.band
+        return float(((freq >= low) & (freq <= high)).mean())
+
+    def nbytes(self):
+        return self.patches.nbytes + self.times.nbytes
@@ -0,0 +1,189 @@
+import cv2
+import numpy as np
+
+try:
+    import onnxruntime as ort
+except ImportError:  # optional dependency
+    ort = None
+
+
+class OnnxVerifier:
+    """
+    Second-stage fire classifier (small ONNX model, CPU):
+    - Only sees crops of tracked regions that already passed the
+      color / motion / temporal gates
+    - Crops are queued with submit() and classified together in flush(),
+      so one inference call covers every region (and, in the
+      multi-stream engine, every camera of a worker)
+    - Results are cached per (camera, track) and re-checked every
+      recheck_interval seconds (source/frame timestamps); the previous
+      verdict stands until the re-check has run
+
+    One session is shared per process and model (see shared()).
+    """
+
+    _shared = {}
+
+    def __init__(self,
+                 model_path,
+                 input_size=None,
+                 mean=(0.485, 0.456, 0.406),
+                 std=(0.229, 0.224, 0.225),
+                 fire_index=1,
+                 max_batch=16,
+                 padding=0.1,
+                 recheck_interval=5.0,
+                 max_cache=256,
+                 threads=1):
+
+        if ort is None:
+            raise ImportError("onnxruntime is required for the ONNX verifier "
+                              "(pip install onnxruntime)")
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(
+            model_path, options, providers=["CPUExecutionProvider"]
+        )
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        batch_dim, _, height, width = model_input.shape
+
+        # Static model shapes win over the argument
+        if isinstance(height, int) and isinstance(width, int):
+            input_size = (width, height)
+        self.input_size = tuple(input_size or (64, 64))
+
+        # Models exported with a fixed batch of 1 get one crop per call
+        self.max_batch = 1 if batch_dim == 1 else max_batch
+
+        self.mean = np.array(mean, dtype=np.float32).reshape(1, 3, 1, 1)
+        self.std = np.array(std, dtype=np.float32).reshape(1, 3, 1, 1)
+        self.fire_index = fire_index
+        self.padding = padding
+        self.recheck_interval = recheck_interval
+        self.max_cache = max_cache
+
+        # Multi-stream workers flush once per drained queue instead
+        self.autoflush = True
+
+        self._pending = {}  # key -> (crop, timestamp)
+        self._cache = {}    # key -> (probability, timestamp)
+
+        # Counters
+        self.inferences = 0
+        self.crops = 0
+        self.cache_hits = 0
+
+    @classmethod
+    def shared(cls, model_path, **kwargs):
+        verifier = cls._shared.get(model_path)
+        if verifier is None:
+            verifier = cls._shared[model_path] = cls(model_path, **kwargs)
+        return verifier
+
+    # -------------------------------------------------
+    # CACHE / QUEUE
+    # -------------------------------------------------
+    def lookup(self, key, timestamp):
+        """
+        Returns (probability, due): the last fire probability of a track
+        (None if it has never been verified) and whether it should be
+        (re-)submitted. A verdict due for a re-check is still returned,
+        so a confirmed fire does not drop out while the crop is queued.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None, True
+
+        probability, verified_at = entry
+        if timestamp - verified_at > self.recheck_interval or timestamp < verified_at:
+            return probability, True
+
+        self.cache_hits += 1
+        return probability, False
+
+    def submit(self, key, frame, box, timestamp):
+        """
+        Queues one region crop for the next flush(); box is (x, y, w, h).
+        """
+        if key in self._pending:
+            return
+
+        x, y, w, h = box
+        pad_x, pad_y = int(w * self.padding), int(h * self.padding)
+        fh, fw = frame.shape[:2]
+        x1, y1 = max(0, x - pad_x), max(0, y - pad_y)
+        x2, y2 = min(fw, x + w + pad_x), min(fh, y + h + pad_y)
+        if x2 <= x1 or y2 <= y1:
+            return
+
+        crop = cv2.resize(frame[y1:y2, x1:x2], self.input_size, interpolation=cv2.INTER_AREA)
+        self._pending[key] = (crop, timestamp)
+
+    def pending(self):
+        return len(self._pending)
+
+    def forget(self, camera):
+        """
+        Drops cached results of one camera (after reset()).
+        """
+        for key in [k for k in self._cache if k[0] == camera]:
+            del self._cache[key]
+        for key in [k for k in self._pending if k[0] == camera]:
+            del self._pending[key]
+
+    # -------------------------------------------------
+    # INFERENCE
+    # -------------------------------------------------
+    def flush(self):
+        """
+        Classifies every queued crop in batches of max_batch.
+        """
+        if not self._pending:
+            return
+
+        keys = list(self._pending)
+        crops = np.stack([self._pending[k][0] for k in keys])
+        stamps = [self._pending[k][1] for k in keys]
+        self._pending.clear()
+
+        # BGR uint8 NHWC -> normalized RGB float32 NCHW
+        batch = crops[..., ::-1].transpose(0, 3, 1, 2).astype(np.float32) / 255.0
+        batch = (batch - self.mean) / self.std
+
+        probabilities = []
+        for start in range(0, len(batch), self.max_batch):
+            chunk = np.ascontiguousarray(batch[start:start + self.max_batch])
+            output = self.session.run(None, {self.input_name: chunk})[0]
+            probabilities.extend(self._fire_probability(output))
+            self.inferences += 1
+
+        self.crops += len(keys)
+
+        for key, probability, timestamp in zip(keys, probabilities, stamps):
+            self._cache.pop(key, None)
+            self._cache[key] = (probability, timestamp)
+
+        # Oldest verifications go first
+        while len(self._cache) > self.max_cache:
+            del self._cache[next(iter(self._cache))]
+
+    def _fire_probability(self, output):
+        output = np.asarray(output, dtype=np.float32).reshape(len(output), -1)
+
+        # Single logit: sigmoid; several classes: softmax
+        if output.shape[1] == 1:
+            return (1.0 / (1.0 + np.exp(-output[:, 0]))).tolist()
+
+        shifted = np.exp(output - output.max(axis=1, keepdims=True))
+        return (shifted[:, self.fire_index] / shifted.sum(axis=1)).tolist()
+
+    def stats(self):
+        return {
+            "inferences": self.inferences,
+            "crops": self.crops,
+            "cache_hits": self.cache_hits,
+            "cached": len(self._cache)
+        }
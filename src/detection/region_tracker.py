@@ -0,0 +1,316 @@
+import numpy as np
+
+
+class RegionTracker:
+    """
+    Lightweight multi-object tracker for fire regions:
+    - Fixed-capacity, array-backed track table (no per-track objects)
+    - Blobs close to each other are grouped into one region first
+      (a flame often segments into several pieces)
+    - Greedy IoU association, centroid distance as fallback
+    - Per-track id, age, growth rate and flicker frequency
+    - Per-track area history so confidence, persistence and duration
+      are judged per region instead of on the summed frame area
+
+    A track survives up to max_misses consecutive frames without a
+    matching region (flames flicker), which then count as zero area.
+    """
+
+    def __init__(self,
+                 capacity=32,
+                 history=32,
+                 iou_threshold=0.2,
+                 max_distance=1.0,
+                 max_misses=3,
+                 merge_gap=0.5):
+
+        self.capacity = capacity
+        self.history = history
+        self.iou_threshold = iou_threshold
+        self.max_distance = max_distance
+        self.max_misses = max_misses
+        self.merge_gap = merge_gap
+
+        # Track table (one row per slot)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.boxes = np.zeros((capacity, 4), dtype=np.float32)  # x1, y1, x2, y2
+        self.first_seen = np.zeros(capacity, dtype=np.float64)
+        self.age = np.zeros(capacity, dtype=np.int64)           # frames tracked
+        self.misses = np.zeros(capacity, dtype=np.int32)        # consecutive
+
+        # Per-track ring buffers, written at age % history
+        self.area_history = np.zeros((capacity, history), dtype=np.float32)
+        self.time_history = np.zeros((capacity, history), dtype=np.float64)
+
+        self._next_id = 1
+
+    # -------------------------------------------------
+    # UPDATE
+    # -------------------------------------------------
+    def update(self, boxes, areas, timestamp):
+        """
+        boxes: list of (x, y, w, h); areas: matching contour areas.
+        Returns the slot assigned to each box (-1 if the table was full
+        of tracks seen this frame).
+        """
+        detections = np.array(
+            [(x, y, x + w, y + h) for x, y, w, h in boxes], dtype=np.float32
+        ).reshape(-1, 4)
+        detections, areas, groups = self._group(detections, list(areas))
+        live = np.flatnonzero(self.active)
+
+        matches = self._associate(live, detections)
+        assigned = [-1] * len(detections)
+        matched_slots = set()
+
+        for slot, det in matches:
+            assigned[det] = int(slot)
+            matched_slots.add(slot)
+            self.boxes[slot] = detections[det]
+            self.misses[slot] = 0
+            self._push(slot, areas[det], timestamp)
+
+        # Unmatched tracks: a zero-area sample, dropped after max_misses
+        for slot in live:
+            if slot in matched_slots:
+                continue
+            self.misses[slot] += 1
+            if self.misses[slot] > self.max_misses:
+                self.active[slot] = False
+            else:
+                self._push(slot, 0.0, timestamp)
+
+        # Unmatched regions start new tracks (if a slot can be had)
+        for det, slot in enumerate(assigned):
+            if slot < 0:
+                slot = self._allocate(detections[det], timestamp)
+                if slot < 0:
+                    continue
+                self._push(slot, areas[det], timestamp)
+                assigned[det] = slot
+
+        return [assigned[group] for group in groups]
+
+    def _group(self, detections, areas):
+        """
+        Merges blobs whose boxes, grown by merge_gap x their smaller
+        side, overlap. Returns region boxes, summed areas and the
+        region index of every input blob.
+        """
+        n = len(detections)
+        parent = list(range(n))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        if n > 1 and self.merge_gap > 0:
+            size = np.minimum(detections[:, 2] - detections[:, 0],
+                              detections[:, 3] - detections[:, 1])
+            grown = detections + np.outer(size * self.merge_gap, (-1, -1, 1, 1))
+
+            overlap = ((grown[:, None, 0] < grown[None, :, 2]) &
+                       (grown[None, :, 0] < grown[:, None, 2]) &
+                       (grown[:, None, 1] < grown[None, :, 3]) &
+                       (grown[None, :, 1] < grown[:, None, 3]))
+
+            for i, j in zip(*np.nonzero(np.triu(overlap, 1))):
+                parent[find(i)] = find(j)
+
+        roots = {}
+        merged = []
+        merged_areas = []
+        groups = []
+        for i in range(n):
+            root = find(i)
+            if root not in roots:
+                roots[root] = len(merged)
+                merged.append(detections[i].copy())
+                merged_areas.append(0.0)
+            g = roots[root]
+            box = merged[g]
+            box[:2] = np.minimum(box[:2], detections[i, :2])
+            box[2:] = np.maximum(box[2:], detections[i, 2:])
+            merged_areas[g] += areas[i]
+            groups.append(g)
+
+        return np.array(merged, dtype=np.float32).reshape(-1, 4), merged_areas, groups
+
+    def _associate(self, live, detections):
+        if not len(live) or not len(detections):
+            return []
+
+        tracks = self.boxes[live]
+        matches = []
+
+        # IoU (tracks x detections)
+        x1 = np.maximum(tracks[:, None, 0], detections[None, :, 0])
+        y1 = np.maximum(tracks[:, None, 1], detections[None, :, 1])
+        x2 = np.minimum(tracks[:, None, 2], detections[None, :, 2])
+        y2 = np.minimum(tracks[:, None, 3], detections[None, :, 3])
+        inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+
+        track_area = (tracks[:, 2] - tracks[:, 0]) * (tracks[:, 3] - tracks[:, 1])
+        det_area = (detections[:, 2] - detections[:, 0]) * (detections[:, 3] - detections[:, 1])
+        iou = inter / (track_area[:, None] + det_area[None, :] - inter + 1e-5)
+
+        matches.extend(self._greedy(iou, self.iou_threshold, maximize=True))
+
+        # Centroid distance (in track diagonals) for what IoU left over
+        track_center = (tracks[:, :2] + tracks[:, 2:]) / 2
+        det_center = (detections[:, :2] + detections[:, 2:]) / 2
+        diagonal = np.hypot(tracks[:, 2] - tracks[:, 0], tracks[:, 3] - tracks[:, 1]) + 1e-5
+        distance = np.linalg.norm(
+            track_center[:, None, :] - det_center[None, :, :], axis=2
+        ) / diagonal[:, None]
+
+        for t, d in matches:
+            distance[t, :] = np.inf
+            distance[:, d] = np.inf
+
+        matches.extend(self._greedy(distance, self.max_distance, maximize=False))
+
+        return [(live[t], d) for t, d in matches]
+
+    @staticmethod
+    def _greedy(score, threshold, maximize):
+        score = score.copy() if maximize else -score
+        limit = threshold if maximize else -threshold
+        pairs = []
+
+        while score.size:
+            t, d = np.unravel_index(np.argmax(score), score.shape)
+            if score[t, d] < limit or not np.isfinite(score[t, d]):
+                break
+            pairs.append((int(t), int(d)))
+            score[t, :] = -np.inf
+            score[:, d] = -np.inf
+
+        return pairs
+
+    def _allocate(self, box, timestamp):
+        free = np.flatnonzero(~self.active)
+        if len(free):
+            slot = int(free[0])
+        else:
+            # Table full: evict the track that has been missing longest,
+            # never one matched (or created) in this update
+            missing = np.flatnonzero(self.misses > 0)
+            if not len(missing):
+                return -1
+            slot = int(missing[np.argmax(self.misses[missing])])
+
+        self.active[slot] = True
+        self.ids[slot] = self._next_id
+        self._next_id += 1
+        self.boxes[slot] = box
+        self.first_seen[slot] = timestamp
+        self.age[slot] = 0
+        self.misses[slot] = 0
+        self.area_history[slot] = 0.0
+        self.time_history[slot] = timestamp
+        return slot
+
+    def _push(self, slot, area, timestamp):
+        cursor = self.age[slot] % self.history
+        self.area_history[slot, cursor] = area
+        self.time_history[slot, cursor] = timestamp
+        self.age[slot] += 1
+
+    # -------------------------------------------------
+    # PER-TRACK MEASURES (VECTORIZED OVER SLOTS)
+    # -------------------------------------------------
+    def live_slots(self):
+        return np.flatnonzero(self.active)
+
+    def window(self, slots, n):
+        """
+        Last n area samples per slot (newest last) and a validity mask
+        for tracks younger than n frames.
+        """
+        n = min(n, self.history)
+        ages = self.age[slots]
+        offsets = np.arange(n - 1, -1, -1)
+        frames = ages[:, None] - 1 - offsets[None, :]
+        valid = frames >= 0
+        columns = np.where(valid, frames, 0) % self.history
+        areas = self.area_history[slots[:, None], columns]
+        times = self.time_history[slots[:, None], columns]
+        return areas, times, valid
+
+    def confidence(self, slots, min_area, n):
+        """
+        Smoothed confidence and persistence per slot over the last n
+        frames, on the same scale as the frame-level logic.
+        """
+        areas, _, valid = self.window(slots, n)
+        count = np.maximum(valid.sum(axis=1), 1)
+        raw = np.minimum(1.0, areas / (min_area * 3)) * valid
+        present = (areas >= min_area) & valid
+        return raw.sum(axis=1) / count, present.sum(axis=1) / count
+
+    def growth_rate(self, slots):
+        """
+        Relative area growth per second (least-squares slope / mean area)
+        over the observed history, zero-area misses excluded.
+        """
+        areas, times, valid = self.window(slots, self.history)
+        valid &= areas > 0
+        rates = np.zeros(len(slots))
+
+        for i in range(len(slots)):
+            a, t = areas[i][valid[i]], times[i][valid[i]]
+            if len(a) < 3 or t[-1] == t[0]:
+                continue
+            t = t - t.mean()
+            slope = (t * (a - a.mean())).sum() / ((t * t).sum() + 1e-9)
+            rates[i] = slope / (a.mean() + 1e-9)
+
+        return rates
+
+    def flicker_frequency(self, slots):
+        """
+        Area oscillation frequency in Hz: crossings of the mean area
+        over the observed history, two crossings per cycle.
+        """
+        areas, times, valid = self.window(slots, self.history)
+        count = np.maximum(valid.sum(axis=1), 1)
+        mean = (areas * valid).sum(axis=1) / count
+
+        above = areas > mean[:, None]
+        crossings = ((above[:, 1:] != above[:, :-1]) & valid[:, 1:] & valid[:, :-1]).sum(axis=1)
+
+        span = times[:, -1] - np.where(valid, times, np.inf).min(axis=1)
+        return np.where(span > 0, crossings / (2 * np.where(span > 0, span, 1)), 0.0)
+
+    def tracks(self):
+        """
+        Snapshot of the live tracks for logging / display.
+        """
+        slots = self.live_slots()
+        if not len(slots):
+            return []
+
+        growth = self.growth_rate(slots)
+        flicker = self.flicker_frequency(slots)
+
+        snapshot = []
+        for i, slot in enumerate(slots):
+            x1, y1, x2, y2 = self.boxes[slot]
+            snapshot.append({
+                "id": int(self.ids[slot]),
+                "box": (int(x1), int(y1), int(x2 - x1), int(y2 - y1)),
+                "age": int(self.age[slot]),
+                "misses": int(self.misses[slot]),
+                "first_seen": float(self.first_seen[slot]),
+                "growth_rate": float(growth[i]),
+                "flicker_hz": float(flicker[i])
+            })
+        return snapshot
+
+    def reset(self):
+        self.active[:] = False
+        self.misses[:] = 0
@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+
+
+class ConfigWatcher:
+    """
+    Watches a JSON config file and reports parameter changes:
+    - Polls the file's mtime (no extra dependencies, works on network shares)
+    - Calls on_change(params, stream_id) with only the values that changed;
+      stream_id is None for site-wide values
+    - A file that fails to parse is skipped until it is fixed; a section
+      on_change rejects (ValueError) is retried in full with the next edit
+
+    File format:
+        {
+          "confidence_threshold": 0.7,
+          "hsv_lower": [0, 110, 70],
+          "cameras": {"cam3": {"min_fire_area": 900}}
+        }
+    """
+
+    def __init__(self, path, on_change, interval=1.0, on_error=None):
+        self.path = path
+        self.on_change = on_change
+        self.on_error = on_error
+        self.interval = interval
+
+        self._mtime = None
+        self._current = {}  # stream_id (None = site) -> params
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.poll()
+        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _watch_loop(self):
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def poll(self):
+        """
+        Reloads the file if it changed. Returns True if it was reloaded.
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+        if mtime == self._mtime:
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            # Half-written or invalid: retry on the next modification
+            self._mtime = mtime
+            if self.on_error:
+                self.on_error(f"Config not loaded ({e})")
+            return False
+
+        self._mtime = mtime
+
+        cameras = config.pop("cameras", {}) or {}
+        sections = {None: config}
+        sections.update(cameras)
+
+        for stream_id, params in sections.items():
+            previous = self._current.get(stream_id, {})
+            changed = {k: v for k, v in params.items() if previous.get(k) != v}
+            if not changed:
+                continue
+
+            try:
+                self.on_change(changed, stream_id)
+            except ValueError as e:
+                # Keep the last applied values, so the whole section
+                # counts as changed again once the file is fixed
+                if self.on_error:
+                    self.on_error(f"Config rejected ({e})")
+                continue
+
+            self._current[stream_id] = dict(params)
+
+        return True
@@ -0,0 +1,116 @@
+import math
+import time
+
+
+class FrameScheduler:
+    """
+    Paces the processing loop instead of a fixed sleep:
+    - Targets a display frame rate (target_fps)
+    - Detects at idle_detect_fps while no fire candidate is active
+    - Detects on every frame while a fire candidate is active
+    - Skips detection adaptively when detection can't keep up
+
+    Replay passes each frame's source timestamp to should_detect():
+    idle spacing is then measured in footage time and never widened
+    for load, so a clip detects the same frames on every run.
+    """
+
+    def __init__(self,
+                 target_fps=30,
+                 idle_detect_fps=5,
+                 max_detect_duty=0.5,
+                 smoothing=0.2):
+
+        self.frame_interval = 1.0 / target_fps if target_fps else 0.0
+        self.idle_interval = 1.0 / idle_detect_fps if idle_detect_fps else 0.0
+        self.max_detect_duty = max_detect_duty
+        self.smoothing = smoothing
+
+        # Measured costs (exponential moving averages, seconds)
+        self.avg_detect_time = 0.0
+        self.avg_frame_time = 0.0
+
+        self._frame_start = None
+        self._last_detect = None
+        self._last_timestamp = None
+
+        # Counters
+        self.frames = 0
+        self.detections = 0
+        self.skipped = 0
+
+    # -------------------------------------------------
+    # PER-FRAME API
+    # -------------------------------------------------
+    def begin_frame(self):
+        self._frame_start = time.perf_counter()
+        self.frames += 1
+
+    def should_detect(self, candidate_active=False, timestamp=None):
+        if timestamp is None:
+            now = time.perf_counter()
+            spacing, frame_interval = self._detect_spacing(), self.frame_interval
+        else:
+            previous, self._last_timestamp = self._last_timestamp, timestamp
+            now, spacing = timestamp, self.idle_interval
+            frame_interval = timestamp - previous if previous is not None else 0.0
+
+        if candidate_active or self._last_detect is None:
+            return self._accept(now)
+
+        # Half a frame of slack so jitter doesn't push detection a frame late
+        if (now - self._last_detect) + frame_interval / 2 >= spacing:
+            return self._accept(now)
+
+        self.skipped += 1
+        return False
+
+    def record_detection(self, duration):
+        self.avg_detect_time = self._ema(self.avg_detect_time, duration)
+
+    def wait(self):
+        """
+        Sleeps for whatever is left of the frame budget.
+        """
+        if self._frame_start is None:
+            return
+
+        elapsed = time.perf_counter() - self._frame_start
+        self.avg_frame_time = self._ema(self.avg_frame_time, elapsed)
+
+        remaining = self.frame_interval - elapsed
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "detections": self.detections,
+            "skipped": self.skipped,
+            "avg_detect_ms": self.avg_detect_time * 1000,
+            "avg_frame_ms": self.avg_frame_time * 1000
+        }
+
+    # -------------------------------------------------
+    # INTERNAL
+    # -------------------------------------------------
+    def _accept(self, now):
+        self._last_detect = now
+        self.detections += 1
+        return True
+
+    def _detect_spacing(self):
+        spacing = self.idle_interval
+
+        # Overloaded: keep detection below max_detect_duty of wall time
+        if self.frame_interval and self.avg_detect_time > self.frame_interval:
+            budget = self.avg_detect_time / self.max_detect_duty
+            frames = math.ceil(budget / self.frame_interval)
+            spacing = max(spacing, frames * self.frame_interval)
+
+        return spacing
+
+    def _ema(self, current, sample):
+        if current == 0.0:
+            return sample
+        return current + self.smoothing * (sample - current)
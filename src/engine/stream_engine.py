@@ -0,0 +1,581 @@
+import hashlib
+import math
+import multiprocessing as mp
+import os
+import queue
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from video_input.video_stream import VideoInput
+from detection.backends import create_backend
+from metrics.pipeline_metrics import StageRecorder
+
+
+def snapshot_path(snapshot_dir, source_type, source_value, stream_id=None):
+    """
+    Snapshot file for one camera source; the source is part of the key
+    so a background is never restored onto a different scene.
+    """
+    key = hashlib.sha1(f"{source_type}|{source_value}".encode("utf-8")).hexdigest()[:12]
+    name = f"{stream_id}-{key}.npz" if stream_id is not None else f"{key}.npz"
+    return os.path.join(snapshot_dir, name)
+
+
+# -------------------------------------------------
+# WORKER PROCESS
+# -------------------------------------------------
+def _detection_worker(task_queue, result_queue, profile=False):
+    """
+    Runs inside a worker process.
+    Owns one detector backend per stream pinned to this worker, so the
+    MOG2 background model and temporal buffers never leave the process.
+    With profile=True, per-stage timings travel back with each result.
+
+    Detectors with an ONNX verifier share one session per process; its
+    queued crops are classified in one batch across all cameras once the
+    task queue is drained (or after one frame per camera).
+
+    Streams added with a snapshot path warm-start from it, snapshot
+    every interval seconds and once more when removed.
+
+    Frames arrive as shared-memory block names; blocks stay mapped
+    until their stream is removed.
+
+    A task that raises drops that stream's detector and reports
+    ("error", stream_id, seq, message); the worker keeps serving its
+    other streams.
+    """
+    detectors = {}
+    blocks = {}  # stream_id -> {block name: SharedMemory}
+    verifiers = []
+    snapshots = {}  # stream_id -> [path, interval, last saved]
+    recorder = StageRecorder() if profile else None
+    since_flush = 0
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            for stream_blocks in blocks.values():
+                _close_blocks(stream_blocks)
+            break
+
+        kind, stream_id, payload = task
+        try:
+            if kind == "frame":
+                seq, name, shape, dtype, timestamp = payload
+                detector = detectors.get(stream_id)
+                if detector is None:
+                    continue
+
+                stream_blocks = blocks.setdefault(stream_id, {})
+                block = stream_blocks.get(name)
+                if block is None:
+                    try:
+                        block = stream_blocks[name] = shared_memory.SharedMemory(name=name)
+                    except FileNotFoundError:
+                        continue  # stream removed while the frame was queued
+
+                # Detectors copy what they keep, so a view is enough
+                fire, confidence, boxes = detector.process_frame(
+                    np.ndarray(shape, dtype, buffer=block.buf), timestamp
+                )
+                timings = recorder.pop() if recorder is not None else None
+                result_queue.put(("result", stream_id, seq, bool(fire), float(confidence), list(boxes), timings))
+
+                snapshot = snapshots.get(stream_id)
+                if snapshot and time.monotonic() - snapshot[2] >= snapshot[1]:
+                    _save_snapshot(detector, snapshot)
+
+                since_flush += 1
+                if verifiers and (since_flush >= len(detectors) or task_queue.empty()):
+                    for verifier in verifiers:
+                        verifier.flush()
+                    since_flush = 0
+
+            elif kind == "add":
+                backend, kwargs, snapshot = payload
+                detector = detectors[stream_id] = create_backend(backend, **kwargs)
+                detector.camera_id = stream_id
+                detector.metrics = recorder
+
+                if snapshot is not None and detector.supports_snapshots:
+                    path, interval = snapshot
+                    detector.load_snapshot(path)
+                    snapshots[stream_id] = [path, interval, time.monotonic()]
+
+                verifier = getattr(detector, "verifier", None)
+                if verifier is not None and verifier not in verifiers:
+                    verifier.autoflush = False
+                    verifiers.append(verifier)
+
+            elif kind == "params":
+                # Applied by the detector itself before its next frame;
+                # values were validated in the parent
+                if stream_id in detectors:
+                    detectors[stream_id].update_params(**payload)
+
+            elif kind == "reset":
+                if stream_id in detectors:
+                    detectors[stream_id].reset()
+
+            elif kind == "remove":
+                detector = detectors.pop(stream_id, None)
+                snapshot = snapshots.pop(stream_id, None)
+                if detector is not None and snapshot:
+                    _save_snapshot(detector, snapshot)
+                _close_blocks(blocks.pop(stream_id, {}))
+        except Exception as e:
+            detectors.pop(stream_id, None)
+            snapshots.pop(stream_id, None)
+            seq = payload[0] if kind == "frame" else None
+            result_queue.put(("error", stream_id, seq, f"{kind} failed: {e!r}"))
+
+
+def _save_snapshot(detector, snapshot):
+    snapshot[2] = time.monotonic()
+    try:
+        detector.save_snapshot(snapshot[0])
+    except OSError:
+        pass  # retried at the next interval
+
+
+def _close_blocks(stream_blocks):
+    for block in stream_blocks.values():
+        try:
+            block.close()
+        except BufferError:
+            pass  # a view is still alive; unmapped at process exit
+
+
+class _FrameSlots:
+    """
+    Shared-memory frame buffers of one stream, one per in-flight frame.
+    Frames are copied in once and mapped by the worker, instead of
+    being pickled through the task queue.
+    """
+
+    def __init__(self, count):
+        self._free = list(range(count))
+        self._blocks = [None] * count
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def put(self, frame):
+        """
+        Copies frame into a free slot. Returns (index, block name), or
+        None once closed. The caller holds one of the stream's in-flight
+        slots, so a free one always exists.
+        """
+        with self._lock:
+            if self.closed:
+                return None
+            index = self._free.pop()
+
+            block = self._blocks[index]
+            if block is None or block.size < frame.nbytes:
+                # First frame, or the resolution grew
+                if block is not None:
+                    _unlink(block)
+                block = self._blocks[index] = shared_memory.SharedMemory(
+                    create=True, size=frame.nbytes
+                )
+
+        np.copyto(np.ndarray(frame.shape, frame.dtype, buffer=block.buf), frame)
+        return index, block.name
+
+    def release(self, index):
+        with self._lock:
+            self._free.append(index)
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            for block in self._blocks:
+                if block is not None:
+                    _unlink(block)
+            self._blocks = []
+
+
+def _unlink(block):
+    block.close()
+    block.unlink()
+
+
+def _preview(frame, size):
+    """
+    Integer-strided copy no larger than roughly size (w, h).
+    Returns (preview, (step_x, step_y)).
+    """
+    if size is None:
+        return frame, (1, 1)
+
+    h, w = frame.shape[:2]
+    step_y, step_x = max(1, h // size[1]), max(1, w // size[0])
+    return np.ascontiguousarray(frame[::step_y, ::step_x]), (step_x, step_y)
+
+
+class _Stream:
+    """
+    Parent-side bookkeeping for one stream.
+    """
+
+    def __init__(self, stream_id, video_input, worker_index, max_in_flight):
+        self.stream_id = stream_id
+        self.video_input = video_input
+        self.worker_index = worker_index
+
+        self.running = True
+        self.thread = None
+        self.seq = 0
+
+        # Frames sent to a worker and waiting for their result
+        self.pending = {}
+        self.pending_lock = threading.Lock()
+        self.slots = threading.Semaphore(max_in_flight)
+        self.frames = _FrameSlots(max_in_flight)
+
+
+class MultiStreamEngine:
+    """
+    Runs many VideoInput streams through a shared pool of detector processes:
+    - One capture thread per stream
+    - Each stream pinned to one worker (keeps its own detector state)
+    - Frames reach workers through shared memory, not the task queue
+    - Results fanned back in per stream through on_result
+    - A stream whose detector fails (or whose worker died) is ended
+      through on_stream_error + on_stream_end; other streams go on
+    """
+
+    def __init__(self, num_workers=None, max_in_flight=2,
+                 on_result=None, on_stream_end=None, metrics=None,
+                 timestamp_mode="wall", snapshot_dir=None, snapshot_interval=60,
+                 keep_frames=True, preview_size=None, on_stream_error=None):
+        self.num_workers = num_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_in_flight = max_in_flight
+
+        # Callbacks: on_result(stream_id, frame, timestamp, fire, confidence, boxes)
+        #            on_stream_end(stream_id)
+        #            on_stream_error(stream_id, message)
+        self.on_result = on_result
+        self.on_stream_end = on_stream_end
+        self.on_stream_error = on_stream_error
+
+        # Frame handed to on_result: None without keep_frames (no UI),
+        # else a copy strided down to about preview_size (w, h) if set,
+        # with boxes scaled to match
+        self.keep_frames = keep_frames
+        self.preview_size = preview_size
+
+        # PipelineMetrics (optional): worker stage timings, round trip,
+        # in-flight frames, worker queue depth, dropped frames
+        self.metrics = metrics
+
+        # "source" replays files with container timestamps; capture is
+        # then unthreaded so back-pressure slows decoding instead of
+        # dropping frames
+        self.timestamp_mode = timestamp_mode
+
+        # Background model snapshots (None = disabled)
+        self.snapshot_dir = snapshot_dir
+        self.snapshot_interval = snapshot_interval
+
+        # mp.Queue.qsize() is not implemented on macOS (no sem_getvalue)
+        self._queue_depth = sys.platform != "darwin"
+
+        self._ctx = mp.get_context("spawn")
+        self._task_queues = []
+        self._workers = []
+        self._result_queue = None
+        self._collector = None
+
+        self.streams = {}
+        self.lock = threading.Lock()
+        self.running = False
+
+    # -------------------------------------------------
+    # LIFECYCLE
+    # -------------------------------------------------
+    def start(self):
+        if self.running:
+            return
+
+        self._result_queue = self._ctx.Queue()
+
+        for _ in range(self.num_workers):
+            task_queue = self._ctx.Queue()
+            worker = self._ctx.Process(
+                target=_detection_worker,
+                args=(task_queue, self._result_queue, self.metrics is not None),
+                daemon=True
+            )
+            worker.start()
+            self._task_queues.append(task_queue)
+            self._workers.append(worker)
+
+        self.running = True
+        self._collector = threading.Thread(target=self._collect_results, daemon=True)
+        self._collector.start()
+
+    def stop(self):
+        if not self.running:
+            return
+
+        for stream_id in list(self.streams):
+            self.remove_stream(stream_id)
+
+        self.running = False
+
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=2)
+            if worker.is_alive():
+                worker.terminate()
+
+        self._result_queue.put(None)
+        self._collector.join(timeout=2)
+
+        self._task_queues = []
+        self._workers = []
+        self._result_queue = None
+        self._collector = None
+
+    # -------------------------------------------------
+    # STREAM MANAGEMENT
+    # -------------------------------------------------
+    def add_stream(self, stream_id, source_type, source_value, backend="color", **detector_kwargs):
+        if not self.running:
+            self.start()
+
+        video_input = VideoInput(
+            source_type,
+            source_value,
+            threaded=(source_type == "Camera" and self.timestamp_mode == "wall"),
+            timestamp_mode=self.timestamp_mode
+        )
+        video_input.start()
+
+        with self.lock:
+            if stream_id in self.streams:
+                video_input.stop()
+                raise ValueError(f"Stream already exists: {stream_id}")
+
+            worker_index = self._least_loaded_worker()
+            if worker_index is None:
+                video_input.stop()
+                raise RuntimeError("No detector worker is running")
+            stream = _Stream(stream_id, video_input, worker_index, self.max_in_flight)
+            self.streams[stream_id] = stream
+
+        snapshot = None
+        if self.snapshot_dir:
+            path = snapshot_path(self.snapshot_dir, source_type, source_value, stream_id)
+            snapshot = (path, self.snapshot_interval)
+
+        self._task_queues[worker_index].put(("add", stream_id, (backend, detector_kwargs, snapshot)))
+
+        stream.thread = threading.Thread(
+            target=self._capture_loop,
+            args=(stream,),
+            daemon=True
+        )
+        stream.thread.start()
+
+    def remove_stream(self, stream_id):
+        with self.lock:
+            stream = self.streams.pop(stream_id, None)
+
+        if stream is None:
+            return
+
+        stream.running = False
+        if stream.thread and stream.thread is not threading.current_thread():
+            stream.thread.join(timeout=2)
+
+        stream.video_input.stop()
+        self._task_queues[stream.worker_index].put(("remove", stream_id, None))
+        stream.frames.close()
+
+    def reset_stream(self, stream_id):
+        stream = self.streams.get(stream_id)
+        if stream:
+            self._task_queues[stream.worker_index].put(("reset", stream_id, None))
+
+    def update_params(self, params, stream_id=None):
+        """
+        Sends new detector parameters to one stream (or all); the MOG2
+        model and temporal state of each detector are kept.
+        """
+        with self.lock:
+            streams = [self.streams[stream_id]] if stream_id in self.streams else (
+                list(self.streams.values()) if stream_id is None else []
+            )
+
+        for stream in streams:
+            self._task_queues[stream.worker_index].put(("params", stream.stream_id, dict(params)))
+
+    def reset_all(self):
+        for stream_id in list(self.streams):
+            self.reset_stream(stream_id)
+
+    def active_streams(self):
+        return sum(
+            1 for stream in list(self.streams.values())
+            if stream.thread and stream.thread.is_alive()
+        )
+
+    def _least_loaded_worker(self):
+        """
+        Index of the live worker with the fewest streams (None if all died).
+        """
+        load = [0 if worker.is_alive() else math.inf for worker in self._workers]
+        for stream in self.streams.values():
+            load[stream.worker_index] += 1
+        best = min(load, default=math.inf)
+        return load.index(best) if best != math.inf else None
+
+    def _fail_stream(self, stream_id, message, seq=None):
+        """
+        Ends a stream whose detector failed: frees the failed frame's
+        slot, reports it, and removes the stream off the collector thread.
+        """
+        stream = self.streams.get(stream_id)
+        if stream is None or not stream.running:
+            return
+
+        stream.running = False
+        with stream.pending_lock:
+            entry = stream.pending.pop(seq, None) if seq is not None else None
+        if entry is not None:
+            stream.frames.release(entry[4])
+            stream.slots.release()
+
+        if self.on_stream_error:
+            self.on_stream_error(stream_id, message)
+        if self.on_stream_end:
+            self.on_stream_end(stream_id)
+
+        threading.Thread(target=self.remove_stream, args=(stream_id,), daemon=True).start()
+
+    def _check_workers(self):
+        for index, worker in enumerate(self._workers):
+            if worker.is_alive():
+                continue
+            for stream in list(self.streams.values()):
+                if stream.worker_index == index:
+                    self._fail_stream(
+                        stream.stream_id,
+                        f"detector worker exited (code {worker.exitcode})"
+                    )
+
+    # -------------------------------------------------
+    # CAPTURE (ONE THREAD PER STREAM)
+    # -------------------------------------------------
+    def _capture_loop(self, stream):
+        task_queue = self._task_queues[stream.worker_index]
+
+        while stream.running:
+            # Back-pressure: at most max_in_flight frames per stream
+            if not stream.slots.acquire(timeout=0.5):
+                continue
+
+            frame, timestamp = stream.video_input.read()
+
+            if frame is None:
+                stream.slots.release()
+                if stream.running and self.on_stream_end:
+                    self.on_stream_end(stream.stream_id)
+                break
+
+            slot = stream.frames.put(frame)
+            if slot is None:
+                break  # removed while reading
+            index, name = slot
+
+            preview, steps = None, None
+            if self.keep_frames and self.on_result:
+                preview, steps = _preview(frame, self.preview_size)
+
+            stream.seq += 1
+            with stream.pending_lock:
+                stream.pending[stream.seq] = (preview, steps, timestamp, time.perf_counter(), index)
+
+            task_queue.put((
+                "frame",
+                stream.stream_id,
+                (stream.seq, name, frame.shape, frame.dtype.str, timestamp)
+            ))
+
+    def _record_metrics(self, stream, timings, submitted, in_flight):
+        metrics = self.metrics
+        stream_id = stream.stream_id
+
+        for stage, seconds in (timings or {}).items():
+            metrics.record(stream_id, stage, seconds)
+
+        metrics.record(stream_id, "roundtrip", time.perf_counter() - submitted)
+        metrics.count_frame(stream_id)
+        metrics.set_gauge(stream_id, "in_flight", in_flight)
+        metrics.set_gauge(stream_id, "dropped_frames", stream.video_input.frames_dropped)
+
+        task_queues = self._task_queues
+        if self._queue_depth and stream.worker_index < len(task_queues):
+            metrics.set_gauge(stream_id, "worker_queue_depth", task_queues[stream.worker_index].qsize())
+
+    # -------------------------------------------------
+    # FAN-IN
+    # -------------------------------------------------
+    def _collect_results(self):
+        last_check = time.monotonic()
+
+        while True:
+            # Streams of a crashed worker would otherwise stall silently
+            if time.monotonic() - last_check >= 1.0:
+                self._check_workers()
+                last_check = time.monotonic()
+
+            try:
+                item = self._result_queue.get(timeout=0.5)
+            except queue.Empty:
+                if not self.running:
+                    break
+                continue
+
+            if item is None:
+                break
+
+            if item[0] == "error":
+                _, stream_id, seq, message = item
+                self._fail_stream(stream_id, message, seq)
+                continue
+
+            _, stream_id, seq, fire, confidence, boxes, timings = item
+            stream = self.streams.get(stream_id)
+            if stream is None:
+                continue
+
+            with stream.pending_lock:
+                entry = stream.pending.pop(seq, None)
+                in_flight = len(stream.pending)
+            if entry is None:
+                continue
+
+            frame, steps, timestamp, submitted, index = entry
+            stream.frames.release(index)
+            stream.slots.release()
+
+            if self.metrics is not None:
+                self._record_metrics(stream, timings, submitted, in_flight)
+
+            if not self.on_result:
+                continue
+
+            if steps is not None and steps != (1, 1):
+                sx, sy = steps
+                boxes = [(x // sx, y // sy, w // sx, h // sy) for (x, y, w, h) in boxes]
+
+            self.on_result(stream_id, frame, timestamp, fire, confidence, boxes)
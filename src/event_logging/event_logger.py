@@ -1,19 +1,88 @@
 import csv
+import glob
+import io
 import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime
 from threading import Lock
 
+from event_logging.event_store import EventStore
+from event_logging.event_types import EventType, classify
+from event_logging.log_index import LogIndex, TIME_FORMAT, parse_line, to_epoch
+
+
+_STOP = object()
+_LINE_BREAKS = re.compile(r"\r\n|\r|\n")
+
 
 class EventLogger:
     """
     Handles persistent event logging using CSV.
+
+    With async_mode=True, log() only enqueues the row; a background
+    writer keeps the file open, writes in batches and fsyncs every
+    fsync_interval seconds or immediately after alarm-class events.
+    A failed write is recorded in writer_error (its rows count as
+    dropped) and the writer carries on; flush() never waits on a
+    writer that is gone.
+
+    A sidecar LogIndex (by time and by event type) makes recent-N,
+    time-range and per-type queries independent of the file size.
+    The file rotates when it exceeds max_bytes and/or at midnight
+    (rotate_daily).
+
+    With store_file set, every event is also appended as a structured
+    record (epoch, camera, EventType, confidence, box count) to a
+    memory-mappable EventStore for analytics queries.
     """
 
-    def __init__(self, log_file="events_log.csv"):
+    def __init__(self, log_file="events_log.csv",
+                 async_mode=False,
+                 queue_size=1000,
+                 batch_size=100,
+                 fsync_interval=1.0,
+                 alarm_markers=("Fire detected",),
+                 max_bytes=None,
+                 rotate_daily=False,
+                 store_file=None):
         self.log_file = log_file
         self.lock = Lock()
         self._ensure_file_exists()
 
+        # Open handles (kept open between writes)
+        self._fh = None
+        self._size = 0
+
+        # Index + rotation
+        self.index = LogIndex(log_file)
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+        last_epoch = self.index.sync()
+        self._rows = self.index.count()
+        self._current_day = (
+            datetime.fromtimestamp(last_epoch).date() if last_epoch else None
+        )
+
+        # Structured store (optional)
+        self.store = EventStore(store_file) if store_file else None
+
+        # Async writer
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+        self.alarm_markers = alarm_markers
+        self.dropped = 0
+        self.writer_error = None  # last exception seen by the writer
+        self._queue = None
+        self._writer = None
+
+        if async_mode:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+
     # -------------------------------------------------
     # FILE INIT
     # -------------------------------------------------
@@ -23,34 +92,361 @@ class EventLogger:
                 writer = csv.writer(f)
                 writer.writerow(["timestamp", "event"])
 
+    def _open(self):
+        if self._fh is None:
+            self._fh = open(self.log_file, mode="ab")
+            self._size = self._fh.tell()
+        return self._fh
+
+    def _close_files(self):
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+        self.index.close()
+        if self.store is not None:
+            self.store.close()
+
     # -------------------------------------------------
     # WRITE EVENT
     # -------------------------------------------------
-    def log(self, message: str):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def log(self, message: str, event_type: EventType | None = None,
+            confidence: float | None = None, camera=None, box_count: int = 0):
+        now = datetime.now()
+        timestamp = now.strftime(TIME_FORMAT)
+
+        record = None
+        if self.store is not None:
+            record = (
+                classify(message) if event_type is None else event_type,
+                "main" if camera is None else camera,
+                confidence,
+                box_count
+            )
+
+        row = (timestamp, message, now, record)
+
+        if self._writer is not None and self._writer.is_alive():
+            # Never block the caller: a full queue drops the row
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self.dropped += 1
+            return timestamp, message
 
         with self.lock:
-            with open(self.log_file, mode="a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([timestamp, message])
+            self._append_rows([row])
 
         return timestamp, message
 
+    def _append_rows(self, rows):
+        """
+        Writes rows to the CSV and the sidecar index. Caller holds self.lock.
+        """
+        for timestamp, message, now, record in rows:
+            # One physical line per row: the index and the tail reader
+            # address rows by line (e.g. multi-line cv2.error text)
+            message = _LINE_BREAKS.sub(" ", message)
+
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow([timestamp, message])
+            line = buffer.getvalue().encode("utf-8")
+
+            self._maybe_rotate(len(line), now.date())
+
+            fh = self._open()
+            offset = self._size
+            fh.write(line)
+            self._size += len(line)
+
+            self.index.append(int(now.timestamp()), offset, classify(message))
+            self._rows += 1
+
+            if record is not None:
+                event_type, camera, confidence, box_count = record
+                self.store.append(now.timestamp(), camera, event_type, confidence, box_count)
+
+        if self._fh:
+            self._fh.flush()
+        self.index.flush()
+        if self.store is not None:
+            self.store.flush()
+
+    # -------------------------------------------------
+    # ROTATION
+    # -------------------------------------------------
+    def _maybe_rotate(self, incoming, day):
+        self._open()
+        has_rows = self._rows > 0
+
+        by_size = (self.max_bytes and has_rows and
+                   self._size + incoming > self.max_bytes)
+        by_day = (self.rotate_daily and has_rows and
+                  self._current_day is not None and day != self._current_day)
+
+        self._current_day = day
+
+        if by_size or by_day:
+            self.rotate()
+
+    def rotate(self):
+        """
+        Moves the current file (and its index) aside and starts a new one.
+        Caller holds self.lock.
+        """
+        self._close_files()
+
+        root, ext = os.path.splitext(self.log_file)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        target = f"{root}.{stamp}{ext}"
+        counter = 1
+        while os.path.exists(target):
+            target = f"{root}.{stamp}-{counter}{ext}"
+            counter += 1
+
+        os.replace(self.log_file, target)
+        self.index.move_to(target)
+        self._ensure_file_exists()
+        self._rows = 0
+
+    def rotated_files(self):
+        """
+        Rotated log files, oldest first.
+        """
+        root, ext = os.path.splitext(self.log_file)
+        pattern = re.compile(re.escape(root) + r"\.(\d{8}-\d{6})(?:-(\d+))?" + re.escape(ext) + "$")
+
+        rotated = []
+        for path in glob.glob(f"{glob.escape(root)}.*{ext}"):
+            match = pattern.match(path)
+            if match:
+                # Same second: the suffixed name is the newer one
+                rotated.append((match.group(1), int(match.group(2) or 0), path))
+
+        return [path for _, _, path in sorted(rotated)]
+
+    def _segments(self):
+        """
+        (file, LogIndex) for every rotated file, oldest first, then the
+        current file. Caller holds self.lock.
+        """
+        segments = []
+        for path in self.rotated_files():
+            index = LogIndex(path)
+            index.sync()  # rebuilds a missing or stale sidecar only
+            index.close()
+            segments.append((path, index))
+
+        segments.append((self.log_file, self.index))
+        return segments
+
+    # -------------------------------------------------
+    # BACKGROUND WRITER
+    # -------------------------------------------------
+    def _writer_loop(self):
+        last_sync = time.monotonic()
+        dirty = False
+        stopping = False
+
+        while not stopping:
+            try:
+                batch = [self._queue.get(timeout=self.fsync_interval)]
+            except queue.Empty:
+                batch = []
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if item is not _STOP]
+            stopping = len(rows) != len(batch)
+
+            try:
+                if rows:
+                    with self.lock:
+                        self._append_rows(rows)
+                    dirty = True
+
+                alarm = any(
+                    marker in message
+                    for _, message, _, _ in rows
+                    for marker in self.alarm_markers
+                )
+
+                now = time.monotonic()
+                if dirty and (alarm or stopping or now - last_sync >= self.fsync_interval):
+                    with self.lock:
+                        if self._fh:
+                            os.fsync(self._fh.fileno())
+                    last_sync = now
+                    dirty = False
+            except Exception as e:
+                # Keep writing later batches (e.g. after a full disk
+                # frees up); this one is lost
+                self.writer_error = e
+                self.dropped += len(rows)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def pending(self):
+        """
+        Rows queued but not yet written (0 in synchronous mode).
+        """
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every queued row has been handled by the writer.
+        Raises RuntimeError if the writer thread is gone with rows still
+        queued, TimeoutError if timeout (seconds) expires first.
+        """
+        writer = self._writer
+        if writer is None:
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = self._queue.all_tasks_done
+
+        with done:
+            while self._queue.unfinished_tasks:
+                if not writer.is_alive():
+                    raise RuntimeError(f"Event log writer stopped ({self.writer_error!r})")
+
+                wait = 0.1
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        raise TimeoutError("Event log flush timed out")
+                done.wait(wait)
+
+    def close(self):
+        """
+        Drains the queue, fsyncs and stops the background writer.
+        Later log() calls fall back to synchronous writes.
+        """
+        writer = self._writer
+        if writer is not None:
+            # A dead writer would never take _STOP off a full queue
+            while writer.is_alive():
+                try:
+                    self._queue.put(_STOP, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            writer.join()
+            self._writer = None
+
+        with self.lock:
+            self._close_files()
+
     # -------------------------------------------------
     # READ EVENTS
     # -------------------------------------------------
     def read_all(self, limit: int | None = None):
         """
-        Returns a list of (timestamp, message).
-        If limit is provided, returns last N entries.
+        Returns a list of (timestamp, message), rotated files included.
+        If limit is provided, returns last N entries (read backwards
+        from the end of the file, so cost doesn't grow with file size).
         """
         if not os.path.exists(self.log_file):
             return []
 
-        with open(self.log_file, mode="r", encoding="utf-8") as f:
-            reader = list(csv.reader(f))[1:]  # skip header
+        self.flush()
+
+        with self.lock:
+            files = self.rotated_files() + [self.log_file]
+
+            if limit:
+                rows = []
+                for path in reversed(files):
+                    rows[:0] = self._tail(path, limit - len(rows))
+                    if len(rows) >= limit:
+                        break
+                return rows
+
+        rows = []
+        for path in files:
+            with open(path, mode="r", encoding="utf-8") as f:
+                rows.extend((row[0], row[1]) for row in list(csv.reader(f))[1:])  # skip header
+        return rows
+
+    def read_range(self, start, end=None):
+        """
+        Events with start <= timestamp <= end, across rotated files.
+        start / end: datetime or epoch seconds.
+        """
+        start_epoch = self._as_epoch(start)
+        end_epoch = self._as_epoch(end) if end is not None else 2 ** 62
+
+        self.flush()
+        rows = []
+        with self.lock:
+            for path, index in self._segments():
+                rows.extend(self._rows_at(path, index.offsets_in_range(start_epoch, end_epoch)))
+        return rows
+
+    def read_events(self, event_type: EventType, limit: int | None = None):
+        """
+        All (or the last N) events of one EventType, e.g. EventType.FIRE,
+        across rotated files.
+        """
+        self.flush()
+        rows = []
+        with self.lock:
+            # Newest file first, so a limit stops before the oldest files
+            for path, index in reversed(self._segments()):
+                remaining = limit - len(rows) if limit else None
+                if remaining is not None and remaining <= 0:
+                    break
+                rows[:0] = self._rows_at(path, index.offsets_for_type(event_type, remaining))
+        return rows
+
+    def query(self, start=None, end=None, event_type=None, camera=None):
+        """
+        Structured NumPy records from the EventStore (see EventStore.query).
+        """
+        if self.store is None:
+            raise RuntimeError("EventLogger was created without store_file")
+
+        self.flush()
+        return self.store.query(start=start, end=end, event_type=event_type, camera=camera)
+
+    def _rows_at(self, path, offsets):
+        rows = []
+        with open(path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                parsed = parse_line(f.readline())
+                if parsed:
+                    rows.append(parsed)
+        return rows
+
+    def _tail(self, path, limit, block_size=8192):
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            data = b""
+
+            # Read backwards until limit complete lines are buffered
+            while pos > 0 and data.count(b"\n") <= limit:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+
+        lines = data.splitlines()
+        if lines and (pos > 0 or lines[0].startswith(b"timestamp,")):
+            lines = lines[1:]  # partial line or header
 
-        if limit:
-            reader = reader[-limit:]
+        rows = [parse_line(line) for line in lines[-limit:]]
+        return [row for row in rows if row]
 
-        return [(row[0], row[1]) for row in reader]
+    @staticmethod
+    def _as_epoch(value):
+        if isinstance(value, datetime):
+            return int(value.timestamp())
+        if isinstance(value, str):
+            return to_epoch(value)
+        return int(value)
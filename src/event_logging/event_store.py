@@ -0,0 +1,165 @@
+import json
+import os
+import struct
+import threading
+
+import numpy as np
+
+from event_logging.event_types import EventType
+
+
+# Packed, fixed-size record (17 bytes); the dtype mirrors the struct layout
+RECORD = struct.Struct("<dHBfH")
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),   # epoch seconds
+    ("camera", "<u2"),      # camera id (see camera_names)
+    ("event", "u1"),        # EventType
+    ("confidence", "<f4"),  # NaN when not applicable
+    ("boxes", "<u2")        # bounding boxes in the frame
+])
+
+
+class EventStore:
+    """
+    Append-only binary event store for analytics:
+    - Fixed-size structured records, memory-mapped for queries
+    - Query API returns NumPy arrays (time range, event type, camera)
+    - Camera names are mapped to small integer ids in a JSON sidecar
+    - Time ranges use binary search while appends stay in time order;
+      after a clock step back they fall back to a full scan
+    """
+
+    def __init__(self, path="events_store.bin"):
+        self.path = path
+        self.cameras_path = path + ".cameras.json"
+        self.lock = threading.Lock()
+
+        self._fh = None
+        self._cameras = {}
+
+        if os.path.exists(self.cameras_path):
+            with open(self.cameras_path, "r", encoding="utf-8") as f:
+                self._cameras = json.load(f)
+
+        # Drop a trailing partial record (e.g. after a crash)
+        if os.path.exists(self.path):
+            size = os.path.getsize(self.path)
+            if size % RECORD.size:
+                with open(self.path, "r+b") as f:
+                    f.truncate(size - size % RECORD.size)
+
+        timestamps = self.records()["timestamp"]
+        self._sorted = bool(np.all(timestamps[1:] >= timestamps[:-1]))
+        self._last = float(timestamps[-1]) if len(timestamps) else None
+
+    # -------------------------------------------------
+    # CAMERAS
+    # -------------------------------------------------
+    def camera_id(self, name):
+        name = str(name)
+        with self.lock:
+            if name not in self._cameras:
+                self._cameras[name] = len(self._cameras)
+                with open(self.cameras_path, "w", encoding="utf-8") as f:
+                    json.dump(self._cameras, f)
+            return self._cameras[name]
+
+    def camera_names(self):
+        return {cid: name for name, cid in self._cameras.items()}
+
+    # -------------------------------------------------
+    # WRITE
+    # -------------------------------------------------
+    def append(self, timestamp, camera, event_type, confidence=None, box_count=0):
+        camera_id = self.camera_id(camera) if isinstance(camera, str) else int(camera)
+        record = RECORD.pack(
+            float(timestamp),
+            camera_id,
+            int(event_type),
+            float("nan") if confidence is None else float(confidence),
+            int(box_count)
+        )
+
+        with self.lock:
+            if self._fh is None:
+                self._fh = open(self.path, "ab")
+            self._fh.write(record)
+
+            if self._last is not None and timestamp < self._last:
+                self._sorted = False
+            self._last = float(timestamp)
+
+    def flush(self):
+        with self.lock:
+            if self._fh:
+                self._fh.flush()
+
+    def close(self):
+        with self.lock:
+            if self._fh:
+                self._fh.close()
+                self._fh = None
+
+    # -------------------------------------------------
+    # QUERY
+    # -------------------------------------------------
+    def records(self):
+        """
+        Memory-mapped view of every record (read-only).
+        """
+        self.flush()
+
+        count = os.path.getsize(self.path) // RECORD.size if os.path.exists(self.path) else 0
+        if not count:
+            return np.empty(0, dtype=RECORD_DTYPE)
+
+        return np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", shape=(count,))
+
+    def query(self, start=None, end=None, event_type=None, camera=None):
+        """
+        Records with start <= timestamp <= end, optionally filtered by
+        EventType and camera (name or id). Returns a structured array.
+        """
+        data = self.records()
+        if not len(data):
+            return np.array(data)
+
+        timestamps = data["timestamp"]
+        if self._sorted:
+            # Appended in time order: slice by binary search
+            lo = 0 if start is None else np.searchsorted(timestamps, start, side="left")
+            hi = len(data) if end is None else np.searchsorted(timestamps, end, side="right")
+            data = data[lo:hi]
+            mask = np.ones(len(data), dtype=bool)
+        else:
+            mask = np.ones(len(data), dtype=bool)
+            if start is not None:
+                mask &= timestamps >= start
+            if end is not None:
+                mask &= timestamps <= end
+
+        if event_type is not None:
+            mask &= data["event"] == int(event_type)
+        if camera is not None:
+            camera_id = self._cameras.get(camera, -1) if isinstance(camera, str) else camera
+            mask &= data["camera"] == camera_id
+
+        return np.array(data[mask])
+
+    def daily_counts(self, event_type=EventType.FIRE, start=None, end=None, utc_offset=0):
+        """
+        Events per camera per day.
+        Returns (days: datetime64[D] array, camera_ids: array,
+        counts: int array of shape (len(days), len(camera_ids))).
+        utc_offset (seconds) shifts day boundaries to local time.
+        """
+        data = self.query(start=start, end=end, event_type=event_type)
+
+        day_index = ((data["timestamp"] + utc_offset) // 86400).astype(np.int64)
+        days, day_pos = np.unique(day_index, return_inverse=True)
+        cameras, cam_pos = np.unique(data["camera"], return_inverse=True)
+
+        counts = np.zeros((len(days), len(cameras)), dtype=np.int64)
+        np.add.at(counts, (day_pos, cam_pos), 1)
+
+        return days.astype("datetime64[D]"), cameras, counts
@@ -0,0 +1,34 @@
+from enum import IntEnum
+
+
+class EventType(IntEnum):
+    """
+    Event classes recorded by EventLogger (stored as one byte).
+    """
+    INFO = 0
+    FIRE = 1
+    CLEAR = 2
+    BUZZER_OFF = 3
+    STREAM = 4
+    SYSTEM = 5
+
+
+# Checked in order; first match wins
+_MARKERS = (
+    ("Fire detected", EventType.FIRE),
+    ("Fire condition cleared", EventType.CLEAR),
+    ("Buzzer deactivated", EventType.BUZZER_OFF),
+    ("Stream", EventType.STREAM),
+    ("stream", EventType.STREAM),
+    ("shutdown", EventType.SYSTEM),
+)
+
+
+def classify(message: str) -> EventType:
+    """
+    Maps a free-text log message to its EventType.
+    """
+    for marker, event_type in _MARKERS:
+        if marker in message:
+            return event_type
+    return EventType.INFO
@@ -0,0 +1,246 @@
+import csv
+import os
+import struct
+from datetime import datetime
+
+from event_logging.event_types import EventType, classify
+
+
+# (epoch seconds, byte offset of the row, event type)
+RECORD = struct.Struct("<qQB")
+OFFSET = struct.Struct("<Q")
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def to_epoch(timestamp: str) -> int:
+    try:
+        return int(datetime.strptime(timestamp, TIME_FORMAT).timestamp())
+    except ValueError:
+        return 0
+
+
+def parse_line(line: bytes):
+    """
+    Parses one CSV log line into (timestamp, message), or None.
+    """
+    text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+    if not text:
+        return None
+
+    row = next(csv.reader([text]), None)
+    if not row or len(row) < 2:
+        return None
+
+    return row[0], row[1]
+
+
+class LogIndex:
+    """
+    Sidecar offset index for a CSV event log:
+    - <log>.idx            fixed-size records in row order
+    - <log>.<type>.idx     row offsets per event type
+    Both are append-only and rebuilt from the CSV when stale.
+
+    Rows are stamped with wall-clock time, so the time index is only
+    sorted while the clock never steps back (e.g. an NTP correction).
+    The first out-of-order row creates <log>.idx.unsorted, and range
+    queries on that file then scan the index instead of bisecting it.
+    """
+
+    def __init__(self, log_file):
+        self.log_file = log_file
+        self.path = log_file + ".idx"
+        self.unsorted_path = self.path + ".unsorted"
+
+        self._fh = None
+        self._type_fh = {}
+        self._last_epoch = None
+
+    def type_path(self, event_type: EventType):
+        return f"{self.log_file}.{event_type.name.lower()}.idx"
+
+    def all_paths(self):
+        return [self.path, self.unsorted_path] + [self.type_path(t) for t in EventType]
+
+    # -------------------------------------------------
+    # WRITE
+    # -------------------------------------------------
+    def append(self, epoch, offset, event_type):
+        if self._fh is None:
+            self._fh = open(self.path, "ab")
+
+        if self._last_epoch is not None and epoch < self._last_epoch and not self.is_unsorted():
+            open(self.unsorted_path, "wb").close()
+        self._last_epoch = epoch if self._last_epoch is None else max(epoch, self._last_epoch)
+
+        self._fh.write(RECORD.pack(epoch, offset, event_type))
+
+        fh = self._type_fh.get(event_type)
+        if fh is None:
+            fh = self._type_fh[event_type] = open(self.type_path(event_type), "ab")
+        fh.write(OFFSET.pack(offset))
+
+    def flush(self):
+        if self._fh:
+            self._fh.flush()
+        for fh in self._type_fh.values():
+            fh.flush()
+
+    def close(self):
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+        for fh in self._type_fh.values():
+            fh.close()
+        self._type_fh = {}
+
+    def clear(self):
+        self.close()
+        self._last_epoch = None
+        for path in self.all_paths():
+            if os.path.exists(path):
+                os.remove(path)
+
+    def move_to(self, rotated_log_file):
+        """
+        Renames the sidecar files to follow a rotated log file.
+        """
+        self.close()
+        self._last_epoch = None
+        target = LogIndex(rotated_log_file)
+        for src, dst in zip(self.all_paths(), target.all_paths()):
+            if os.path.exists(src):
+                os.replace(src, dst)
+
+    # -------------------------------------------------
+    # CATCH-UP / REBUILD
+    # -------------------------------------------------
+    def sync(self):
+        """
+        Brings the index up to date with the CSV file. Only rows past
+        the last indexed one are scanned; a full rebuild happens only
+        if the index doesn't match the file.
+        Returns the last indexed epoch (0 if empty).
+        """
+        self.close()
+
+        size = os.path.getsize(self.log_file) if os.path.exists(self.log_file) else 0
+        last = self.last_record()
+        start = None
+
+        if last is not None:
+            _, offset, _ = last
+            if offset < size:
+                with open(self.log_file, "rb") as f:
+                    f.seek(offset)
+                    start = offset + len(f.readline())
+
+        if start is None:
+            self.clear()
+            start = self._data_start()
+        else:
+            # While sorted, the last record holds the latest time
+            self._last_epoch = last[0]
+
+        last_epoch = last[0] if last else 0
+        if start >= size:
+            return last_epoch
+
+        with open(self.log_file, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                parsed = parse_line(line)
+                if parsed:
+                    last_epoch = to_epoch(parsed[0])
+                    self.append(last_epoch, offset, classify(parsed[1]))
+                offset += len(line)
+
+        self.flush()
+        return last_epoch
+
+    def _data_start(self):
+        """
+        Byte offset of the first data row (skips the header if present).
+        """
+        if not os.path.exists(self.log_file):
+            return 0
+
+        with open(self.log_file, "rb") as f:
+            first = f.readline()
+
+        return len(first) if first.startswith(b"timestamp,") else 0
+
+    # -------------------------------------------------
+    # READ
+    # -------------------------------------------------
+    def is_unsorted(self):
+        return os.path.exists(self.unsorted_path)
+
+    def count(self):
+        if not os.path.exists(self.path):
+            return 0
+        return os.path.getsize(self.path) // RECORD.size
+
+    def last_record(self):
+        n = self.count()
+        if not n:
+            return None
+
+        with open(self.path, "rb") as f:
+            f.seek((n - 1) * RECORD.size)
+            return RECORD.unpack(f.read(RECORD.size))
+
+    def offsets_in_range(self, start_epoch, end_epoch):
+        """
+        Row offsets with start_epoch <= ts <= end_epoch, in row order.
+        Binary search on the time index, then a scan of the hits only;
+        a full index scan if the clock ever stepped back.
+        """
+        n = self.count()
+        if not n:
+            return []
+
+        if self.is_unsorted():
+            with open(self.path, "rb") as f:
+                data = f.read(n * RECORD.size)
+            return [offset for epoch, offset, _ in RECORD.iter_unpack(data)
+                    if start_epoch <= epoch <= end_epoch]
+
+        with open(self.path, "rb") as f:
+            def epoch_at(i):
+                f.seek(i * RECORD.size)
+                return RECORD.unpack(f.read(RECORD.size))[0]
+
+            lo, hi = 0, n
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if epoch_at(mid) < start_epoch:
+                    lo = mid + 1
+                else:
+                    hi = mid
+
+            offsets = []
+            f.seek(lo * RECORD.size)
+            for _ in range(lo, n):
+                epoch, offset, _ = RECORD.unpack(f.read(RECORD.size))
+                if epoch > end_epoch:
+                    break
+                offsets.append(offset)
+
+        return offsets
+
+    def offsets_for_type(self, event_type: EventType, limit=None):
+        path = self.type_path(event_type)
+        if not os.path.exists(path):
+            return []
+
+        n = os.path.getsize(path) // OFFSET.size
+        first = max(0, n - limit) if limit else 0
+
+        with open(path, "rb") as f:
+            f.seek(first * OFFSET.size)
+            data = f.read((n - first) * OFFSET.size)
+
+        return [offset for (offset,) in OFFSET.iter_unpack(data)]
@@ -1,40 +1,90 @@
+import argparse
 import threading
 import time
 import cv2
 
 from video_input.video_stream import VideoInput
-from detection.fire_detector import FireDetector
-from ui.dashboard import FireDetectionDashboard
+from detection.backends import DetectorBackend, create_backend
+from engine.stream_engine import MultiStreamEngine, snapshot_path
+from engine.frame_scheduler import FrameScheduler
+from engine.config_watcher import ConfigWatcher
+from metrics.pipeline_metrics import PipelineMetrics
 from communication.esp32_client import ESP32Client
 from event_logging.event_logger import EventLogger
 
+# UI modules (customtkinter / PIL) are imported lazily in run_gui()
+
 
 class FireDetectionController:
     """
-    Orchestrates VideoInput, FireDetector, ESP32, Logger, and Dashboard
+    Orchestrates VideoInput, detector backend, ESP32, Logger, and Dashboard
     """
 
-    def __init__(self, dashboard: FireDetectionDashboard, logger: EventLogger):
+    def __init__(self, dashboard, logger: EventLogger,
+                 target_fps=30, idle_detect_fps=5,
+                 esp32_client=None, detector_kwargs=None,
+                 metrics: PipelineMetrics | None = None, metrics_interval=0,
+                 replay=False, detector: DetectorBackend | None = None,
+                 backend="color", snapshot_dir=None, snapshot_interval=60):
         self.dashboard = dashboard
         self.logger = logger
 
         # Core modules
+        self.detector_kwargs = detector_kwargs or {}
         self.video_input = None
-        self.detector = FireDetector()
-        self.esp32_client = ESP32Client()
+        # Multi-camera workers build their own from backend + detector_kwargs
+        self.backend = backend
+        self.detector = detector or create_backend(backend, **self.detector_kwargs)
+        self.esp32_client = esp32_client or ESP32Client()
 
         # Threading
         self.running = False
         self.worker = None
+        self._retiring = None  # stopped loop still finishing its last frame
+        self._reset_requested = threading.Event()  # applied by the loop between frames
+        self._shut_down = False  # shutdown() runs once (explicitly or from __del__)
+
+        # Pacing (replaces the fixed per-frame sleep)
+        self.target_fps = target_fps
+        self.idle_detect_fps = idle_detect_fps
+        self.scheduler = None
+
+        # Replay: source timestamps, no pacing, idle detection spaced
+        # in footage time (same frames detected as live at idle_detect_fps)
+        self.replay = replay
+
+        # Background model snapshots for warm restarts (None = disabled;
+        # never used in replay, which must start from a clean model)
+        self.snapshot_dir = snapshot_dir if not replay else None
+        self.snapshot_interval = snapshot_interval
 
         # Fire state (prevents alert spam)
         self.fire_active = False
 
+        # Multi-camera engine (optional)
+        self.engine = None
+        self.stream_fire_active = {}
+
+        # Per-camera parameter overrides (live updates), re-applied
+        # whenever the camera's detector is created
+        self.stream_params = {}
+
+        # Instrumentation (optional; None = disabled)
+        self.metrics = metrics
+        self.detector.metrics = metrics
+        self._metrics_stop = threading.Event()
+        if metrics is not None and metrics_interval:
+            threading.Thread(
+                target=self._metrics_summary_loop,
+                args=(metrics_interval,),
+                daemon=True
+            ).start()
+
     # -------------------------------------------------
     # LOGGING (CENTRALIZED)
     # -------------------------------------------------
-    def log(self, message: str):
-        timestamp, msg = self.logger.log(message)
+    def log(self, message: str, **fields):
+        timestamp, msg = self.logger.log(message, **fields)
         self.dashboard.display_log(timestamp, msg)
 
     # -------------------------------------------------
@@ -44,48 +94,160 @@ class FireDetectionController:
         self.stop_stream()
 
         try:
-            self.video_input = VideoInput(source_type, source_value)
+            self.video_input = VideoInput(
+                source_type,
+                source_value,
+                threaded=(source_type == "Camera" and not self.replay),
+                timestamp_mode="source" if self.replay else "wall"
+            )
             self.video_input.start()
         except Exception as e:
             self.log(f"Stream error: {e}")
             return
 
+        snapshot = None
+        if self.snapshot_dir and self.detector.supports_snapshots:
+            snapshot = snapshot_path(self.snapshot_dir, source_type, source_value)
+
+        if self.replay:
+            # No frame budget; idle skipping follows source timestamps,
+            # so results match live pacing without depending on speed
+            self.scheduler = FrameScheduler(target_fps=0, idle_detect_fps=self.idle_detect_fps)
+        else:
+            self.scheduler = FrameScheduler(
+                target_fps=self.target_fps,
+                idle_detect_fps=self.idle_detect_fps
+            )
+
+        previous, self._retiring = self._retiring, None
+
         self.running = True
         self.worker = threading.Thread(
             target=self._processing_loop,
+            args=(self.video_input, self.scheduler, previous, snapshot),
             daemon=True
         )
         self.worker.start()
 
-        self.log(f"Stream started ({source_type})")
+        self.log(f"Stream started ({source_type}{', replay' if self.replay else ''})")
 
     # -------------------------------------------------
     # MAIN PROCESSING LOOP
     # -------------------------------------------------
-    def _processing_loop(self):
-        while self.running:
-            frame, timestamp = self.video_input.read()
+    def _processing_loop(self, video_input, scheduler, previous=None, snapshot=None):
+        """
+        The detector belongs to one loop at a time: a new loop waits for
+        the previous one to snapshot and reset it (joined here, never on
+        the UI thread, which that loop may be waiting on).
+        """
+        if previous is not None:
+            previous.join()
+
+        if snapshot:
+            age = self.detector.load_snapshot(snapshot)
+            if age is not None:
+                self.log(f"Warm start from background snapshot ({age:.0f}s old)")
+        last_snapshot = time.monotonic()
+
+        current = threading.current_thread()
+        last_result = (False, 0.0, [])
+        m = self.metrics
+        camera = self.detector.camera_id
+        started_at = time.perf_counter()
+        timestamp = None
+
+        while self.running and self.worker is current:
+            if self._reset_requested.is_set():
+                self._reset_requested.clear()
+                self.detector.reset()
+
+            scheduler.begin_frame()
+            t = time.perf_counter() if m is not None else 0.0
+            frame, source_ts = video_input.read()
 
             if frame is None:
-                self.log("Video stream ended")
+                if self.worker is current:
+                    self.log("Video stream ended")
+                    if self.replay and timestamp is not None:
+                        self._log_replay_summary(timestamp, time.perf_counter() - started_at)
                 break
 
-            fire, confidence, boxes = self.detector.process_frame(frame, timestamp)
+            timestamp = source_ts
 
-            # Draw bounding boxes
-            for (x, y, w, h) in boxes:
-                cv2.rectangle(
-                    frame,
-                    (x, y),
-                    (x + w, y + h),
-                    (0, 0, 255),
-                    2
-                )
+            if m is not None:
+                t = m.observe(camera, "read", t)
+
+            # Full rate while a fire candidate is being confirmed
+            candidate = self.fire_active or self.detector.fire_start_time is not None
+
+            if scheduler.should_detect(candidate, timestamp if self.replay else None):
+                started = time.perf_counter()
+                last_result = self.detector.process_frame(frame, timestamp)
+                scheduler.record_detection(time.perf_counter() - started)
+                if m is not None:
+                    t = m.observe(camera, "detect", started)
+
+            # Skipped frames are still shown, with the last known result
+            fire, confidence, boxes = last_result
+
+            self.fire_active = self._handle_result(
+                frame, fire, confidence, boxes, self.fire_active, timestamp=timestamp
+            )
+            if m is not None:
+                t = m.observe(camera, "draw", t)
+
+            self.dashboard.update_frame_from_thread(frame)
+
+            if m is not None:
+                m.observe(camera, "display", t)
+                m.count_frame(camera)
+                m.set_gauge(camera, "dropped_frames", video_input.frames_dropped)
+                m.set_gauge(camera, "skipped_detections", scheduler.skipped)
+
+            if snapshot and time.monotonic() - last_snapshot >= self.snapshot_interval:
+                self._save_snapshot(snapshot)
+                last_snapshot = time.monotonic()
 
-            # Fire detected (single alert per event)
-            if fire and not self.fire_active:
-                self.fire_active = True
+            scheduler.wait()
+
+        # Snapshot before reset() drops the temporal buffers
+        if snapshot:
+            self._save_snapshot(snapshot)
+        self.detector.reset()
 
+        # Stream ended on its own (stop_stream() clears self.worker)
+        if self.worker is current:
+            self.stop_stream()
+
+    # -------------------------------------------------
+    # RESULT HANDLING (SHARED BY SINGLE + MULTI STREAM)
+    # -------------------------------------------------
+    def _handle_result(self, frame, fire, confidence, boxes, fire_active,
+                       stream_id=None, timestamp=None):
+        """
+        Draws detections (unless frame is None), raises / clears alerts.
+        Returns the new fire_active state for the stream.
+        """
+        prefix = f"[{stream_id}] " if stream_id is not None else ""
+
+        # In replay, events are located by their offset into the footage
+        at = f" at {timestamp:.2f}s" if self.replay and timestamp is not None else ""
+
+        # Draw bounding boxes
+        for (x, y, w, h) in (boxes if frame is not None else ()):
+            cv2.rectangle(
+                frame,
+                (x, y),
+                (x + w, y + h),
+                (0, 0, 255),
+                2
+            )
+
+        # Fire detected (single alert per event)
+        if fire and not fire_active:
+            fire_active = True
+
+            if frame is not None:
                 cv2.putText(
                     frame,
                     f"FIRE ({confidence:.2f})",
@@ -96,20 +258,110 @@ class FireDetectionController:
                     2
                 )
 
-                self.dashboard.trigger_fire_from_thread(confidence)
-                self.esp32_client.send_fire_alert(confidence)
-                self.log(f"Fire detected (confidence={confidence:.2f})")
+            self.dashboard.trigger_fire_from_thread(confidence, stream_id=stream_id)
+            self.esp32_client.send_fire_alert(confidence, camera=stream_id)
+            self.log(
+                f"{prefix}Fire detected{at} (confidence={confidence:.2f})",
+                confidence=confidence,
+                camera=stream_id,
+                box_count=len(boxes)
+            )
+
+        # Fire cleared
+        if not fire and fire_active:
+            fire_active = False
+            self.dashboard.clear_alert(stream_id=stream_id)
+            self.log(f"{prefix}Fire condition cleared{at}", camera=stream_id)
+
+        return fire_active
+
+    def _log_replay_summary(self, duration, elapsed, stream_id=None):
+        prefix = f"[{stream_id}] " if stream_id is not None else ""
+        speed = duration / elapsed if elapsed > 0 else 0.0
+        self.log(
+            f"{prefix}Replay finished: {duration:.1f}s of footage in "
+            f"{elapsed:.1f}s ({speed:.1f}x real time)",
+            camera=stream_id
+        )
 
-            # Fire cleared
-            if not fire and self.fire_active:
-                self.fire_active = False
-                self.dashboard.clear_alert()
-                self.log("Fire condition cleared")
+    # -------------------------------------------------
+    # MULTI-CAMERA STREAMS
+    # -------------------------------------------------
+    def start_streams(self, sources, num_workers=None):
+        """
+        sources: iterable of (stream_id, source_type, source_value)
+        All streams share one pool of detector worker processes.
+        """
+        self.stop_stream()
 
-            self.dashboard.update_frame_from_thread(frame)
-            time.sleep(0.03)
+        self.engine = MultiStreamEngine(
+            num_workers=num_workers,
+            on_result=self._on_stream_result,
+            on_stream_end=self._on_stream_end,
+            on_stream_error=self._on_stream_error,
+            metrics=self.metrics,
+            timestamp_mode="source" if self.replay else "wall",
+            snapshot_dir=self.snapshot_dir,
+            snapshot_interval=self.snapshot_interval,
+            # Headless: no frames back; GUI: tile-sized previews
+            keep_frames=getattr(self.dashboard, "shows_video", True),
+            preview_size=getattr(self.dashboard, "tile_size", None)
+        )
+        self.engine.start()
+
+        for stream_id, source_type, source_value in sources:
+            try:
+                self.engine.add_stream(
+                    stream_id, source_type, source_value,
+                    backend=self.backend,
+                    **{**self.detector_kwargs, **self.stream_params.get(stream_id, {})}
+                )
+            except Exception as e:
+                self.log(f"[{stream_id}] Stream error: {e}", camera=stream_id)
+                continue
 
-        self.stop_stream()
+            self.stream_fire_active[stream_id] = False
+
+            self.log(f"[{stream_id}] Stream started ({source_type})", camera=stream_id)
+
+    def _on_stream_result(self, stream_id, frame, timestamp, fire, confidence, boxes):
+        m = self.metrics
+        t = time.perf_counter() if m is not None else 0.0
+
+        self.stream_fire_active[stream_id] = self._handle_result(
+            frame, fire, confidence, boxes,
+            self.stream_fire_active.get(stream_id, False),
+            stream_id=stream_id,
+            timestamp=timestamp
+        )
+        if m is not None:
+            t = m.observe(stream_id, "draw", t)
+
+        if frame is not None:
+            self.dashboard.update_frame_from_thread(frame, stream_id=stream_id)
+            if m is not None:
+                m.observe(stream_id, "display", t)
+
+    def _on_stream_end(self, stream_id):
+        self.log(f"[{stream_id}] Video stream ended", camera=stream_id)
+
+    def _on_stream_error(self, stream_id, message):
+        self.log(f"[{stream_id}] Detection error: {message}", camera=stream_id)
+
+    # -------------------------------------------------
+    # METRICS SUMMARY (EVENT LOG)
+    # -------------------------------------------------
+    def _metrics_summary_loop(self, interval):
+        while not self._metrics_stop.wait(interval):
+            self.metrics.set_gauge("system", "log_queue_depth", self.logger.pending())
+            summary = self.metrics.summary()
+            if summary:
+                self.log(f"Metrics: {summary}")
+
+    def is_active(self):
+        if self.engine:
+            return self.engine.active_streams() > 0
+        return self.running
 
     # -------------------------------------------------
     # STOP STREAM
@@ -117,28 +369,113 @@ class FireDetectionController:
     def stop_stream(self):
         self.running = False
 
+        # A running loop snapshots and resets the detector itself once
+        # its current frame is done (MOG2 is only touched by one thread)
+        worker, self.worker = self.worker, None
+        if worker is not None and worker is not threading.current_thread():
+            self._retiring = worker
+        loop_owns_detector = self._retiring is not None and self._retiring.is_alive()
+
         if self.video_input:
             self.video_input.stop()
             self.video_input = None
 
-        self.detector.reset()
+        if self.engine:
+            self.engine.stop()
+            self.engine = None
+            for stream_id in self.stream_fire_active:
+                self.dashboard.remove_stream_from_thread(stream_id)
+            self.stream_fire_active.clear()
+
+        if not loop_owns_detector:
+            self.detector.reset()
         self.fire_active = False
 
+    def _save_snapshot(self, path):
+        try:
+            self.detector.save_snapshot(path)
+        except OSError as e:
+            self.log(f"Snapshot failed: {e}")
+
+    # -------------------------------------------------
+    # LIVE PARAMETERS
+    # -------------------------------------------------
+    def update_params(self, params, stream_id=None):
+        """
+        Retunes running detectors without restarting streams.
+        stream_id None = every stream (and streams started later).
+        """
+        # Rejected here (ValueError) rather than inside a worker
+        params = self.detector.check_params(params)
+
+        if stream_id is None:
+            self.detector_kwargs.update(params)
+        else:
+            self.stream_params.setdefault(stream_id, {}).update(params)
+
+        camera = self.detector.camera_id
+        if stream_id is None or stream_id == camera:
+            delta = self._params_for(camera, params, stream_id)
+            if delta:
+                self.detector.update_params(**delta)
+
+        if self.engine:
+            for camera in list(self.engine.streams):
+                if stream_id is None or stream_id == camera:
+                    delta = self._params_for(camera, params, stream_id)
+                    if delta:
+                        self.engine.update_params(delta, camera)
+
+        prefix = f"[{stream_id}] " if stream_id is not None else ""
+        self.log(f"{prefix}Detector parameters updated: {params}", camera=stream_id)
+
+    def _params_for(self, camera, params, stream_id):
+        # Site-wide values never override a camera's own
+        if stream_id is not None:
+            return params
+        overrides = self.stream_params.get(camera, {})
+        return {k: v for k, v in params.items() if k not in overrides}
+
     # -------------------------------------------------
     # USER ACTIONS
     # -------------------------------------------------
     def deactivate_buzzer(self):
-        self.detector.reset()
+        # A running loop owns the detector; it resets before its next frame
+        worker = self.worker
+        if worker is not None and worker.is_alive():
+            self._reset_requested.set()
+        else:
+            self.detector.reset()
         self.fire_active = False
 
+        if self.engine:
+            self.engine.reset_all()
+            for stream_id in self.stream_fire_active:
+                self.stream_fire_active[stream_id] = False
+                self.dashboard.clear_alert(stream_id=stream_id)
+
         self.esp32_client.deactivate_buzzer()
         self.dashboard.clear_alert()
         self.log("Buzzer deactivated by user")
 
     def shutdown(self):
+        if self._shut_down:
+            return
+        self._shut_down = True
+
+        self._metrics_stop.set()
+        if self.metrics is not None:
+            self.metrics.stop()
+
         self.stop_stream()
+
+        # Give the loop time to write its final snapshot
+        if self._retiring is not None:
+            self._retiring.join(timeout=2)
+
         self.esp32_client.shutdown()
         self.log("System shutdown complete")
+        self.logger.close()
 
     # -------------------------------------------------
     # CLEANUP
@@ -150,17 +487,240 @@ class FireDetectionController:
 # -------------------------------------------------
 # APPLICATION ENTRY POINT
 # -------------------------------------------------
-def main():
-    logger = EventLogger("events_log.csv")
-    dashboard = FireDetectionDashboard(event_logger=logger)
-    controller = FireDetectionController(dashboard, logger)
+def _zone(value):
+    """
+    argparse type for --zone: "CAMERA=ZONE" -> (camera, zone).
+    """
+    camera, sep, zone = value.partition("=")
+    if not sep or not camera or not zone:
+        raise argparse.ArgumentTypeError("expected CAMERA=ZONE")
+    return camera, zone
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Intelligent Fire Detection System")
+
+    parser.add_argument("--headless", action="store_true",
+                        help="run without the GUI (no Tk / customtkinter import)")
+    parser.add_argument("--source-type", default="Camera",
+                        choices=["Camera", "Local Video", "URL"])
+    parser.add_argument("--source", action="append", default=None,
+                        help="camera index, file path or URL (repeat for multi-camera)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="detector processes for multi-camera mode")
+    parser.add_argument("--log-file", default="events_log.csv")
+    parser.add_argument("--async-log", action="store_true",
+                        help="write the event log from a background thread")
+    parser.add_argument("--log-max-bytes", type=int, default=None,
+                        help="rotate the event log when it exceeds this size")
+    parser.add_argument("--log-rotate-daily", action="store_true")
+    parser.add_argument("--event-store", default=None,
+                        help="also write structured events to this binary store")
+
+    # Output sink
+    parser.add_argument("--sink", default="mqtt", choices=["mqtt", "stdout"])
+    parser.add_argument("--broker", default="broker.hivemq.com")
+    parser.add_argument("--port", type=int, default=1883)
+    parser.add_argument("--topic", default="fire/alert")
+    parser.add_argument("--outbox-dir", default="mqtt_outbox",
+                        help="disk outbox for alerts not yet acknowledged by the broker")
+    parser.add_argument("--outbox-max-age", type=float, default=300,
+                        help="seconds after which undelivered alerts are dropped instead of replayed")
+    parser.add_argument("--zone", type=_zone, action="append", default=[], metavar="CAMERA=ZONE",
+                        help="route a camera's alerts to <topic>/<zone> (repeatable)")
+    parser.add_argument("--coalesce-window", type=float, default=0.0,
+                        help="seconds during which repeated alerts per zone are merged")
+    parser.add_argument("--payload-format", default="json", choices=["json", "binary"])
+
+    # Detector thresholds
+    parser.add_argument("--confidence-threshold", type=float, default=None)
+    parser.add_argument("--min-fire-area", type=int, default=None)
+    parser.add_argument("--min-fire-duration", type=float, default=None)
+    parser.add_argument("--color-mode", default=None, choices=["hsv", "lut"],
+                        help="color segmentation: HSV conversion or precompiled BGR lookup table")
+    parser.add_argument("--tracking", action="store_true", default=None,
+                        help="track fire regions and confirm each one on its own")
+    parser.add_argument("--flicker", action="store_true", default=None,
+                        help="require tracked regions to flicker at flame frequencies (implies --tracking)")
+    parser.add_argument("--backend", default="color",
+                        help='detector backend: "color" or "package.module:Class"')
+    parser.add_argument("--verifier-model", default=None,
+                        help="ONNX classifier run on candidate crops (needs onnxruntime; implies --tracking)")
+    parser.add_argument("--verifier-threshold", type=float, default=None)
+
+    parser.add_argument("--snapshot-dir", default=None,
+                        help="save background model snapshots here and warm-start from them")
+    parser.add_argument("--snapshot-interval", type=float, default=60,
+                        help="seconds between background model snapshots")
+    parser.add_argument("--config", default=None,
+                        help="JSON file of detector parameters, re-applied live when it changes")
+    parser.add_argument("--config-interval", type=float, default=1.0,
+                        help="seconds between config file checks")
+
+    # Pacing
+    parser.add_argument("--replay", action="store_true",
+                        help="re-scan recorded footage as fast as it decodes, "
+                             "timing decisions on source timestamps")
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--idle-detect-fps", type=float, default=5)
+    parser.add_argument("--grid-fps", type=float, default=5,
+                        help="per-tile display FPS in the multi-camera grid")
+
+    # Instrumentation
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="serve Prometheus-text metrics on 127.0.0.1:<port>/metrics")
+    parser.add_argument("--metrics-interval", type=float, default=0,
+                        help="seconds between metrics summaries in the event log")
+
+    return parser.parse_args(argv)
+
+
+def _detector_kwargs(args):
+    kwargs = {
+        "confidence_threshold": args.confidence_threshold,
+        "min_fire_area": args.min_fire_area,
+        "min_fire_duration": args.min_fire_duration,
+        "color_mode": args.color_mode,
+        "tracking": args.tracking,
+        "flicker": args.flicker,
+        "verifier_model": args.verifier_model,
+        "verifier_threshold": args.verifier_threshold
+    }
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def _event_logger(args):
+    return EventLogger(
+        args.log_file,
+        async_mode=args.async_log,
+        max_bytes=args.log_max_bytes,
+        rotate_daily=args.log_rotate_daily,
+        store_file=args.event_store
+    )
+
+
+def _pipeline_metrics(args):
+    if args.metrics_port is None and not args.metrics_interval:
+        return None
+
+    metrics = PipelineMetrics()
+    if args.metrics_port is not None:
+        metrics.serve(port=args.metrics_port)
+    return metrics
+
+
+def _alert_client(args):
+    if args.sink == "stdout":
+        from communication.console_client import ConsoleAlertClient
+        return ConsoleAlertClient()
+
+    return ESP32Client(
+        broker=args.broker,
+        port=args.port,
+        topic_alert=args.topic,
+        outbox_dir=args.outbox_dir,
+        max_message_age=args.outbox_max_age,
+        zones=dict(args.zone),
+        coalesce_window=args.coalesce_window,
+        payload_format=args.payload_format
+    )
+
+
+def _config_watcher(args, controller):
+    if not args.config:
+        return None
+
+    watcher = ConfigWatcher(
+        args.config,
+        on_change=controller.update_params,
+        interval=args.config_interval,
+        on_error=controller.log
+    )
+    watcher.start()
+    return watcher
+
+
+def run_headless(args):
+    from ui.headless import HeadlessDashboard
+
+    logger = _event_logger(args)
+    dashboard = HeadlessDashboard(event_logger=logger)
+    controller = FireDetectionController(
+        dashboard,
+        logger,
+        target_fps=args.fps,
+        idle_detect_fps=args.idle_detect_fps,
+        esp32_client=_alert_client(args),
+        detector_kwargs=_detector_kwargs(args),
+        metrics=_pipeline_metrics(args),
+        metrics_interval=args.metrics_interval,
+        replay=args.replay,
+        backend=args.backend,
+        snapshot_dir=args.snapshot_dir,
+        snapshot_interval=args.snapshot_interval
+    )
+    watcher = _config_watcher(args, controller)
+
+    sources = args.source or ["0"]
+    if len(sources) == 1:
+        controller.start_stream(args.source_type, sources[0])
+    else:
+        controller.start_streams(
+            [(f"cam{i}", args.source_type, value) for i, value in enumerate(sources)],
+            num_workers=args.workers
+        )
+
+    dashboard.run(is_active=controller.is_active)
+    if watcher:
+        watcher.stop()
+    controller.shutdown()
+
+
+def run_gui(args):
+    from ui.dashboard import FireDetectionDashboard
+
+    logger = _event_logger(args)
+    dashboard = FireDetectionDashboard(event_logger=logger, grid_display_fps=args.grid_fps)
+    controller = FireDetectionController(
+        dashboard,
+        logger,
+        target_fps=args.fps,
+        idle_detect_fps=args.idle_detect_fps,
+        esp32_client=_alert_client(args),
+        detector_kwargs=_detector_kwargs(args),
+        metrics=_pipeline_metrics(args),
+        metrics_interval=args.metrics_interval,
+        replay=args.replay,
+        backend=args.backend,
+        snapshot_dir=args.snapshot_dir,
+        snapshot_interval=args.snapshot_interval
+    )
+    watcher = _config_watcher(args, controller)
 
     # 🔗 UI → Controller wiring
     dashboard.on_start_stream = controller.start_stream
     dashboard.on_deactivate_buzzer = controller.deactivate_buzzer
     dashboard.on_stop_system = controller.shutdown
 
+    sources = args.source or []
+    if len(sources) > 1:
+        dashboard.on_auto_start = lambda: controller.start_streams(
+            [(f"cam{i}", args.source_type, value) for i, value in enumerate(sources)],
+            num_workers=args.workers
+        )
+
     dashboard.mainloop()
+    if watcher:
+        watcher.stop()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.headless:
+        run_headless(args)
+    else:
+        run_gui(args)
 
 
 if __name__ == "__main__":
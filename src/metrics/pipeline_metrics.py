@@ -0,0 +1,213 @@
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Histogram bucket upper bounds (seconds)
+DEFAULT_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last bucket = +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        i = 0
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                break
+        else:
+            i = len(self.buckets)
+
+        self.counts[i] += 1
+        self.total += seconds
+        self.count += 1
+
+    def percentile(self, p):
+        """
+        Upper bound of the bucket holding the p-th percentile (seconds).
+        """
+        if not self.count:
+            return None
+
+        target = p * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return float("inf")
+
+
+class StageRecorder:
+    """
+    Collects one frame's stage timings in a dict (same observe()
+    signature as PipelineMetrics). Used inside worker processes, where
+    the timings are shipped back with the result.
+    """
+
+    def __init__(self):
+        self.timings = {}
+
+    def observe(self, camera, stage, started):
+        now = time.perf_counter()
+        self.timings[stage] = self.timings.get(stage, 0.0) + (now - started)
+        return now
+
+    def pop(self):
+        timings, self.timings = self.timings, {}
+        return timings
+
+
+class PipelineMetrics:
+    """
+    Per-camera pipeline instrumentation:
+    - Per-stage timing histograms
+    - Frame counter / FPS, gauges (queue depths, dropped frames, ...)
+    - Prometheus text endpoint (serve) and a one-line summary()
+
+    Instrumented code holds metrics=None when disabled, so the only
+    cost left is an `is not None` check per stage.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, fps_window=60):
+        self.buckets = tuple(buckets)
+        self.fps_window = fps_window
+
+        self.lock = threading.Lock()
+        self._histograms = {}   # (camera, stage) -> _Histogram
+        self._frames = {}       # camera -> count
+        self._frame_times = {}  # camera -> deque of perf_counter stamps
+        self._gauges = {}       # (camera, name) -> value
+
+        self._server = None
+
+    # -------------------------------------------------
+    # RECORDING
+    # -------------------------------------------------
+    def observe(self, camera, stage, started):
+        """
+        Records time since `started` for a stage and returns "now",
+        so consecutive stages can be chained.
+        """
+        now = time.perf_counter()
+        self.record(camera, stage, now - started)
+        return now
+
+    def record(self, camera, stage, seconds):
+        key = (camera, stage)
+        with self.lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def count_frame(self, camera):
+        now = time.perf_counter()
+        with self.lock:
+            self._frames[camera] = self._frames.get(camera, 0) + 1
+            stamps = self._frame_times.get(camera)
+            if stamps is None:
+                stamps = self._frame_times[camera] = deque(maxlen=self.fps_window)
+            stamps.append(now)
+
+    def set_gauge(self, camera, name, value):
+        self._gauges[(camera, name)] = value
+
+    # -------------------------------------------------
+    # READING
+    # -------------------------------------------------
+    def fps(self, camera):
+        stamps = self._frame_times.get(camera)
+        if not stamps or len(stamps) < 2:
+            return 0.0
+        span = stamps[-1] - stamps[0]
+        return (len(stamps) - 1) / span if span > 0 else 0.0
+
+    def cameras(self):
+        with self.lock:
+            names = set(self._frames) | {cam for cam, _ in self._histograms}
+        return sorted(names, key=str)
+
+    def summary(self):
+        """
+        One line per camera: FPS and p50/p95 per stage (milliseconds).
+        """
+        lines = []
+        for camera in self.cameras():
+            with self.lock:
+                stages = sorted(
+                    (stage, h) for (cam, stage), h in self._histograms.items()
+                    if cam == camera
+                )
+                parts = [f"fps={self.fps(camera):.1f}"]
+                for stage, histogram in stages:
+                    p50 = histogram.percentile(0.5) * 1000
+                    p95 = histogram.percentile(0.95) * 1000
+                    parts.append(f"{stage}<={p50:g}/{p95:g}ms")
+            lines.append(f"[{camera}] " + " ".join(parts))
+        return "; ".join(lines)
+
+    def render_prometheus(self):
+        out = []
+
+        with self.lock:
+            out.append("# TYPE fire_stage_seconds histogram")
+            for (camera, stage), h in sorted(self._histograms.items(), key=str):
+                labels = f'camera="{camera}",stage="{stage}"'
+                cumulative = 0
+                for bound, n in zip(self.buckets + (float("inf"),), h.counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    out.append(f'fire_stage_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                out.append(f"fire_stage_seconds_sum{{{labels}}} {h.total:.6f}")
+                out.append(f"fire_stage_seconds_count{{{labels}}} {h.count}")
+
+            out.append("# TYPE fire_frames_total counter")
+            for camera, n in sorted(self._frames.items(), key=str):
+                out.append(f'fire_frames_total{{camera="{camera}"}} {n}')
+
+            out.append("# TYPE fire_fps gauge")
+            for camera in sorted(self._frames, key=str):
+                out.append(f'fire_fps{{camera="{camera}"}} {self.fps(camera):.2f}')
+
+            for (camera, name), value in sorted(self._gauges.items(), key=str):
+                out.append(f'fire_{name}{{camera="{camera}"}} {value}')
+
+        return "\n".join(out) + "\n"
+
+    # -------------------------------------------------
+    # HTTP ENDPOINT
+    # -------------------------------------------------
+    def serve(self, port=9108, host="127.0.0.1"):
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+
+                body = metrics.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -1,5 +1,7 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk
+
+from ui.frame_mailbox import FrameMailbox
+from ui.video_grid import FrameRenderer, VideoGrid
 
 # -------------------------------------------------
 # UI CONFIG
@@ -7,6 +9,9 @@ from PIL import Image, ImageTk
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
+VIDEO_SIZE = (640, 480)
+TILE_SIZE = (320, 240)
+
 
 class FireDetectionDashboard(ctk.CTk):
     """
@@ -16,7 +21,8 @@ class FireDetectionDashboard(ctk.CTk):
     - Emits user actions to controller
     """
 
-    def __init__(self, event_logger=None):
+    def __init__(self, event_logger=None, display_fps=30,
+                 grid_display_fps=5, grid_columns=2):
         super().__init__()
 
         self.title("Intelligent Fire Detection System")
@@ -30,11 +36,23 @@ class FireDetectionDashboard(ctk.CTk):
         self.on_start_stream = None
         self.on_deactivate_buzzer = None
         self.on_stop_system = None
+        self.on_auto_start = None
 
         # UI state
         self.alert_active = False
         self.system_running = True
 
+        # Video display: latest-frame mailbox polled at display_fps,
+        # one reused RGB buffer and one PhotoImage updated in place
+        self.display_fps = display_fps
+        self.frame_mailbox = FrameMailbox()
+
+        # Multi-camera grid: tiles render at grid_display_fps,
+        # full display_fps only while their camera is in alert
+        self.grid_display_fps = grid_display_fps
+        self.grid_columns = grid_columns
+        self.tile_size = TILE_SIZE
+
         # Build UI
         self._build_main_layout()
 
@@ -44,6 +62,9 @@ class FireDetectionDashboard(ctk.CTk):
         # Auto-start camera
         self.after(300, self._auto_start_camera)
 
+        # Start polling for frames
+        self.after(0, self._poll_frames)
+
     # -------------------------------------------------
     # MAIN LAYOUT
     # -------------------------------------------------
@@ -86,12 +107,25 @@ class FireDetectionDashboard(ctk.CTk):
             corner_radius=10
         )
         self.video_label.pack(padx=10, pady=10)
+        self.video_renderer = FrameRenderer(self.video_label, VIDEO_SIZE)
 
-        ctk.CTkLabel(
+        # Shown instead of video_label while multi-camera streams run
+        self.video_grid = VideoGrid(
+            self.left_panel,
+            columns=self.grid_columns,
+            tile_size=self.tile_size,
+            display_fps=self.grid_display_fps,
+            alert_fps=self.display_fps,
+            on_new_stream=self._show_video_grid,
+            on_empty=self._show_single_video
+        )
+
+        self.source_label = ctk.CTkLabel(
             self.left_panel,
             text="Video Input Source",
             font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(pady=(10, 5))
+        )
+        self.source_label.pack(pady=(10, 5))
 
         self.source_option = ctk.CTkOptionMenu(
             self.left_panel,
@@ -187,7 +221,9 @@ class FireDetectionDashboard(ctk.CTk):
             self.start_button.configure(state="normal")
 
     def _auto_start_camera(self):
-        if self.on_start_stream:
+        if self.on_auto_start:
+            self.on_auto_start()
+        elif self.on_start_stream:
             self.on_start_stream("Camera", "0")
 
     def _start_stream_clicked(self):
@@ -206,12 +242,19 @@ class FireDetectionDashboard(ctk.CTk):
     # DISPLAY METHODS (NO LOGIC)
     # -------------------------------------------------
     def update_video_frame(self, frame_bgr):
-        frame_rgb = frame_bgr[:, :, ::-1]
-        img = Image.fromarray(frame_rgb).resize((640, 480))
-        imgtk = ImageTk.PhotoImage(image=img)
+        self.video_renderer.render(frame_bgr)
 
-        self.video_label.configure(image=imgtk, text="")
-        self.video_label.image = imgtk
+    def _show_video_grid(self, stream_id):
+        if self.video_grid.winfo_ismapped():
+            return
+        self.video_label.pack_forget()
+        self.video_grid.pack(padx=10, pady=10, before=self.source_label)
+
+    def _show_single_video(self):
+        if self.video_label.winfo_ismapped():
+            return
+        self.video_grid.pack_forget()
+        self.video_label.pack(padx=10, pady=10, before=self.source_label)
 
     def display_log(self, timestamp, message):
         self.event_log.configure(state="normal")
@@ -226,7 +269,12 @@ class FireDetectionDashboard(ctk.CTk):
             text_color="red"
         )
 
-    def clear_alert(self):
+    def clear_alert(self, stream_id=None):
+        if stream_id is not None:
+            self.video_grid.set_alert(stream_id, False)
+            if self.video_grid.any_alert():
+                return
+
         self.alert_active = False
         self.alert_status_label.configure(
             text="Alert: INACTIVE",
@@ -263,8 +311,26 @@ class FireDetectionDashboard(ctk.CTk):
     # -------------------------------------------------
     # THREAD-SAFE ENTRY POINTS
     # -------------------------------------------------
-    def update_frame_from_thread(self, frame):
-        self.after(0, lambda: self.update_video_frame(frame))
+    def update_frame_from_thread(self, frame, stream_id=None):
+        if stream_id is not None:
+            self.video_grid.post(stream_id, frame)
+            return
+        self.frame_mailbox.post(frame)
+
+    def remove_stream_from_thread(self, stream_id):
+        self.video_grid.remove(stream_id)
+
+    def _poll_frames(self):
+        frame = self.frame_mailbox.take()
+        if frame is not None:
+            # A single stream can follow a multi-camera session
+            if self.video_grid.winfo_ismapped():
+                self._show_single_video()
+            self.update_video_frame(frame)
+
+        self.after(max(1, int(1000 / self.display_fps)), self._poll_frames)
 
-    def trigger_fire_from_thread(self, confidence):
+    def trigger_fire_from_thread(self, confidence, stream_id=None):
+        if stream_id is not None:
+            self.video_grid.set_alert(stream_id, True)
         self.after(0, lambda: self.fire_detected(confidence))
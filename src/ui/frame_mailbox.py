@@ -0,0 +1,41 @@
+import threading
+
+
+class FrameMailbox:
+    """
+    Single-slot, latest-frame mailbox between a producer thread and the UI:
+    - post() never blocks and replaces any frame not yet displayed
+    - take() returns the newest frame (or None) and empties the slot
+    - superseded counts frames replaced before they were displayed
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+
+        # Counters
+        self.posted = 0
+        self.displayed = 0
+        self.superseded = 0
+
+    def post(self, frame):
+        with self._lock:
+            if self._frame is not None:
+                self.superseded += 1
+            self._frame = frame
+            self.posted += 1
+
+    def take(self):
+        with self._lock:
+            frame = self._frame
+            self._frame = None
+            if frame is not None:
+                self.displayed += 1
+        return frame
+
+    def stats(self):
+        return {
+            "posted": self.posted,
+            "displayed": self.displayed,
+            "superseded": self.superseded
+        }
@@ -0,0 +1,30 @@
+"""
+Tk-free geometry and refresh pacing for the multi-camera VideoGrid.
+"""
+
+
+def grid_cell(index, columns):
+    """
+    (row, column) of the index-th tile, filled row by row.
+    """
+    if columns < 1:
+        raise ValueError("columns must be >= 1")
+    return index // columns, index % columns
+
+
+def grid_cells(stream_ids, columns):
+    """
+    Cells for tiles in display order; removed streams leave no gaps.
+    """
+    return {stream_id: grid_cell(index, columns) for index, stream_id in enumerate(stream_ids)}
+
+
+def poll_interval_ms(alert, display_fps, alert_fps):
+    """
+    Delay before a tile polls its mailbox again: alert_fps while its
+    camera has an active alert, display_fps otherwise (at least 1 ms).
+    """
+    fps = alert_fps if alert else display_fps
+    if fps <= 0:
+        raise ValueError("fps must be > 0")
+    return max(1, int(1000 / fps))
@@ -0,0 +1,68 @@
+import signal
+import threading
+
+
+class HeadlessDashboard:
+    """
+    Drop-in replacement for FireDetectionDashboard on servers:
+    - No Tk / customtkinter / PIL imports
+    - Logs go to stdout
+    - Frames are discarded
+    """
+
+    # Tells the controller not to keep frames for display
+    shows_video = False
+
+    def __init__(self, event_logger=None, quiet=False):
+        self.event_logger = event_logger
+        self.quiet = quiet
+
+        # UI state (mirrors the GUI dashboard)
+        self.alert_active = False
+        self.system_running = True
+
+        self._stop_event = threading.Event()
+
+    # -------------------------------------------------
+    # DISPLAY METHODS (NO-OP / STDOUT)
+    # -------------------------------------------------
+    def display_log(self, timestamp, message):
+        if not self.quiet:
+            print(f"[{timestamp}] {message}", flush=True)
+
+    def fire_detected(self, confidence):
+        self.alert_active = True
+
+    def clear_alert(self, stream_id=None):
+        self.alert_active = False
+
+    # -------------------------------------------------
+    # THREAD-SAFE ENTRY POINTS
+    # -------------------------------------------------
+    def update_frame_from_thread(self, frame, stream_id=None):
+        pass
+
+    def trigger_fire_from_thread(self, confidence, stream_id=None):
+        self.fire_detected(confidence)
+
+    def remove_stream_from_thread(self, stream_id):
+        pass
+
+    # -------------------------------------------------
+    # MAIN LOOP
+    # -------------------------------------------------
+    def run(self, is_active=None, poll_interval=0.5):
+        """
+        Blocks until SIGINT/SIGTERM, stop(), or is_active() turns False.
+        """
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: self.stop())
+
+        while not self._stop_event.wait(poll_interval):
+            if is_active is not None and not is_active():
+                break
+
+        self.system_running = False
+
+    def stop(self):
+        self._stop_event.set()
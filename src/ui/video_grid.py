@@ -0,0 +1,197 @@
+import threading
+
+import customtkinter as ctk
+import numpy as np
+from PIL import Image, ImageTk
+
+from ui.frame_mailbox import FrameMailbox
+from ui.grid_layout import grid_cell, grid_cells, poll_interval_ms
+
+
+class FrameRenderer:
+    """
+    Renders BGR frames into one label:
+    - BGR -> RGB (and integer downscale) in one copy into a reused buffer
+    - One PhotoImage, updated in place
+    """
+
+    def __init__(self, label, size):
+        self.label = label
+        self.size = size
+
+        self._buffer = None
+        self._photo = None
+
+    def render(self, frame_bgr):
+        target_w, target_h = self.size
+        h, w = frame_bgr.shape[:2]
+
+        # Integer downscale by striding (e.g. 640x480 -> 320x240)
+        step_y, step_x = max(1, h // target_h), max(1, w // target_w)
+        src = frame_bgr[::step_y, ::step_x, ::-1]
+        sh, sw = src.shape[:2]
+
+        if self._buffer is None or self._buffer.shape[:2] != (sh, sw):
+            self._buffer = np.empty((sh, sw, 3), dtype=np.uint8)
+
+        np.copyto(self._buffer, src)
+        img = Image.frombuffer("RGB", (sw, sh), self._buffer, "raw", "RGB", 0, 1)
+
+        if (sw, sh) != self.size:
+            img = img.resize(self.size)
+
+        if self._photo is None:
+            self._photo = ImageTk.PhotoImage(image=img)
+            self.label.configure(image=self._photo, text="")
+        else:
+            self._photo.paste(img)
+
+
+class VideoTile(ctk.CTkFrame):
+    """
+    One camera in the grid. Polls its own mailbox at display_fps,
+    or at alert_fps while the camera has an active alert.
+    """
+
+    def __init__(self, master, stream_id, mailbox, is_alert,
+                 size=(320, 240), display_fps=5, alert_fps=30):
+        super().__init__(master, border_width=2, border_color="gray25")
+
+        self.stream_id = stream_id
+        self.mailbox = mailbox
+        self.is_alert = is_alert
+        self.display_fps = display_fps
+        self.alert_fps = alert_fps
+
+        self.title = ctk.CTkLabel(self, text=str(stream_id))
+        self.title.pack(pady=(2, 0))
+
+        self.video_label = ctk.CTkLabel(
+            self,
+            text="Waiting...",
+            width=size[0],
+            height=size[1],
+            fg_color="black"
+        )
+        self.video_label.pack(padx=4, pady=4)
+
+        self.renderer = FrameRenderer(self.video_label, size)
+        self._alert_shown = False
+
+        self._poll_id = self.after(0, self._poll)
+
+    def _poll(self):
+        alert = self.is_alert(self.stream_id)
+
+        if alert != self._alert_shown:
+            self._alert_shown = alert
+            self.configure(border_color="red" if alert else "gray25")
+
+        frame = self.mailbox.take()
+        if frame is not None:
+            self.renderer.render(frame)
+
+        delay = poll_interval_ms(alert, self.display_fps, self.alert_fps)
+        self._poll_id = self.after(delay, self._poll)
+
+    def destroy(self):
+        self.after_cancel(self._poll_id)
+        super().destroy()
+
+
+class VideoGrid(ctk.CTkFrame):
+    """
+    Grid of VideoTiles for multi-camera mode.
+    post() / set_alert() / remove() are safe to call from any thread;
+    tiles are created on the UI thread the first time a stream posts a
+    frame and destroyed after the stream is removed. on_empty fires
+    when the last tile goes.
+    """
+
+    def __init__(self, master, columns=2, tile_size=(320, 240),
+                 display_fps=5, alert_fps=30, on_new_stream=None, on_empty=None):
+        super().__init__(master, fg_color="transparent")
+
+        self.columns = columns
+        self.tile_size = tile_size
+        self.display_fps = display_fps
+        self.alert_fps = alert_fps
+        self.on_new_stream = on_new_stream
+        self.on_empty = on_empty
+
+        self._lock = threading.Lock()
+        self._mailboxes = {}
+        self._alerts = {}
+        self.tiles = {}
+
+        self.after(0, self._sync_tiles)
+
+    # -------------------------------------------------
+    # THREAD-SAFE ENTRY POINTS
+    # -------------------------------------------------
+    def post(self, stream_id, frame):
+        with self._lock:
+            mailbox = self._mailboxes.get(stream_id)
+            if mailbox is None:
+                mailbox = self._mailboxes[stream_id] = FrameMailbox()
+        mailbox.post(frame)
+
+    def remove(self, stream_id):
+        with self._lock:
+            self._mailboxes.pop(stream_id, None)
+        self._alerts.pop(stream_id, None)
+
+    def set_alert(self, stream_id, active):
+        self._alerts[stream_id] = active
+
+    def is_alert(self, stream_id):
+        return self._alerts.get(stream_id, False)
+
+    def any_alert(self):
+        return any(self._alerts.values())
+
+    def superseded(self):
+        with self._lock:
+            return sum(m.superseded for m in self._mailboxes.values())
+
+    # -------------------------------------------------
+    # UI THREAD
+    # -------------------------------------------------
+    def _sync_tiles(self):
+        with self._lock:
+            # Removed, or removed and posted to again (new mailbox)
+            removed = [sid for sid, tile in self.tiles.items()
+                       if self._mailboxes.get(sid) is not tile.mailbox]
+
+        if removed:
+            for stream_id in removed:
+                self.tiles.pop(stream_id).destroy()
+
+            # Close the gaps
+            for stream_id, (row, column) in grid_cells(self.tiles, self.columns).items():
+                self.tiles[stream_id].grid(row=row, column=column, padx=4, pady=4)
+
+            if not self.tiles and self.on_empty:
+                self.on_empty()
+
+        with self._lock:
+            new = [(sid, mb) for sid, mb in self._mailboxes.items() if sid not in self.tiles]
+
+        for stream_id, mailbox in new:
+            row, column = grid_cell(len(self.tiles), self.columns)
+            tile = VideoTile(
+                self,
+                stream_id,
+                mailbox,
+                self.is_alert,
+                size=self.tile_size,
+                display_fps=self.display_fps,
+                alert_fps=self.alert_fps
+            )
+            tile.grid(row=row, column=column, padx=4, pady=4)
+            self.tiles[stream_id] = tile
+
+            if self.on_new_stream:
+                self.on_new_stream(stream_id)
+
+        self.after(500, self._sync_tiles)
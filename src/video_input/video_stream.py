@@ -1,8 +1,12 @@
 import cv2
+import numpy as np
+import threading
 import time
 import yt_dlp
 import os
+import shutil
 import tempfile
+from collections import deque
 
 
 class VideoInput:
@@ -11,9 +15,31 @@ class VideoInput:
     - Camera
     - Local video file
     - URL (YouTube, remote)
+
+    With threaded=True a dedicated grabber thread decodes into a
+    preallocated ring of frame buffers and read() always returns the
+    latest frame (older unread frames are dropped).
+
+    URL sources stream by default (url_mode="stream"): yt_dlp only
+    resolves the media URL and FFmpeg decodes it progressively.
+    url_mode="download" keeps the old download-then-play behaviour.
+
+    timestamp_mode="wall" stamps frames with time.time() at capture.
+    timestamp_mode="source" stamps them with the container's presentation
+    time (seconds from the start of the source), falling back to
+    frame_index / fps when the backend reports no usable PTS. Used for
+    replay, where decisions must not depend on how fast frames are read.
+    The first PTS is subtracted, so containers that start above zero
+    (e.g. cut MPEG-TS recordings) line up with frame_index / fps, which
+    is what seek() and segment planning use.
     """
 
-    def __init__(self, source_type: str, source_value: str, width=640, height=480):
+    def __init__(self, source_type: str, source_value: str, width=640, height=480,
+                 threaded=False, buffer_size=3, url_mode="stream", url_timeout=10,
+                 timestamp_mode="wall"):
+        if timestamp_mode not in ("wall", "source"):
+            raise ValueError(f"Unsupported timestamp mode: {timestamp_mode}")
+
         self.source_type = source_type
         self.source_value = source_value
         self.width = width
@@ -22,6 +48,32 @@ class VideoInput:
         self.cap = None
         self.running = False
         self.video_path = None
+        self.url_mode = url_mode
+        self.url_timeout = url_timeout
+
+        # Frame timestamps
+        self.timestamp_mode = timestamp_mode
+        self.source_fps = 0.0
+        self._source_ts = None
+        self._pts_ok = True
+        self._pts_origin = None
+        self._next_index = 0
+
+        # Threaded capture
+        self.threaded = threaded
+        self.buffer_size = max(2, buffer_size)
+        self._grabber = None
+        self._ring = None
+        self._ring_ts = None
+        self._write_index = 0
+        self._unread = deque()
+        self._cond = threading.Condition()
+        self._eof = False
+
+        # Counters
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.frames_processed = 0
 
     # ----------------------------
     # INITIALIZATION
@@ -35,8 +87,11 @@ class VideoInput:
             self.cap = cv2.VideoCapture(self.source_value)
 
         elif self.source_type == "URL":
-            self.video_path = self._download_video(self.source_value)
-            self.cap = cv2.VideoCapture(self.video_path)
+            if self.url_mode == "download":
+                self.video_path = self._download_video(self.source_value)
+                self.cap = cv2.VideoCapture(self.video_path)
+            else:
+                self.cap = self._open_stream(self._resolve_stream_url(self.source_value))
 
         else:
             raise ValueError("Unsupported video source")
@@ -46,6 +101,16 @@ class VideoInput:
 
         self.running = True
 
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.source_fps = fps if 0 < fps < 1000 else 30.0
+        self._source_ts = None
+        self._pts_ok = True
+        self._pts_origin = None
+        self._next_index = 0
+
+        if self.threaded:
+            self._start_grabber()
+
     # ----------------------------
     # FRAME READING
     # ----------------------------
@@ -53,13 +118,143 @@ class VideoInput:
         if not self.running:
             return None, False
 
+        if self.threaded:
+            return self._read_latest()
+
         ret, frame = self.cap.read()
         if not ret:
             return None, False
 
         frame = cv2.resize(frame, (self.width, self.height))
-        timestamp = time.time()
+        timestamp = self._timestamp()
+
+        self.frames_captured += 1
+        self.frames_processed += 1
+        return frame, timestamp
+
+    def seek(self, frame_index):
+        """
+        Positions an unthreaded file source at frame_index (segment scans).
+        Source timestamps continue from the new position.
+        """
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        self._source_ts = (frame_index - 1) / self.source_fps if frame_index > 0 else None
+        self._pts_ok = True
+        self._next_index = frame_index
+
+    def frame_count(self):
+        count = self.cap.get(cv2.CAP_PROP_FRAME_COUNT) if self.cap else 0
+        return int(count) if count > 0 else 0
+
+    def stats(self):
+        return {
+            "captured": self.frames_captured,
+            "dropped": self.frames_dropped,
+            "processed": self.frames_processed
+        }
+
+    # ----------------------------
+    # TIMESTAMPS
+    # ----------------------------
+    def _timestamp(self):
+        """
+        Called right after cap.read() for every decoded frame.
+        """
+        if self.timestamp_mode == "wall":
+            return time.time()
+
+        previous = self._source_ts
+        index = self._next_index
+        self._next_index += 1
+
+        if self._pts_ok:
+            # After read(), POS_MSEC is the PTS of the frame just decoded
+            pts = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+
+            # Origin: the PTS the first frame has (or would have, when
+            # the first read follows a seek)
+            if self._pts_origin is None:
+                self._pts_origin = pts - index / self.source_fps
+            pts -= self._pts_origin
+
+            if previous is None or pts > previous:
+                self._source_ts = pts
+                return pts
+
+            # PTS missing or not advancing: frame index / fps from here on
+            self._pts_ok = False
+
+        if previous is None:
+            self._source_ts = 0.0
+        else:
+            self._source_ts = previous + 1.0 / self.source_fps
+        return self._source_ts
+
+    # ----------------------------
+    # THREADED CAPTURE (RING BUFFER)
+    # ----------------------------
+    def _start_grabber(self):
+        self._ring = [
+            np.empty((self.height, self.width, 3), dtype=np.uint8)
+            for _ in range(self.buffer_size)
+        ]
+        self._ring_ts = [0.0] * self.buffer_size
+        self._write_index = 0
+        self._unread.clear()
+        self._eof = False
+
+        self._grabber = threading.Thread(target=self._grab_loop, daemon=True)
+        self._grabber.start()
+
+    def _grab_loop(self):
+        raw = None
+
+        while self.running:
+            ret, raw = self.cap.read(raw)
+            if not ret:
+                break
+
+            timestamp = self._timestamp()
+
+            with self._cond:
+                slot = self._write_index
+                self._write_index = (slot + 1) % self.buffer_size
+
+                # Ring full: overwrite the oldest unread frame
+                if slot in self._unread:
+                    self._unread.remove(slot)
+                    self.frames_dropped += 1
+
+            # Slot is not readable while being written
+            cv2.resize(raw, (self.width, self.height), dst=self._ring[slot])
+
+            with self._cond:
+                self._ring_ts[slot] = timestamp
+                self._unread.append(slot)
+                self.frames_captured += 1
+                self._cond.notify()
+
+        with self._cond:
+            self._eof = True
+            self._cond.notify_all()
 
+    def _read_latest(self):
+        with self._cond:
+            while not self._unread and not self._eof and self.running:
+                self._cond.wait(timeout=0.5)
+
+            if not self._unread:
+                return None, False
+
+            # Always-latest: skip anything older than the newest frame
+            slot = self._unread.pop()
+            self.frames_dropped += len(self._unread)
+            self._unread.clear()
+
+            frame = self._ring[slot].copy()
+            timestamp = self._ring_ts[slot]
+
+        self.frames_processed += 1
         return frame, timestamp
 
     # ----------------------------
@@ -67,10 +262,16 @@ class VideoInput:
     # ----------------------------
     def stop(self):
         self.running = False
+        if self._grabber:
+            with self._cond:
+                self._cond.notify_all()
+            self._grabber.join(timeout=1)
+            self._grabber = None
         if self.cap:
             self.cap.release()
         if self.video_path and os.path.exists(self.video_path):
-            os.remove(self.video_path)
+            shutil.rmtree(os.path.dirname(self.video_path), ignore_errors=True)
+            self.video_path = None
 
     # ----------------------------
     # URL VIDEO HANDLING
@@ -89,3 +290,44 @@ class VideoInput:
             ydl.download([url])
 
         return output_path
+
+    def _resolve_stream_url(self, url):
+        """
+        Resolves a page URL (YouTube, etc.) to a directly playable media
+        URL without downloading anything. Direct media URLs that yt_dlp
+        can't handle are returned unchanged.
+        """
+        ydl_opts = {
+            "format": "best[ext=mp4]/best",
+            "quiet": True,
+            "noplaylist": True
+        }
+
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+        except yt_dlp.utils.DownloadError:
+            return url
+
+        if info.get("url"):
+            return info["url"]
+
+        formats = info.get("requested_formats") or info.get("formats") or []
+        for fmt in reversed(formats):
+            if fmt.get("url") and fmt.get("vcodec") != "none":
+                return fmt["url"]
+
+        return url
+
+    def _open_stream(self, media_url):
+        # FFmpeg decodes progressively with bounded buffering; the
+        # timeouts keep start() and stop() from hanging on dead streams
+        timeout_ms = int(self.url_timeout * 1000)
+        return cv2.VideoCapture(
+            media_url,
+            cv2.CAP_FFMPEG,
+            [
+                cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, timeout_ms,
+                cv2.CAP_PROP_READ_TIMEOUT_MSEC, timeout_ms
+            ]
+        )
@@ -0,0 +1,95 @@
+import math
+
+import cv2
+import numpy as np
+import pytest
+
+from archive.archive_scanner import merge_events, plan_segments
+from common.params import parse_param
+from video_input.video_stream import VideoInput
+
+
+class OffsetCapture:
+    """
+    cv2.VideoCapture stand-in whose PTS starts at 5 s, like a cut
+    MPEG-TS recording.
+    """
+
+    def __init__(self, start_ms=5000.0, fps=10):
+        self.start_ms = start_ms
+        self.fps = fps
+        self.index = 0
+        self.decoded = None
+
+    def read(self, image=None):
+        self.decoded = self.index
+        self.index += 1
+        return True, np.zeros((48, 64, 3), dtype=np.uint8)
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self.start_ms + self.decoded * 1000.0 / self.fps
+        return 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.index = int(value)
+
+    def release(self):
+        pass
+
+
+def offset_input():
+    video_input = VideoInput("Local Video", "clip.ts", timestamp_mode="source")
+    video_input.cap = OffsetCapture()
+    video_input.source_fps = 10.0
+    video_input.running = True
+    return video_input
+
+
+def test_source_timestamps_start_at_zero():
+    video_input = offset_input()
+    stamps = [video_input.read()[1] for _ in range(3)]
+    assert stamps == pytest.approx([0.0, 0.1, 0.2])
+
+
+def test_seek_lines_up_with_frame_index():
+    # A segment scan seeks by frame index and compares against index / fps
+    video_input = offset_input()
+    video_input.seek(30)
+    stamps = [video_input.read()[1] for _ in range(2)]
+    assert stamps == pytest.approx([3.0, 3.1])
+
+
+def test_plan_segments(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    for _ in range(25):
+        writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+    writer.release()
+
+    duration, segments = plan_segments(path, 1.0)
+    assert duration == pytest.approx(2.5)
+    assert segments == [(0.0, 1.0), (1.0, 2.0), (2.0, math.inf)]
+
+
+def test_merge_events_joins_across_boundaries():
+    def event(start, end, confidence, boxes=1):
+        return {"start_s": start, "end_s": end, "max_confidence": confidence, "max_boxes": boxes}
+
+    results = [
+        {"start_s": 10.0, "fps": 10, "events": [event(10.0, 10.5, 0.6), event(15.0, 16.0, 0.9)]},
+        {"start_s": 0.0, "fps": 10, "events": [event(9.0, 10.0, 0.8, boxes=3)]},
+    ]
+
+    merged = merge_events(results)
+    assert [(e["start_s"], e["end_s"]) for e in merged] == [(9.0, 10.5), (15.0, 16.0)]
+    assert merged[0]["max_confidence"] == 0.8
+    assert merged[0]["max_boxes"] == 3
+    assert merged[0]["duration_s"] == 1.5
+
+
+def test_parse_param():
+    assert parse_param("min_fire_area=300") == ("min_fire_area", 300)
+    assert parse_param("color_mode=lut") == ("color_mode", "lut")
+    assert parse_param("tracking=true") == ("tracking", True)
@@ -0,0 +1,49 @@
+import pytest
+
+from detection.backends import DetectorBackend, create_backend
+from detection.fire_detector import FireDetector
+
+
+class StaticBackend(DetectorBackend):
+    def process_frame(self, frame, timestamp):
+        return False, 0.0, []
+
+    def reset(self):
+        pass
+
+
+def test_interface_is_abstract():
+    with pytest.raises(TypeError):
+        DetectorBackend()
+
+    class Incomplete(DetectorBackend):
+        def reset(self):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_capabilities():
+    backend = StaticBackend()
+    assert not backend.supports_snapshots
+    assert backend.TUNABLE == ()
+    with pytest.raises(ValueError):
+        backend.update_params(min_fire_area=100)
+
+    assert FireDetector.supports_snapshots
+    assert "min_fire_area" in FireDetector.TUNABLE
+
+
+def test_process_batch_default():
+    assert StaticBackend().process_batch([None, None], [0.0, 0.1]) == [(False, 0.0, [])] * 2
+
+
+def test_create_backend():
+    assert isinstance(create_backend("color", min_fire_area=100), FireDetector)
+    assert isinstance(create_backend(f"{__name__}:StaticBackend"), StaticBackend)
+
+    with pytest.raises(ValueError):
+        create_backend("no-such-backend")
+    with pytest.raises(TypeError):
+        create_backend("collections:OrderedDict")
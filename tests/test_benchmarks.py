@@ -0,0 +1,60 @@
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks.fire_benchmark import _recorded_clip, run_clip, summarize
+from benchmarks.synthetic import generate_clip, write_clip
+
+SIZE = (320, 240)
+
+
+def clip(scenario, seed=0, frames=40):
+    return list(generate_clip(scenario, seed=seed, frames=frames, size=SIZE))
+
+
+def test_clips_are_reproducible():
+    a, b = clip("fire", seed=3), clip("fire", seed=3)
+    assert all(np.array_equal(fa, fb) for (fa, _), (fb, _) in zip(a, b))
+    assert not np.array_equal(a[-1][0], clip("fire", seed=4)[-1][0])
+
+
+def test_labels_mark_the_fire_only():
+    labels = [label for _, label in clip("fire")]
+    assert labels == [False] * 10 + [True] * 30
+    assert not any(label for _, label in clip("orange_moving"))
+
+
+def test_unknown_scenario():
+    with pytest.raises(ValueError):
+        clip("smoke")
+
+
+def test_run_clip_and_summary():
+    results = [
+        run_clip("fire#0", clip("fire", frames=60), 25, {}),
+        run_clip("empty#0", clip("empty", frames=60), 25, {}),
+    ]
+
+    fire, empty = results
+    assert fire["frames"] == 60
+    assert fire["recall"] is not None and "color" in fire["latency"]
+    assert empty["recall"] is None and empty["false_positive_frames"] == 0
+
+    summary = summarize(results)
+    assert summary["fire_clips"] == 1
+    assert summary["clean_clips"] == 1
+    assert summary["false_alarm_clips"] == 0
+
+
+def test_recorded_clip_labels(tmp_path):
+    path = str(tmp_path / "fire.avi")
+    write_clip(path, frames=20, fps=10, size=SIZE)
+    with open(path + ".labels.json", "w", encoding="utf-8") as f:
+        json.dump({"fire": [[1.0, 1.5]]}, f)
+
+    fps, frames = _recorded_clip(path)
+    labels = [label for _, label in frames]
+
+    assert fps == 10
+    assert labels == [False] * 10 + [True] * 6 + [False] * 4
@@ -0,0 +1,17 @@
+import pytest
+
+import main
+
+
+def test_zone_pairs():
+    args = main.parse_args(["--zone", "cam0=kitchen", "--zone", "cam1=garage=east"])
+    assert dict(args.zone) == {"cam0": "kitchen", "cam1": "garage=east"}
+
+
+@pytest.mark.parametrize("value", ["cam0", "=kitchen", "cam0="])
+def test_malformed_zone_is_a_usage_error(value, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main.parse_args(["--zone", value])
+
+    assert exc.value.code == 2
+    assert "expected CAMERA=ZONE" in capsys.readouterr().err
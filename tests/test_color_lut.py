@@ -0,0 +1,53 @@
+import cv2
+import numpy as np
+import pytest
+
+from detection.color_lut import ColorLUT
+
+LOWER, UPPER = (0, 120, 70), (35, 255, 255)
+
+
+def reference(frame, lower=LOWER, upper=UPPER):
+    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    return cv2.inRange(hsv, np.array(lower), np.array(upper))
+
+
+@pytest.fixture
+def frame():
+    return np.random.default_rng(0).integers(0, 256, (120, 160, 3), dtype=np.uint8)
+
+
+def test_exact_table_matches_inrange(frame):
+    lut = ColorLUT(LOWER, UPPER, quant_bits=8)
+    np.testing.assert_array_equal(lut.classify(frame), reference(frame))
+
+
+def test_quantized_table_mismatch_is_small(frame):
+    lut = ColorLUT(LOWER, UPPER, quant_bits=6)
+    mismatch = np.mean(lut.classify(frame) != reference(frame))
+    assert mismatch < 0.05
+
+
+def test_bounds_rebuild_only_on_change(frame):
+    lut = ColorLUT(LOWER, UPPER, quant_bits=5)
+    assert not lut.set_bounds(list(LOWER), np.array(UPPER))
+    assert lut.builds == 1
+
+    assert lut.set_bounds((0, 50, 50), (20, 255, 255))
+    assert lut.builds == 2
+
+    # quant_bits=5 bins are 8 levels wide; compare on bin centers
+    centers = (frame & 0xF8) | 4
+    np.testing.assert_array_equal(lut.classify(centers), reference(centers, (0, 50, 50), (20, 255, 255)))
+
+
+def test_buffers_stay_bounded():
+    lut = ColorLUT(LOWER, UPPER, quant_bits=4)
+    for size in range(10, 10 + 2 * ColorLUT.MAX_BUFFERS):
+        lut.classify(np.zeros((size, size, 3), dtype=np.uint8))
+    assert len(lut._buffers) <= ColorLUT.MAX_BUFFERS
+
+
+def test_rejects_bad_quant_bits():
+    with pytest.raises(ValueError):
+        ColorLUT(LOWER, UPPER, quant_bits=9)
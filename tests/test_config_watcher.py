@@ -0,0 +1,90 @@
+import json
+import os
+
+from engine.config_watcher import ConfigWatcher
+
+
+class Recorder:
+    def __init__(self):
+        self.changes = []
+        self.errors = []
+
+    def on_change(self, params, stream_id):
+        if params.get("min_fire_area", 0) < 0:
+            raise ValueError("min_fire_area must be >= 0")
+        self.changes.append((stream_id, params))
+
+
+def write(path, config, mtime):
+    path.write_text(json.dumps(config), encoding="utf-8")
+    # Distinct mtimes even on coarse filesystem clocks
+    os.utime(path, ns=(mtime, mtime))
+
+
+def watcher(path, recorder):
+    return ConfigWatcher(str(path), recorder.on_change, on_error=recorder.errors.append)
+
+
+def test_reports_only_changed_values(tmp_path):
+    path = tmp_path / "params.json"
+    recorder = Recorder()
+    w = watcher(path, recorder)
+
+    write(path, {"confidence_threshold": 0.7, "cameras": {"cam3": {"min_fire_area": 900}}}, 10**9)
+    assert w.poll()
+    assert recorder.changes == [(None, {"confidence_threshold": 0.7}), ("cam3", {"min_fire_area": 900})]
+
+    # Unchanged mtime: not reloaded
+    assert not w.poll()
+
+    write(path, {"confidence_threshold": 0.6, "cameras": {"cam3": {"min_fire_area": 900}}}, 2 * 10**9)
+    recorder.changes.clear()
+    assert w.poll()
+    assert recorder.changes == [(None, {"confidence_threshold": 0.6})]
+
+
+def test_invalid_file_is_skipped_until_fixed(tmp_path):
+    path = tmp_path / "params.json"
+    recorder = Recorder()
+    w = watcher(path, recorder)
+
+    path.write_text("{\"confidence_threshold\": ", encoding="utf-8")
+    os.utime(path, ns=(10**9, 10**9))
+    assert not w.poll()
+    assert recorder.errors and recorder.errors[0].startswith("Config not loaded")
+    assert not w.poll()  # same broken file: no repeated error
+    assert len(recorder.errors) == 1
+
+    write(path, {"confidence_threshold": 0.5}, 2 * 10**9)
+    assert w.poll()
+    assert recorder.changes == [(None, {"confidence_threshold": 0.5})]
+
+
+def test_rejected_values_are_reported(tmp_path):
+    path = tmp_path / "params.json"
+    recorder = Recorder()
+
+    write(path, {"min_fire_area": -1}, 10**9)
+    assert watcher(path, recorder).poll()
+    assert recorder.changes == []
+    assert recorder.errors == ["Config rejected (min_fire_area must be >= 0)"]
+
+
+def test_missing_file(tmp_path):
+    recorder = Recorder()
+    assert not watcher(tmp_path / "absent.json", recorder).poll()
+    assert recorder.errors == []
+
+
+def test_rejected_section_is_reapplied_once_fixed(tmp_path):
+    path = tmp_path / "params.json"
+    recorder = Recorder()
+    w = watcher(path, recorder)
+
+    write(path, {"confidence_threshold": 0.7, "min_fire_area": -1}, 10**9)
+    assert w.poll()
+    assert recorder.changes == []
+
+    write(path, {"confidence_threshold": 0.7, "min_fire_area": 900}, 2 * 10**9)
+    assert w.poll()
+    assert recorder.changes == [(None, {"confidence_threshold": 0.7, "min_fire_area": 900})]
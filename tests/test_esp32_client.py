@@ -0,0 +1,248 @@
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("paho.mqtt")
+
+from communication.esp32_client import BINARY_ALERT, BINARY_VERSION, ESP32Client
+
+
+class FakeBroker:
+    """
+    Minimal in-process MQTT 3.1.1 broker: CONNACK, PUBACK (unless
+    ack=False), PINGRESP. Records (topic, payload) of every PUBLISH.
+    The port is reserved up front; clients are refused until start().
+    """
+
+    def __init__(self, ack=True):
+        self.ack = ack
+        self.received = []
+        self._sock = socket.socket()
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(("127.0.0.1", 0))
+        self.port = self._sock.getsockname()[1]
+
+    def start(self):
+        self._sock.listen()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def close(self):
+        self._sock.close()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    @staticmethod
+    def _read(conn, n):
+        data = b""
+        while len(data) < n:
+            chunk = conn.recv(n - len(data))
+            if not chunk:
+                raise EOFError
+            data += chunk
+        return data
+
+    def _handle(self, conn):
+        try:
+            while True:
+                header = self._read(conn, 1)[0]
+                length, multiplier = 0, 1
+                while True:
+                    byte = self._read(conn, 1)[0]
+                    length += (byte & 127) * multiplier
+                    multiplier *= 128
+                    if not byte & 128:
+                        break
+                body = self._read(conn, length) if length else b""
+
+                kind = header >> 4
+                if kind == 1:  # CONNECT
+                    conn.sendall(b"\x20\x02\x00\x00")
+                elif kind == 3:  # PUBLISH
+                    qos = (header >> 1) & 3
+                    topic_len = int.from_bytes(body[:2], "big")
+                    topic = body[2:2 + topic_len].decode()
+                    rest = body[2 + topic_len:]
+                    if qos:
+                        mid, rest = rest[:2], rest[2:]
+                        if self.ack:
+                            conn.sendall(b"\x40\x02" + mid)
+                    self.received.append((topic, rest))
+                elif kind == 12:  # PINGREQ
+                    conn.sendall(b"\xd0\x00")
+                elif kind == 14:  # DISCONNECT
+                    break
+        except (EOFError, OSError):
+            pass
+        conn.close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+@pytest.fixture
+def broker():
+    broker = FakeBroker()
+    yield broker
+    broker.close()
+
+
+def make_client(broker, outbox_dir, **kwargs):
+    return ESP32Client(
+        broker="127.0.0.1",
+        port=broker.port,
+        outbox_dir=str(outbox_dir),
+        min_reconnect_delay=0.1,
+        max_reconnect_delay=0.2,
+        zones={"cam1": "hall", "cam2": "yard"},
+        **kwargs
+    )
+
+
+def outbox(path):
+    return sorted(name for name in os.listdir(path) if name.endswith(".json"))
+
+
+def test_offline_alerts_replayed_in_order_and_acked(broker, tmp_path):
+    client = make_client(broker, tmp_path)
+    try:
+        client.send_fire_alert(0.7, camera="cam1")
+        client.send_fire_alert(0.8, camera="cam2")
+        client.send_fire_alert(0.9)
+
+        assert not client.connected
+        assert len(outbox(tmp_path)) == 3
+
+        broker.start()
+        assert wait_for(lambda: len(broker.received) == 3)
+        assert [topic for topic, _ in broker.received] == \
+            ["fire/alert/hall", "fire/alert/yard", "fire/alert"]
+        assert [json.loads(p)["confidence"] for _, p in broker.received] == [0.7, 0.8, 0.9]
+
+        # QoS 1: removed from the outbox once the broker acknowledged
+        assert wait_for(lambda: not outbox(tmp_path))
+        assert client.stats()["delivered"] == 3
+    finally:
+        client.shutdown()
+
+
+def test_unacked_alert_survives_restart(broker, tmp_path):
+    broker.ack = False
+    broker.start()
+
+    client = make_client(broker, tmp_path)
+    try:
+        assert wait_for(lambda: client.connected)
+        client.send_fire_alert(0.7, camera="cam1")
+        assert wait_for(lambda: len(broker.received) == 1)
+        time.sleep(0.2)
+        assert len(outbox(tmp_path)) == 1
+    finally:
+        client.shutdown()
+
+    broker.ack = True
+    client = make_client(broker, tmp_path)
+    try:
+        assert wait_for(lambda: len(broker.received) == 2)
+        assert broker.received[1][0] == "fire/alert/hall"
+        assert wait_for(lambda: not outbox(tmp_path))
+    finally:
+        client.shutdown()
+
+
+def test_expired_and_cancelled_alerts_not_replayed(broker, tmp_path):
+    client = make_client(broker, tmp_path, max_message_age=60)
+    try:
+        client.send_fire_alert(0.5, camera="cam2")
+        client.send_fire_alert(0.7, camera="cam1")
+        client.deactivate_buzzer()
+        client.send_fire_alert(0.9, camera="cam2")
+
+        # The first alert was raised long ago
+        oldest = os.path.join(tmp_path, outbox(tmp_path)[0])
+        with open(oldest, encoding="utf-8") as f:
+            entry = json.load(f)
+        entry["created"] -= 3600
+        with open(oldest, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+
+        broker.start()
+        assert wait_for(lambda: len(broker.received) == 2)
+        time.sleep(0.2)
+
+        # The OFF cancelled the hall alert; only the later yard alert remains
+        assert [topic for topic, _ in broker.received] == ["fire/alert", "fire/alert/yard"]
+        assert json.loads(broker.received[1][1])["confidence"] == 0.9
+        assert wait_for(lambda: not outbox(tmp_path))
+        assert client.stats()["expired"] == 2
+    finally:
+        client.shutdown()
+
+
+def test_burst_is_coalesced_into_a_trailing_message(broker, tmp_path):
+    broker.start()
+    client = make_client(broker, tmp_path, coalesce_window=0.3)
+    try:
+        assert wait_for(lambda: client.connected)
+        for confidence in (0.6, 0.9, 0.7, 0.8):
+            client.send_fire_alert(confidence, camera="cam1")
+
+        assert wait_for(lambda: len(broker.received) == 2)
+        leading, trailing = (json.loads(p) for _, p in broker.received)
+        assert leading["confidence"] == 0.6 and "count" not in leading
+        assert trailing["confidence"] == 0.9 and trailing["count"] == 3
+    finally:
+        client.shutdown()
+
+
+def test_deactivate_cancels_open_burst(broker, tmp_path):
+    broker.start()
+    client = make_client(broker, tmp_path, coalesce_window=0.3)
+    try:
+        assert wait_for(lambda: client.connected)
+        client.send_fire_alert(0.6, camera="cam1")
+        client.send_fire_alert(0.9, camera="cam1")
+        client.deactivate_buzzer()
+
+        assert wait_for(lambda: len(broker.received) == 2)
+        time.sleep(0.6)
+        assert [topic for topic, _ in broker.received] == ["fire/alert/hall", "fire/alert"]
+        assert client._bursts == {}
+    finally:
+        client.shutdown()
+
+
+def test_binary_payload(broker, tmp_path):
+    broker.start()
+    client = make_client(broker, tmp_path, payload_format="binary")
+    try:
+        assert wait_for(lambda: client.connected)
+        client.send_fire_alert(0.75, camera="cam2")
+        client.deactivate_buzzer()
+
+        assert wait_for(lambda: len(broker.received) == 2)
+        fire = BINARY_ALERT.unpack(broker.received[0][1])
+        off = BINARY_ALERT.unpack(broker.received[1][1])
+
+        assert broker.received[0][0] == "fire/alert/yard"
+        assert fire[:3] == (b"F", BINARY_VERSION, 1)
+        assert fire[3] == pytest.approx(0.75)
+        assert abs(fire[4] - time.time()) < 5
+        assert off[0] == b"O"
+    finally:
+        client.shutdown()
@@ -0,0 +1,144 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from event_logging.event_logger import EventLogger, _STOP
+from event_logging.event_types import EventType
+from event_logging.log_index import LogIndex
+
+
+def fill(logger, n):
+    messages = []
+    for i in range(n):
+        message = f"Fire detected (confidence=0.{i:02d})" if i % 3 == 0 else f"Stream started {i}"
+        logger.log(message)
+        messages.append(message)
+    return messages
+
+
+def test_reads_span_rotated_files(tmp_path):
+    logger = EventLogger(str(tmp_path / "events.csv"), max_bytes=300)
+    messages = fill(logger, 40)
+
+    assert len(logger.rotated_files()) >= 3
+
+    assert [m for _, m in logger.read_all()] == messages
+    assert [m for _, m in logger.read_all(limit=25)] == messages[-25:]
+
+    everything = logger.read_range(0)
+    assert [m for _, m in everything] == messages
+
+    fires = [m for m in messages if m.startswith("Fire detected")]
+    assert [m for _, m in logger.read_events(EventType.FIRE)] == fires
+    assert [m for _, m in logger.read_events(EventType.FIRE, limit=5)] == fires[-5:]
+    logger.close()
+
+
+def test_rotated_files_order_within_one_second(tmp_path):
+    logger = EventLogger(str(tmp_path / "events.csv"))
+    for name in ("events.20261017-020318-1.csv", "events.20261017-020318.csv",
+                 "events.20261017-020318-10.csv", "events.20261017-020318-2.csv",
+                 "events.20261016-235959.csv"):
+        (tmp_path / name).write_text("timestamp,event\n")
+
+    assert [p.rsplit("/", 1)[-1] for p in logger.rotated_files()] == [
+        "events.20261016-235959.csv", "events.20261017-020318.csv",
+        "events.20261017-020318-1.csv", "events.20261017-020318-2.csv",
+        "events.20261017-020318-10.csv"
+    ]
+    logger.close()
+
+
+def test_async_reads_see_queued_rows(tmp_path):
+    logger = EventLogger(str(tmp_path / "events.csv"), async_mode=True, max_bytes=300)
+    messages = fill(logger, 20)
+    assert [m for _, m in logger.read_all()] == messages
+    logger.close()
+
+
+def test_range_query_after_clock_step_back(tmp_path):
+    path = tmp_path / "events.csv"
+    stamps = ["2026-10-17 10:00:00", "2026-10-17 10:00:05", "2026-10-17 09:59:00",
+              "2026-10-17 10:00:10"]
+    path.write_text("timestamp,event\n" + "".join(f"{s},row {i}\n" for i, s in enumerate(stamps)))
+
+    index = LogIndex(str(path))
+    index.sync()
+    index.close()
+    assert index.is_unsorted()
+
+    def epoch(stamp):
+        return int(datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S").timestamp())
+
+    logger = EventLogger(str(path))
+    rows = logger.read_range(epoch("2026-10-17 09:59:30"), epoch("2026-10-17 10:00:07"))
+    assert [m for _, m in rows] == ["row 0", "row 1"]
+
+    rows = logger.read_range(epoch("2026-10-17 09:58:00"), epoch("2026-10-17 09:59:30"))
+    assert [m for _, m in rows] == ["row 2"]
+    logger.close()
+
+
+def test_sorted_index_uses_bisection(tmp_path):
+    logger = EventLogger(str(tmp_path / "events.csv"))
+    fill(logger, 5)
+    assert not logger.index.is_unsorted()
+    now = time.time()
+    assert len(logger.read_range(now - 60, now + 60)) == 5
+    logger.close()
+
+
+def test_writer_error_is_recorded_and_flush_returns(tmp_path):
+    logger = EventLogger(str(tmp_path / "events.csv"), async_mode=True)
+    append_rows = logger._append_rows
+    failures = []
+
+    def failing_append(rows):
+        if not failures:
+            failures.append(rows)
+            raise OSError(28, "No space left on device")
+        append_rows(rows)
+
+    logger._append_rows = failing_append
+    logger.log("Stream started")
+    logger.flush(timeout=5)
+
+    assert isinstance(logger.writer_error, OSError)
+    assert logger.dropped == 1
+
+    # The writer keeps going
+    logger.log("Fire detected (confidence=0.90)")
+    logger.flush(timeout=5)
+    assert [m for _, m in logger.read_all()] == ["Fire detected (confidence=0.90)"]
+    logger.close()
+
+
+def test_flush_raises_when_writer_is_gone(tmp_path):
+    logger = EventLogger(str(tmp_path / "events.csv"), async_mode=True)
+    logger._queue.put(_STOP)
+    logger._writer.join(timeout=5)
+
+    # Rows stranded in the queue of a dead writer
+    logger._queue.put(("2026-10-17 10:00:00", "lost", datetime.now(), None))
+    with pytest.raises(RuntimeError):
+        logger.flush(timeout=5)
+
+    # log() falls back to synchronous writes; close() does not hang
+    logger.log("Stream started")
+    logger.close()
+    assert logger.read_all()[-1][1] == "Stream started"
+
+
+def test_multiline_message_stays_one_row(tmp_path):
+    logger = EventLogger(str(tmp_path / "events.csv"))
+    logger.log("Detection error: OpenCV(4.14) error:\n  resize failed\r\n")
+    logger.log("FIRE detected")
+
+    rows = logger.read_all(limit=2)
+    assert [message for _, message in rows] == [
+        "Detection error: OpenCV(4.14) error:   resize failed ",
+        "FIRE detected"
+    ]
+    assert len(logger.read_range(0)) == 2
+    assert len(logger.read_all()) == 2
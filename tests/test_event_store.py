@@ -0,0 +1,83 @@
+import math
+
+import numpy as np
+import pytest
+
+from event_logging.event_logger import EventLogger
+from event_logging.event_store import RECORD, EventStore
+from event_logging.event_types import EventType
+
+DAY = 86400
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EventStore(str(tmp_path / "events.bin"))
+    store.append(10 * DAY + 100, "cam0", EventType.FIRE, 0.9, 2)
+    store.append(10 * DAY + 200, "cam1", EventType.FIRE, 0.7, 1)
+    store.append(10 * DAY + 300, "cam0", EventType.CLEAR)
+    store.append(11 * DAY + 100, "cam0", EventType.FIRE, 0.8, 3)
+    yield store
+    store.close()
+
+
+def test_query_filters(store):
+    assert len(store.query()) == 4
+    assert list(store.query(start=10 * DAY + 200, end=10 * DAY + 300)["event"]) == [
+        EventType.FIRE, EventType.CLEAR
+    ]
+    assert list(store.query(event_type=EventType.FIRE, camera="cam0")["boxes"]) == [2, 3]
+    assert len(store.query(camera="cam9")) == 0
+
+
+def test_missing_confidence_is_nan(store):
+    clear = store.query(event_type=EventType.CLEAR)
+    assert math.isnan(clear["confidence"][0])
+
+
+def test_daily_counts(store):
+    days, cameras, counts = store.daily_counts()
+
+    assert list(days.astype(np.int64)) == [10, 11]
+    assert [store.camera_names()[c] for c in cameras] == ["cam0", "cam1"]
+    np.testing.assert_array_equal(counts, [[1, 1], [1, 0]])
+
+
+def test_reopen_keeps_cameras_and_drops_partial_record(store, tmp_path):
+    store.close()
+    with open(store.path, "ab") as f:
+        f.write(b"\x00" * (RECORD.size - 3))
+
+    reopened = EventStore(store.path)
+    assert len(reopened.records()) == 4
+    assert reopened.camera_id("cam1") == 1
+    assert reopened.camera_id("cam2") == 2
+    reopened.close()
+
+
+def test_logger_writes_structured_records(tmp_path):
+    logger = EventLogger(str(tmp_path / "log.csv"), store_file=str(tmp_path / "log.bin"))
+    logger.log("[cam3] Fire detected (confidence=0.81)", confidence=0.81, camera="cam3", box_count=2)
+    logger.log("Buzzer deactivated")
+
+    fires = logger.query(event_type=EventType.FIRE)
+    assert len(fires) == 1
+    assert fires["confidence"][0] == pytest.approx(0.81)
+    assert logger.store.camera_names()[fires["camera"][0]] == "cam3"
+    assert len(logger.query(event_type=EventType.BUZZER_OFF, camera="main")) == 1
+    logger.close()
+
+
+def test_query_after_clock_step_back(tmp_path):
+    path = str(tmp_path / "events.bin")
+    store = EventStore(path)
+    for timestamp in (100, 200, 150, 300):
+        store.append(timestamp, "cam0", EventType.FIRE)
+
+    assert list(store.query(start=140, end=210)["timestamp"]) == [200, 150]
+    assert list(store.query(end=150)["timestamp"]) == [100, 150]
+    store.close()
+
+    # Reopened: order is re-checked from the file
+    reopened = EventStore(path)
+    assert list(reopened.query(start=140, end=210)["timestamp"]) == [200, 150]
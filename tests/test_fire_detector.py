@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import generate_clip
+from detection.fire_detector import FireDetector
+from engine.stream_engine import snapshot_path
+
+SIZE = (320, 240)
+
+
+def clip(scenario="fire", frames=120):
+    return [frame for frame, _ in generate_clip(scenario, seed=0, frames=frames, size=SIZE)]
+
+
+def run(detector, frames):
+    return [detector.process_frame(frame, i / 25) for i, frame in enumerate(frames)]
+
+
+@pytest.fixture(scope="module")
+def fire_frames():
+    return clip("fire")
+
+
+def test_process_batch_matches_process_frame(fire_frames):
+    timestamps = [i / 25 for i in range(len(fire_frames))]
+
+    sequential = run(FireDetector(min_fire_area=150), fire_frames)
+
+    batched = []
+    detector = FireDetector(min_fire_area=150)
+    for start in range(0, len(fire_frames), 8):
+        batched += detector.process_batch(np.stack(fire_frames[start:start + 8]), timestamps[start:start + 8])
+
+    assert batched == sequential
+    assert any(boxes for _, _, boxes in sequential)
+
+
+def test_build_roi_mask():
+    mask = FireDetector.build_roi_mask((40, 20), exclude=[[(0, 0), (9, 0), (9, 19), (0, 19)]])
+    assert mask.shape == (20, 40)
+    assert not mask[:, :10].any() and mask[:, 10:].all()
+
+    include = FireDetector.build_roi_mask((40, 20), include=[[(30, 0), (39, 0), (39, 19), (30, 19)]])
+    assert include[:, 30:].all() and not include[:, :30].any()
+
+
+def test_roi_suppresses_excluded_regions(fire_frames):
+    # Mask at another resolution is resized to the frame
+    corner = [[(0, 0), (60, 0), (60, 60), (0, 60)]]
+    detector = FireDetector(min_fire_area=150, roi_mask=FireDetector.build_roi_mask((640, 480), include=corner))
+
+    assert not any(boxes for _, _, boxes in run(detector, fire_frames))
+
+
+def test_motion_gate_keeps_fire_and_drops_static_color(fire_frames):
+    gated = run(FireDetector(min_fire_area=150, motion_gate=True), fire_frames)
+    assert any(fire for fire, _, _ in gated)
+
+    static = run(FireDetector(min_fire_area=150, motion_gate=True), clip("orange_static"))
+    assert not any(fire for fire, _, _ in static)
+
+
+def test_pyramid_matches_single_scale(fire_frames):
+    detector = FireDetector(min_fire_area=150, pyramid=True, pyramid_audit=True, coarse_size=(80, 60))
+    results = run(detector, fire_frames)
+
+    assert any(fire for fire, _, _ in results)
+    assert detector.pyramid_stats["frames"] == len(fire_frames)
+    assert detector.pyramid_recall() >= 0.9
+
+
+def test_pyramid_recall_unknown_without_positives():
+    detector = FireDetector(pyramid=True, pyramid_audit=True)
+    run(detector, clip("empty", frames=10))
+    assert detector.pyramid_recall() is None
+
+
+def test_snapshot_round_trip(fire_frames, tmp_path):
+    path = str(tmp_path / "snapshots" / "cam0.npz")
+    source = FireDetector(min_fire_area=150)
+    run(source, fire_frames[:40])
+    assert source.save_snapshot(path)
+
+    # Configured MOG2 parameters win over the snapshot's
+    warm = FireDetector(min_fire_area=150, mog2_history=200)
+    age = warm.load_snapshot(path)
+    assert age is not None and age < 5
+    assert warm.bg_subtractor.getHistory() == 200
+    assert list(warm.confidence_buffer) == pytest.approx(list(source.confidence_buffer))
+
+    # Too old for temporal state: background only
+    stale = FireDetector(min_fire_area=150)
+    assert stale.load_snapshot(path, max_state_age=-1) is not None
+    assert not stale.confidence_buffer
+
+
+def test_missing_snapshot(tmp_path):
+    assert FireDetector().load_snapshot(str(tmp_path / "absent.npz")) is None
+
+
+def test_snapshot_path_is_keyed_by_source():
+    a = snapshot_path("snaps", "Camera", "0")
+    assert a == snapshot_path("snaps", "Camera", "0")
+    assert a != snapshot_path("snaps", "Camera", "1")
+    assert snapshot_path("snaps", "Camera", "0", "cam0").endswith(".npz")
+    assert snapshot_path("snaps", "Camera", "0", "cam0") != a
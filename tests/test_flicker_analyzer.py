@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from detection.flicker_analyzer import FlickerAnalyzer
+from detection.region_tracker import RegionTracker
+
+FPS = 30
+BOX = (40, 30, 32, 32)
+
+
+def run(method, brightness, frames=64):
+    """
+    Feeds one tracked region whose luminance follows brightness(t).
+    """
+    tracker = RegionTracker()
+    analyzer = FlickerAnalyzer(method=method)
+    rng = np.random.default_rng(1)
+    texture = rng.integers(-20, 20, (BOX[3], BOX[2], 1))
+
+    for i in range(frames):
+        t = i / FPS
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        x, y, w, h = BOX
+        frame[y:y + h, x:x + w] = np.clip(brightness(t) + texture, 0, 255)
+
+        tracker.update([BOX], [w * h], t)
+        analyzer.sample(frame, tracker, tracker.live_slots(), t)
+
+    return analyzer.scores(tracker.live_slots())[0]
+
+
+@pytest.mark.parametrize("method", ["fft", "zero_crossing"])
+def test_flame_rate_flicker_scores_high(method):
+    assert run(method, lambda t: 128 + 60 * np.sin(2 * np.pi * 6 * t)) > 0.7
+
+
+@pytest.mark.parametrize("method", ["fft", "zero_crossing"])
+def test_slow_drift_scores_low(method):
+    assert run(method, lambda t: 128 + 60 * np.sin(2 * np.pi * 0.2 * t)) < 0.3
+
+
+def test_steady_region_scores_zero():
+    assert run("fft", lambda t: 128) == 0.0
+
+
+def test_needs_min_samples():
+    assert run("fft", lambda t: 128 + 60 * np.sin(2 * np.pi * 6 * t), frames=8) == 0.0
+
+
+def test_reused_slot_starts_over():
+    tracker = RegionTracker(capacity=1, max_misses=0)
+    analyzer = FlickerAnalyzer(capacity=1)
+    frame = np.full((120, 160, 3), 100, dtype=np.uint8)
+
+    tracker.update([BOX], [1024.0], 0.0)
+    analyzer.sample(frame, tracker, tracker.live_slots(), 0.0)
+    tracker.update([], [], 0.1)
+    tracker.update([(100, 80, 20, 20)], [400.0], 0.2)
+    analyzer.sample(frame, tracker, tracker.live_slots(), 0.2)
+
+    assert analyzer.count[0] == 1
+    assert analyzer.track_ids[0] == 2
+
+
+def test_memory_budget_sets_history():
+    analyzer = FlickerAnalyzer(capacity=8, patch_size=(16, 16), memory_budget=8 * 256 * 40)
+    assert analyzer.history == 40
+    assert analyzer.patches.nbytes == 8 * 256 * 40
+
+
+def test_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        FlickerAnalyzer(method="wavelet")
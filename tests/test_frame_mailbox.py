@@ -0,0 +1,38 @@
+import threading
+
+from ui.frame_mailbox import FrameMailbox
+
+
+def test_take_returns_latest_and_empties():
+    mailbox = FrameMailbox()
+    assert mailbox.take() is None
+
+    mailbox.post("a")
+    mailbox.post("b")
+    assert mailbox.take() == "b"
+    assert mailbox.take() is None
+    assert mailbox.stats() == {"posted": 2, "displayed": 1, "superseded": 1}
+
+
+def test_counters_balance_under_concurrency():
+    mailbox = FrameMailbox()
+    taken = []
+
+    def producer():
+        for i in range(5000):
+            mailbox.post(i)
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    while thread.is_alive():
+        frame = mailbox.take()
+        if frame is not None:
+            taken.append(frame)
+    thread.join()
+    frame = mailbox.take()
+    if frame is not None:
+        taken.append(frame)
+
+    assert taken == sorted(taken)
+    assert taken[-1] == 4999
+    assert mailbox.displayed + mailbox.superseded == mailbox.posted == 5000
@@ -0,0 +1,51 @@
+import time
+
+from engine.frame_scheduler import FrameScheduler
+
+
+def detected_frames(scheduler, timestamps, candidate=lambda ts: False):
+    return [ts for ts in timestamps if scheduler.should_detect(candidate(ts), ts)]
+
+
+def test_replay_spacing_follows_source_time():
+    timestamps = [i / 30 for i in range(61)]
+    detected = detected_frames(FrameScheduler(target_fps=0, idle_detect_fps=5), timestamps)
+
+    # Every 6th frame at 30 fps, float rounding included
+    assert detected == timestamps[::6]
+
+
+def test_replay_is_independent_of_detection_cost():
+    timestamps = [i / 25 for i in range(100)]
+
+    fast = FrameScheduler(target_fps=0, idle_detect_fps=5)
+    slow = FrameScheduler(target_fps=0, idle_detect_fps=5)
+    slow.record_detection(1.0)
+
+    assert detected_frames(fast, timestamps) == detected_frames(slow, timestamps)
+
+
+def test_candidate_detects_every_frame():
+    timestamps = [i / 30 for i in range(30)]
+    scheduler = FrameScheduler(target_fps=0, idle_detect_fps=5)
+
+    detected = detected_frames(scheduler, timestamps, candidate=lambda ts: 0.3 <= ts < 0.6)
+    assert all(ts in detected for ts in timestamps if 0.3 <= ts < 0.6)
+    assert scheduler.skipped == len(timestamps) - len(detected)
+
+
+def test_live_overload_widens_spacing():
+    scheduler = FrameScheduler(target_fps=30, idle_detect_fps=10, max_detect_duty=0.5)
+    assert scheduler._detect_spacing() == 0.1
+
+    # 0.1 s detections at 50% duty: at least 0.2 s between detections
+    scheduler.record_detection(0.1)
+    assert scheduler._detect_spacing() >= 0.2 - 1e-9
+
+
+def test_wait_sleeps_the_rest_of_the_frame():
+    scheduler = FrameScheduler(target_fps=50)
+    scheduler.begin_frame()
+    started = time.perf_counter()
+    scheduler.wait()
+    assert time.perf_counter() - started >= 0.015
@@ -0,0 +1,29 @@
+import pytest
+
+from ui.grid_layout import grid_cell, grid_cells, poll_interval_ms
+
+
+def test_tiles_fill_row_by_row():
+    assert [grid_cell(i, 2) for i in range(5)] == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]
+    assert [grid_cell(i, 3) for i in range(4)] == [(0, 0), (0, 1), (0, 2), (1, 0)]
+
+
+def test_removed_tiles_leave_no_gaps():
+    tiles = ["cam0", "cam1", "cam2", "cam3"]
+    tiles.remove("cam1")
+    assert grid_cells(tiles, 2) == {"cam0": (0, 0), "cam2": (0, 1), "cam3": (1, 0)}
+
+
+def test_alert_tiles_refresh_faster():
+    assert poll_interval_ms(False, display_fps=5, alert_fps=30) == 200
+    assert poll_interval_ms(True, display_fps=5, alert_fps=30) == 33
+    assert poll_interval_ms(True, display_fps=5, alert_fps=5000) == 1
+
+
+@pytest.mark.parametrize("call", [
+    lambda: grid_cell(0, 0),
+    lambda: poll_interval_ms(False, display_fps=0, alert_fps=30),
+])
+def test_invalid_settings(call):
+    with pytest.raises(ValueError):
+        call()
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+from ui.headless import HeadlessDashboard
+
+SRC = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+
+
+def test_main_does_not_import_the_gui():
+    code = (
+        "import sys, main; "
+        "loaded = [m for m in ('tkinter', 'customtkinter', 'PIL.ImageTk') if m in sys.modules]; "
+        "assert not loaded, loaded"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=SRC, check=True)
+
+
+def test_run_returns_when_inactive(capsys):
+    dashboard = HeadlessDashboard()
+    dashboard.display_log("2026-01-01 00:00:00", "Stream started (Camera)")
+    dashboard.trigger_fire_from_thread(0.9, stream_id="cam0")
+    assert dashboard.alert_active
+
+    dashboard.run(is_active=lambda: False, poll_interval=0.01)
+    assert not dashboard.system_running
+    assert capsys.readouterr().out == "[2026-01-01 00:00:00] Stream started (Camera)\n"
+
+
+def test_quiet_mode(capsys):
+    HeadlessDashboard(quiet=True).display_log("ts", "message")
+    assert capsys.readouterr().out == ""
+
+
+def test_shutdown_runs_once(tmp_path):
+    import main
+    from communication.console_client import ConsoleAlertClient
+    from event_logging.event_logger import EventLogger
+
+    class CountingClient(ConsoleAlertClient):
+        shutdowns = 0
+
+        def shutdown(self):
+            self.shutdowns += 1
+
+    client = CountingClient()
+    logger = EventLogger(str(tmp_path / "events.csv"))
+    controller = main.FireDetectionController(
+        HeadlessDashboard(quiet=True), logger, esp32_client=client
+    )
+
+    controller.shutdown()
+    controller.shutdown()
+    controller.__del__()
+
+    assert client.shutdowns == 1
+    messages = [message for _, message in logger.read_all()]
+    assert messages.count("System shutdown complete") == 1
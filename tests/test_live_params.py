@@ -0,0 +1,176 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import main
+from communication.console_client import ConsoleAlertClient
+from detection.fire_detector import FireDetector
+from event_logging.event_logger import EventLogger
+from ui.headless import HeadlessDashboard
+
+
+def test_update_params_queues_only_unapplied_values():
+    detector = FireDetector()
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    detector.update_params(min_fire_area=100)
+    detector.update_params(mog2_history=200)
+    assert detector._param_snapshot[1] == {"min_fire_area": 100, "mog2_history": 200}
+
+    detector.process_frame(frame, 0.0)
+    assert detector.min_fire_area == 100
+    assert detector.bg_subtractor.getHistory() == 200
+
+    # Applied values are not re-sent with the next update
+    detector.update_params(confidence_threshold=0.4)
+    assert detector._param_snapshot[1] == {"confidence_threshold": 0.4}
+
+    detector.process_frame(frame, 0.1)
+    assert detector.params()["confidence_threshold"] == 0.4
+    assert detector.params()["min_fire_area"] == 100
+
+
+def test_update_params_rejects_unknown():
+    with pytest.raises(ValueError):
+        FireDetector().update_params(color_mode="lut")
+
+
+
+def test_update_params_coerces_values():
+    detector = FireDetector()
+    detector.update_params(min_fire_area="900", hsv_lower=["0", 110, 70.0])
+    assert detector._param_snapshot[1] == {"min_fire_area": 900, "hsv_lower": (0, 110, 70)}
+
+    detector.process_frame(np.zeros((120, 160, 3), dtype=np.uint8), 0.0)
+    assert detector.min_fire_area == 900
+
+
+@pytest.mark.parametrize("params", [
+    {"min_fire_area": "nine hundred"},
+    {"min_fire_area": 9.5},
+    {"min_fire_area": -1},
+    {"confidence_threshold": 1.5},
+    {"smoothing_window": True},
+    {"hsv_lower": [0, 110]},
+    {"hsv_upper": "35,255,255"},
+    {"hsv_upper": [35, 255, 300]},
+])
+def test_update_params_rejects_bad_values(params):
+    detector = FireDetector()
+    snapshot = detector._param_snapshot
+
+    with pytest.raises(ValueError):
+        detector.update_params(**params)
+    assert detector._param_snapshot is snapshot
+
+class FakeEngine:
+    def __init__(self, **kwargs):
+        self.streams = {}
+        self.sent = []
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def add_stream(self, stream_id, source_type, source_value, backend="color", **kwargs):
+        self.streams[stream_id] = kwargs
+
+    def update_params(self, params, stream_id=None):
+        self.sent.append((stream_id, params))
+
+
+@pytest.fixture
+def controller(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "MultiStreamEngine", FakeEngine)
+    controller = main.FireDetectionController(
+        HeadlessDashboard(quiet=True),
+        EventLogger(str(tmp_path / "events.csv")),
+        esp32_client=ConsoleAlertClient()
+    )
+    yield controller
+    controller.shutdown()
+
+
+def test_camera_overrides_survive_restart(controller):
+    sources = [("cam1", "Camera", "0"), ("cam3", "Camera", "1")]
+    controller.start_streams(sources)
+
+    controller.update_params({"min_fire_area": 900}, "cam3")
+    assert controller.engine.sent == [("cam3", {"min_fire_area": 900})]
+
+    # Site-wide values do not override the camera's own
+    controller.engine.sent.clear()
+    controller.update_params({"min_fire_area": 600, "confidence_threshold": 0.7})
+    assert sorted(controller.engine.sent) == [
+        ("cam1", {"min_fire_area": 600, "confidence_threshold": 0.7}),
+        ("cam3", {"confidence_threshold": 0.7})
+    ]
+
+    # A re-created detector starts with the merged configuration
+    controller.start_streams(sources)
+    assert controller.engine.streams["cam1"] == {"min_fire_area": 600, "confidence_threshold": 0.7}
+    assert controller.engine.streams["cam3"] == {"min_fire_area": 900, "confidence_threshold": 0.7}
+
+
+def test_bad_value_never_reaches_the_workers(controller):
+    controller.start_streams([("cam1", "Camera", "0")])
+
+    with pytest.raises(ValueError):
+        controller.update_params({"min_fire_area": "big"})
+    assert controller.engine.sent == []
+    assert "min_fire_area" not in controller.detector_kwargs
+
+    controller.update_params({"min_fire_area": "900"})
+    assert controller.engine.sent == [("cam1", {"min_fire_area": 900})]
+
+
+class FakeVideoInput:
+    def __init__(self, *args, **kwargs):
+        self.frames_dropped = 0
+        self.stopped = threading.Event()
+
+    def start(self):
+        pass
+
+    def read(self):
+        time.sleep(0.01)
+        if self.stopped.is_set():
+            return None, None
+        return np.zeros((120, 160, 3), dtype=np.uint8), time.time()
+
+    def stop(self):
+        self.stopped.set()
+
+
+def test_deactivate_buzzer_resets_on_the_processing_thread(controller, monkeypatch):
+    monkeypatch.setattr(main, "VideoInput", FakeVideoInput)
+    reset_threads = []
+    reset = controller.detector.reset
+
+    def recording_reset():
+        reset_threads.append(threading.current_thread())
+        reset()
+
+    monkeypatch.setattr(controller.detector, "reset", recording_reset)
+    controller.start_stream("Video File", "clip.mp4")
+    worker = controller.worker
+    reset_threads.clear()
+
+    controller.deactivate_buzzer()
+    deadline = time.monotonic() + 5
+    while not reset_threads and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert reset_threads == [worker]
+    assert not controller._reset_requested.is_set()
+
+    # With no loop running the caller resets directly
+    controller.stop_stream()
+    worker.join(timeout=5)
+    reset_threads.clear()
+    controller.deactivate_buzzer()
+    assert reset_threads == [threading.current_thread()]
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+onnx = pytest.importorskip("onnx")
+from onnx import helper, numpy_helper, TensorProto
+
+from detection.fire_detector import FireDetector
+from detection.onnx_verifier import OnnxVerifier
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    """
+    Toy classifier: mean R/G/B of the crop -> 2 logits, "fire" when
+    red dominates blue.
+    """
+    weights = numpy_helper.from_array(
+        np.array([[-4, 4], [0, 0], [4, -4]], np.float32), "W"
+    )
+    nodes = [
+        helper.make_node("ReduceMean", ["x"], ["m"], axes=[2, 3], keepdims=0),
+        helper.make_node("MatMul", ["m", "W"], ["y"])
+    ]
+    graph = helper.make_graph(
+        nodes, "toy",
+        [helper.make_tensor_value_info("x", TensorProto.FLOAT, ["N", 3, 64, 64])],
+        [helper.make_tensor_value_info("y", TensorProto.FLOAT, ["N", 2])],
+        [weights]
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+
+    path = str(tmp_path / "toy.onnx")
+    onnx.save(model, path)
+    return path
+
+
+def _fire_frame():
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    frame[100:150, 100:150] = (0, 128, 255)  # orange (BGR)
+    return frame
+
+
+def test_lookup_never_verified(model_path):
+    verifier = OnnxVerifier(model_path)
+    assert verifier.lookup(("cam", 1), 0.0) == (None, True)
+
+
+def test_lookup_keeps_stale_verdict(model_path):
+    verifier = OnnxVerifier(model_path, recheck_interval=5.0)
+    key = ("cam", 1)
+
+    verifier.submit(key, _fire_frame(), (100, 100, 50, 50), 0.0)
+    verifier.flush()
+
+    probability, due = verifier.lookup(key, 1.0)
+    assert probability > 0.5 and not due
+
+    stale, due = verifier.lookup(key, 6.0)
+    assert stale == probability and due
+
+
+def test_recheck_does_not_drop_confirmed_track(model_path):
+    detector = FireDetector(verifier_model=model_path,
+                            verifier_kwargs={"recheck_interval": 5.0})
+    verifier = detector.verifier
+    verifier.autoflush = False  # as in MultiStreamEngine
+
+    frame = _fire_frame()
+    detector.tracker.update([(100, 100, 50, 50)], [2000.0], 0.0)
+    slots = detector.tracker.live_slots()
+    confirmed = np.ones(len(slots), dtype=bool)
+
+    # Never verified: queued, not confirmed yet
+    assert not detector._verify(frame, slots, confirmed, 0.0).any()
+    assert verifier.pending() == 1
+    verifier.flush()
+
+    assert detector._verify(frame, slots, confirmed, 1.0).all()
+    assert verifier.pending() == 0
+
+    # Past recheck_interval: re-check queued, verdict kept meanwhile
+    for timestamp in (6.0, 6.1):
+        assert detector._verify(frame, slots, confirmed, timestamp).all()
+    assert verifier.pending() == 1
+
+    verifier.flush()
+    assert detector._verify(frame, slots, confirmed, 6.2).all()
+    assert verifier.pending() == 0
@@ -0,0 +1,61 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from metrics.pipeline_metrics import PipelineMetrics, StageRecorder
+
+
+@pytest.fixture
+def metrics():
+    metrics = PipelineMetrics(buckets=(0.01, 0.1))
+    for seconds in (0.005, 0.005, 0.05, 0.5):
+        metrics.record("cam0", "detect", seconds)
+    metrics.count_frame("cam0")
+    metrics.set_gauge("cam0", "in_flight", 2)
+    return metrics
+
+
+def test_percentiles_are_bucket_bounds(metrics):
+    histogram = metrics._histograms[("cam0", "detect")]
+    assert histogram.percentile(0.5) == 0.01
+    assert histogram.percentile(0.75) == 0.1
+    assert histogram.percentile(0.95) == float("inf")
+
+
+def test_prometheus_text(metrics):
+    text = metrics.render_prometheus()
+
+    assert 'fire_stage_seconds_bucket{camera="cam0",stage="detect",le="0.01"} 2' in text
+    assert 'fire_stage_seconds_bucket{camera="cam0",stage="detect",le="0.1"} 3' in text
+    assert 'fire_stage_seconds_bucket{camera="cam0",stage="detect",le="+Inf"} 4' in text
+    assert 'fire_stage_seconds_count{camera="cam0",stage="detect"} 4' in text
+    assert 'fire_frames_total{camera="cam0"} 1' in text
+    assert 'fire_in_flight{camera="cam0"} 2' in text
+
+
+def test_summary(metrics):
+    assert metrics.summary() == "[cam0] fps=0.0 detect<=10/infms"
+
+
+def test_stage_recorder_accumulates_and_resets():
+    recorder = StageRecorder()
+    t = recorder.observe("cam0", "color", 0.0)
+    recorder.observe("cam0", "color", t)
+
+    timings = recorder.pop()
+    assert set(timings) == {"color"}
+    assert recorder.pop() == {}
+
+
+def test_http_endpoint(metrics):
+    host, port = metrics.serve(port=0)
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert b"fire_frames_total" in response.read()
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+    finally:
+        metrics.stop()
@@ -0,0 +1,79 @@
+import numpy as np
+
+from detection.region_tracker import RegionTracker
+
+
+def ids(tracker):
+    return sorted(int(tracker.ids[s]) for s in tracker.live_slots())
+
+
+def test_moving_region_keeps_its_id():
+    tracker = RegionTracker()
+    for i in range(10):
+        tracker.update([(100 + 3 * i, 100, 40, 40)], [1000.0], i * 0.1)
+
+    assert ids(tracker) == [1]
+    assert tracker.age[tracker.live_slots()[0]] == 10
+
+
+def test_nearby_blobs_form_one_region():
+    tracker = RegionTracker()
+    slots = tracker.update([(100, 100, 20, 20), (125, 100, 20, 20), (300, 300, 20, 20)],
+                           [300.0, 300.0, 300.0], 0.0)
+
+    assert slots[0] == slots[1] != slots[2]
+    assert len(tracker.live_slots()) == 2
+    areas, _, _ = tracker.window(np.array([slots[0]]), 1)
+    assert areas[0, -1] == 600.0
+
+
+def test_track_survives_short_gaps_only():
+    tracker = RegionTracker(max_misses=2)
+    tracker.update([(100, 100, 40, 40)], [1000.0], 0.0)
+
+    tracker.update([], [], 0.1)
+    tracker.update([], [], 0.2)
+    assert ids(tracker) == [1]
+
+    tracker.update([], [], 0.3)
+    assert ids(tracker) == []
+
+
+def test_growth_rate():
+    tracker = RegionTracker()
+    for i in range(20):
+        tracker.update([(100, 100, 40, 40)], [1000.0 + 100 * i], i * 0.1)
+
+    assert tracker.growth_rate(tracker.live_slots())[0] > 0
+
+
+def test_flicker_frequency():
+    tracker = RegionTracker()
+    for i in range(21):
+        # Above / below the mean on alternate frames at 10 fps: 5 Hz
+        tracker.update([(100, 100, 40, 40)], [1200.0 if i % 2 else 800.0], i * 0.1)
+
+    assert abs(tracker.flicker_frequency(tracker.live_slots())[0] - 5.0) < 0.5
+
+
+def test_full_table_never_evicts_a_matched_track():
+    tracker = RegionTracker(capacity=2)
+    boxes = [(0, 0, 20, 20), (200, 0, 20, 20)]
+    tracker.update(boxes, [400.0, 400.0], 0.0)
+
+    # Both tracks matched again; the third region gets no slot
+    slots = tracker.update(boxes + [(400, 0, 20, 20)], [400.0] * 3, 0.1)
+    assert slots[2] == -1
+    assert ids(tracker) == [1, 2]
+
+    # Once a track goes missing, its slot can be taken over
+    slots = tracker.update([boxes[0], (400, 0, 20, 20)], [400.0, 400.0], 0.2)
+    assert slots[1] >= 0
+    assert ids(tracker) == [1, 3]
+
+
+def test_reset():
+    tracker = RegionTracker()
+    tracker.update([(100, 100, 40, 40)], [1000.0], 0.0)
+    tracker.reset()
+    assert not len(tracker.live_slots())
@@ -0,0 +1,143 @@
+import glob
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from detection.backends import DetectorBackend
+from engine.stream_engine import MultiStreamEngine
+
+
+class MarkerBackend(DetectorBackend):
+    """
+    Reports one fixed box and the frame's first pixel as confidence,
+    so tests can check what the worker actually saw.
+    """
+
+    def process_frame(self, frame, timestamp):
+        return True, float(frame[0, 0, 0]) / 255, [(40, 20, 80, 60)]
+
+    def reset(self):
+        pass
+
+
+class FailingBackend(MarkerBackend):
+    def process_frame(self, frame, timestamp):
+        if frame[0, 0, 0] >= 110:
+            raise cv2.error("bad frame")
+        return super().process_frame(frame, timestamp)
+
+
+class CrashingBackend(MarkerBackend):
+    def process_frame(self, frame, timestamp):
+        os._exit(3)
+
+
+def write_video(path, count=12, size=(640, 480)):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10, size)
+    for i in range(count):
+        writer.write(np.full((size[1], size[0], 3), i * 20, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+def run_engine(path, **kwargs):
+    results = []
+    ended = threading.Event()
+
+    engine = MultiStreamEngine(
+        num_workers=1,
+        timestamp_mode="source",
+        on_result=lambda *result: results.append(result),
+        on_stream_end=lambda stream_id: ended.set(),
+        **kwargs
+    )
+    engine.add_stream("cam0", "Local Video", path, backend="test_stream_engine:MarkerBackend")
+    assert ended.wait(30)
+
+    # Results still in flight when the file ended
+    while len(results) < 12 and engine.streams["cam0"].pending:
+        threading.Event().wait(0.05)
+    engine.stop()
+    return results
+
+
+@pytest.fixture
+def video(tmp_path):
+    return write_video(tmp_path / "clip.avi")
+
+
+def test_frames_reach_workers_through_shared_memory(video):
+    before = set(glob.glob("/dev/shm/psm_*"))
+    results = run_engine(video)
+
+    assert len(results) == 12
+    # First pixel seen by the worker follows the source (MJPG is lossy)
+    seen = [confidence * 255 for _, _, _, _, confidence, _ in results]
+    assert all(abs(value - i * 20) <= 4 for i, value in enumerate(seen))
+
+    # Blocks are unlinked once the stream is removed
+    assert set(glob.glob("/dev/shm/psm_*")) <= before
+
+
+def test_preview_frames_and_scaled_boxes(video):
+    results = run_engine(video, preview_size=(320, 240))
+
+    _, frame, _, _, _, boxes = results[0]
+    assert frame.shape == (240, 320, 3)
+    assert boxes == [(20, 10, 40, 30)]
+
+
+def test_no_frames_without_ui(video):
+    results = run_engine(video, keep_frames=False)
+
+    assert len(results) == 12
+    assert all(frame is None for _, frame, _, _, _, _ in results)
+    assert results[0][5] == [(40, 20, 80, 60)]
+
+
+def run_failing(video, backend, num_workers):
+    results, errors, ended = [], [], []
+
+    engine = MultiStreamEngine(
+        num_workers=num_workers,
+        timestamp_mode="source",
+        on_result=lambda stream_id, *rest: results.append(stream_id),
+        on_stream_end=ended.append,
+        on_stream_error=lambda stream_id, message: errors.append((stream_id, message))
+    )
+    try:
+        engine.add_stream("good", "Local Video", video, backend="test_stream_engine:MarkerBackend")
+        engine.add_stream("bad", "Local Video", video, backend=f"test_stream_engine:{backend}")
+
+        deadline = time.monotonic() + 30
+        while engine.active_streams() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not engine.active_streams()
+        assert "bad" not in engine.streams
+    finally:
+        engine.stop()
+
+    return results, errors, ended
+
+
+def test_backend_error_ends_only_its_stream(video):
+    # Both streams share the one worker
+    results, errors, ended = run_failing(video, "FailingBackend", num_workers=1)
+
+    assert [stream_id for stream_id, _ in errors] == ["bad"]
+    assert "bad frame" in errors[0][1]
+    assert set(ended) == {"good", "bad"}
+    assert results.count("good") == 12
+    assert results.count("bad") == 6
+
+
+def test_dead_worker_ends_its_streams(video):
+    results, errors, ended = run_failing(video, "CrashingBackend", num_workers=2)
+
+    assert errors == [("bad", "detector worker exited (code 3)")]
+    assert set(ended) == {"good", "bad"}
+    assert results.count("good") == 12
@@ -0,0 +1,115 @@
+import functools
+import http.server
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+import yt_dlp
+
+from video_input import video_stream
+from video_input.video_stream import VideoInput
+
+
+def write_video(path, count=30, size=(160, 120)):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30, size)
+    for i in range(count):
+        writer.write(np.full((size[1], size[0], 3), i * 4, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+class FakeYoutubeDL:
+    """
+    yt_dlp.YoutubeDL stand-in: resolves every page URL to `info`
+    and fails the test if anything is downloaded.
+    """
+
+    info = {}
+
+    def __init__(self, opts):
+        self.opts = opts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def extract_info(self, url, download=True):
+        assert not download
+        if self.info is None:
+            raise yt_dlp.utils.DownloadError("unsupported URL")
+        return self.info
+
+    def download(self, urls):
+        raise AssertionError("URL sources must not be downloaded")
+
+
+@pytest.fixture
+def fake_ydl(monkeypatch):
+    monkeypatch.setattr(video_stream.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+    return FakeYoutubeDL
+
+
+@pytest.fixture
+def media_server(tmp_path):
+    write_video(tmp_path / "clip.avi")
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=str(tmp_path))
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/clip.avi"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("info, expected", [
+    ({"url": "https://cdn/direct.mp4"}, "https://cdn/direct.mp4"),
+    ({"requested_formats": [{"url": "https://cdn/video.mp4", "vcodec": "avc1"},
+                            {"url": "https://cdn/audio.m4a", "vcodec": "none"}]}, "https://cdn/video.mp4"),
+    (None, "https://example.com/page"),
+])
+def test_resolve_stream_url(fake_ydl, info, expected):
+    fake_ydl.info = info
+    assert VideoInput("URL", "x")._resolve_stream_url("https://example.com/page") == expected
+
+
+def test_url_source_streams_without_download(fake_ydl, media_server):
+    fake_ydl.info = {"url": media_server}
+    video_input = VideoInput("URL", "https://example.com/watch?v=clip", width=160, height=120)
+    video_input.start()
+    try:
+        frames = []
+        while True:
+            frame, _ = video_input.read()
+            if frame is None:
+                break
+            frames.append(frame)
+    finally:
+        video_input.stop()
+
+    assert video_input.video_path is None
+    assert len(frames) == 30
+
+
+def test_threaded_capture_returns_latest_frame(tmp_path):
+    path = write_video(tmp_path / "clip.avi", count=60)
+    video_input = VideoInput("Local Video", path, width=160, height=120, threaded=True, buffer_size=3)
+    video_input.start()
+    try:
+        # Slow consumer: the grabber keeps overwriting older frames
+        time.sleep(0.5)
+        frame, _ = video_input.read()
+        while True:
+            latest, _ = video_input.read()
+            if latest is None:
+                break
+            frame = latest
+    finally:
+        video_input.stop()
+
+    assert abs(int(frame[0, 0, 0]) - 59 * 4) <= 3
+    assert video_input.frames_dropped > 0
+    assert video_input.frames_captured == video_input.frames_processed + video_input.frames_dropped